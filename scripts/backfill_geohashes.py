@@ -0,0 +1,69 @@
+"""Fill the geohash columns of the requests created before they existed.
+
+Radius searches only find requests through their geohash cells, and the columns are only
+computed on insert: rows inserted before them have NULL geohashes. Rows are read by
+request_id order, and each batch is updated in its own transaction (one modified row per
+request, under DSQL's 3,000 rows per transaction). Running it again only fills what is still
+missing. Database is configured by the environment, as for the API (.env when RUN_ENV=local).
+
+Usage: python scripts/backfill_geohashes.py [--batch-size 1000]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import bindparam, select, update
+
+from src.db.session import get_db_session
+from src.lib.geo import encode_geohash
+from src.models.request import REQUEST_SUBTYPES
+
+
+def main() -> int:
+    """Fill the NULL geohashes of every point column, by batches."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    for subtype in REQUEST_SUBTYPES.values():
+        table = subtype.__table__
+        for geohash_col in [col for col in table.columns if col.name.endswith("_geohash")]:
+            point = geohash_col.name.removesuffix("_geohash")
+            lat_col, lng_col = table.c[f"{point}_latitude"], table.c[f"{point}_longitude"]
+            statement = (
+                update(table)
+                .where(table.c.request_id == bindparam("b_request_id"))
+                .values({geohash_col.name: bindparam("b_geohash")})
+            )
+
+            filled, last_id = 0, None
+            while True:
+                with get_db_session() as db:
+                    query = select(table.c.request_id, lat_col, lng_col).where(
+                        geohash_col.is_(None),
+                    )
+                    if last_id is not None:
+                        query = query.where(table.c.request_id > last_id)
+                    batch = db.execute(
+                        query.order_by(table.c.request_id).limit(args.batch_size),
+                    ).all()
+                    if not batch:
+                        break
+                    db.connection().execute(
+                        statement,
+                        [
+                            {"b_request_id": request_id, "b_geohash": encode_geohash(lat, lng)}
+                            for request_id, lat, lng in batch
+                        ],
+                    )
+                last_id = batch[-1].request_id
+                filled += len(batch)
+                print(f"{table.name}.{geohash_col.name}: {filled} rows filled")  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Benchmark: deleting a request with many favorites on a local SQLite database.
+
+Compares the former ORM cascade (favorites loaded, then deleted one statement each) with
+the set-based deletes of RequestRepository.delete(). The old path does not release quotas,
+and its per-row DELETEs are sent as one executemany() (counted once) by the SQLite driver,
+while PostgreSQL drivers run them one round trip each.
+
+Usage: python scripts/bench_request_delete.py [--favorites 10000] [--iterations 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.update(
+    {
+        "RUN_ENV": "local",
+        "STAGE": "bench",
+        "BASE_DOMAIN": "http://localhost",
+        "DATABASE_URL": f"sqlite:///{tempfile.mkdtemp()}/bench.db",
+        "MAX_USER_CREATED_REQUESTS": "1000000",
+        "MAX_USER_CREATED_FAVORITES": "1000000",
+    },
+)
+
+from sqlalchemy import event, insert
+
+from src.db.session import get_db_session, get_engine
+from src.models import quota  # noqa: F401
+from src.models.base import Base
+from src.models.favorite import Favorite
+from src.models.request import OnlineServiceRequest, Request
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestType
+
+
+def seed(favorites: int) -> uuid.UUID:
+    """Insert a request favorited by `favorites` distinct users, return its id."""
+    request_id = uuid.uuid4()
+    now = datetime.now(UTC)
+    with get_db_session() as db:
+        db.execute(
+            insert(Request.__table__),
+            [
+                {
+                    "id": request_id,
+                    "user_id": uuid.uuid4(),
+                    "type": RequestType.ONLINE_SERVICE,
+                    "title": "popular",
+                    "created_at": now,
+                },
+            ],
+        )
+        db.execute(
+            insert(OnlineServiceRequest.__table__),
+            [{"request_id": request_id, "meetup_latitude": 36.8, "meetup_longitude": 10.1}],
+        )
+        db.execute(
+            insert(Favorite.__table__),
+            [
+                {"id": uuid.uuid4(), "user_id": uuid.uuid4(), "request_id": request_id}
+                for _ in range(favorites)
+            ],
+        )
+    return request_id
+
+
+def delete_orm_cascade(request_id: uuid.UUID) -> None:
+    """Former path: what cascade="all, delete" on Request.favorites did."""
+    with get_db_session() as db:
+        request = db.get(Request, request_id)
+        for favorite in request.favorites:
+            db.delete(favorite)
+        db.delete(request)
+
+
+def delete_set_based(request_id: uuid.UUID) -> None:
+    """Delete the request with the set-based DELETEs of RequestRepository."""
+    RequestRepository().delete(request_id)
+
+
+def timed(label: str, delete, favorites: int, iterations: int) -> None:  # noqa: ANN001
+    """Average ms and statements count of deleting a freshly seeded request."""
+    statements = []
+
+    def count(*_: object) -> None:
+        statements.append(1)
+
+    samples = []
+    for _ in range(iterations):
+        request_id = seed(favorites)
+        statements.clear()
+        event.listen(get_engine(), "before_cursor_execute", count)
+        start = time.perf_counter()
+        delete(request_id)
+        samples.append((time.perf_counter() - start) * 1000)
+        event.remove(get_engine(), "before_cursor_execute", count)
+    avg = sum(samples) / len(samples)
+    print(f"  {label:<40} {avg:9.2f} ms {len(statements):7} statements")  # noqa: T201
+
+
+def main() -> None:
+    """Seed, delete and print the timings of both deletion strategies."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--favorites", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(get_engine())
+    print(f"Request with {args.favorites} favorites, avg of {args.iterations} runs")  # noqa: T201
+    timed("old: ORM cascade", delete_orm_cascade, args.favorites, args.iterations)
+    timed("new: set-based DELETEs", delete_set_based, args.favorites, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
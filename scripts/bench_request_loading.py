@@ -0,0 +1,185 @@
+"""Benchmark: request subtype loading strategies on a seeded local SQLite database.
+
+Compares the old query shape (every subtype table LEFT JOINed, as with the former
+lazy="joined" relationships) with the type-aware loading used by RequestRepository,
+and with the Core read path (RequestRow) used by list handlers.
+
+Usage: python scripts/bench_request_loading.py [--rows 30000] [--iterations 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.update(
+    {
+        "RUN_ENV": "local",
+        "STAGE": "bench",
+        "BASE_DOMAIN": "http://localhost",
+        "DATABASE_URL": f"sqlite:///{tempfile.mkdtemp()}/bench.db",
+        "MAX_USER_CREATED_REQUESTS": "1000000",
+        "MAX_USER_CREATED_FAVORITES": "1000000",
+    },
+)
+
+from sqlalchemy import asc, insert, select
+from sqlalchemy.orm import with_polymorphic
+
+from src.db.session import get_db_session, get_engine
+from src.models import favorite, quota  # noqa: F401
+from src.models.base import Base
+from src.models.request import (
+    REQUEST_SUBTYPES,
+    BuyAndDeliverRequest,
+    OnlineServiceRequest,
+    PickupAndDeliverRequest,
+    Request,
+)
+from src.models.rows import RequestRow, request_rows_select
+from src.repositories.request_repository import _LOAD_SUBTYPES
+from src.schemas.request import RequestType
+
+PAGE_SIZE = 100
+
+
+def seed(rows: int) -> uuid.UUID:
+    """Insert `rows` requests equally split between types, return a user id owning 20."""
+    rng = random.Random(42)  # noqa: S311
+    now = datetime.now(UTC)
+    heavy_user = uuid.uuid4()
+    parents, subtypes = [], {model: [] for model in REQUEST_SUBTYPES.values()}
+    for i in range(rows):
+        r_type = list(RequestType)[i % 3]
+        request_id = uuid.uuid4()
+        parents.append(
+            {
+                "id": request_id,
+                "user_id": heavy_user if i < 20 else uuid.uuid4(),  # noqa: PLR2004
+                "type": r_type,
+                "title": f"request {i}",
+                "description": "benchmark",
+                "due_date": now + timedelta(minutes=rng.randint(0, 10**6)),
+                "created_at": now,
+            },
+        )
+        lat, lng = rng.uniform(30, 50), rng.uniform(-5, 15)
+        if r_type == RequestType.BUY_AND_DELIVER:
+            subtypes[BuyAndDeliverRequest].append(
+                {"request_id": request_id, "dropoff_latitude": lat, "dropoff_longitude": lng},
+            )
+        elif r_type == RequestType.PICKUP_AND_DELIVER:
+            subtypes[PickupAndDeliverRequest].append(
+                {
+                    "request_id": request_id,
+                    "pickup_latitude": lat,
+                    "pickup_longitude": lng,
+                    "dropoff_latitude": lng,
+                    "dropoff_longitude": lat,
+                },
+            )
+        else:
+            subtypes[OnlineServiceRequest].append(
+                {"request_id": request_id, "meetup_latitude": lat, "meetup_longitude": lng},
+            )
+
+    with get_db_session() as db:
+        db.execute(insert(Request.__table__), parents)
+        for model, values in subtypes.items():
+            db.execute(insert(model.__table__), values)
+    return heavy_user
+
+
+def load_models(db, query):  # noqa: ANN001, ANN201
+    """Load the query results as ORM models."""
+    return db.execute(query).scalars().all()
+
+
+def load_rows(db, query):  # noqa: ANN001, ANN201
+    """Load the query results as read-only RequestRow."""
+    return [RequestRow(*row) for row in db.execute(query)]
+
+
+def timed(label: str, query_factory, iterations: int, load=load_models) -> float:  # noqa: ANN001
+    """Average ms to execute and fully materialize a query (including extra SELECTs)."""
+    samples = []
+    for _ in range(iterations):
+        with get_db_session() as db:
+            start = time.perf_counter()
+            rows = load(db, query_factory())
+            for row in rows:
+                row.to_dict()
+            samples.append((time.perf_counter() - start) * 1000)
+    avg = sum(samples) / len(samples)
+    print(f"  {label:<48} {avg:8.2f} ms")  # noqa: T201
+    return avg
+
+
+def main() -> None:
+    """Seed requests and print the timings of each loading strategy."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=30_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(get_engine())
+    heavy_user = seed(args.rows)
+    all_joined = with_polymorphic(Request, "*")
+    order = (asc(Request.due_date).nulls_last(), asc(Request.created_at))
+
+    print(f"{args.rows} requests, page of {PAGE_SIZE}, avg of {args.iterations} runs")  # noqa: T201
+
+    print("Feed filtered by type (buy_and_deliver):")  # noqa: T201
+    timed(
+        "old: 3 LEFT JOINs + WHERE type",
+        lambda: select(all_joined)
+        .where(Request.type == RequestType.BUY_AND_DELIVER)
+        .order_by(*order)
+        .limit(PAGE_SIZE),
+        args.iterations,
+    )
+    timed(
+        "new: subtype model (1 INNER JOIN)",
+        lambda: select(BuyAndDeliverRequest).order_by(*order).limit(PAGE_SIZE),
+        args.iterations,
+    )
+
+    print("Feed, no filter:")  # noqa: T201
+    timed(
+        "old: 3 LEFT JOINs",
+        lambda: select(all_joined).order_by(*order).limit(PAGE_SIZE),
+        args.iterations,
+    )
+    timed(
+        "new: base + selectin per type present",
+        lambda: select(Request).options(_LOAD_SUBTYPES).order_by(*order).limit(PAGE_SIZE),
+        args.iterations,
+    )
+    timed(
+        "rows: Core SELECT, coordinates coalesced",
+        lambda: request_rows_select().order_by(*order).limit(PAGE_SIZE),
+        args.iterations,
+        load=load_rows,
+    )
+
+    print("User requests:")  # noqa: T201
+    timed(
+        "old: 3 LEFT JOINs",
+        lambda: select(all_joined).where(Request.user_id == heavy_user),
+        args.iterations,
+    )
+    timed(
+        "new: base + selectin per type present",
+        lambda: select(Request).options(_LOAD_SUBTYPES).where(Request.user_id == heavy_user),
+        args.iterations,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark: JSON serialization of a list page of requests.
+
+Compares the former path (to_dict() with str()/isoformat() per field, then stdlib
+json.dumps) with models handed to the response serializers (stdlib and orjson).
+No database needed: the page is built from in-memory models.
+
+Usage: python scripts/bench_serialization.py [--page-size 100] [--iterations 2000]
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.lib import responses
+from src.models import favorite  # noqa: F401
+from src.models.request import (
+    BuyAndDeliverRequest,
+    OnlineServiceRequest,
+    PickupAndDeliverRequest,
+    Request,
+)
+from src.schemas.request import RequestType
+
+
+def build_page(size: int) -> list[Request]:
+    """Build a page of unsaved requests, of every type in turn."""
+    now = datetime.now(UTC)
+    page = []
+    for i in range(size):
+        common = {
+            "id": uuid.uuid4(),
+            "user_id": uuid.uuid4(),
+            "title": f"Request {i}",
+            "description": "Some description of what needs to be done",
+            "due_date": now + timedelta(days=i),
+            "created_at": now - timedelta(minutes=i),
+        }
+        if i % 3 == 0:
+            page.append(
+                BuyAndDeliverRequest(
+                    type=RequestType.BUY_AND_DELIVER,
+                    dropoff_latitude=36.8,
+                    dropoff_longitude=10.18,
+                    **common,
+                ),
+            )
+        elif i % 3 == 1:
+            page.append(
+                PickupAndDeliverRequest(
+                    type=RequestType.PICKUP_AND_DELIVER,
+                    pickup_latitude=36.8,
+                    pickup_longitude=10.18,
+                    dropoff_latitude=35.8,
+                    dropoff_longitude=10.6,
+                    **common,
+                ),
+            )
+        else:
+            page.append(
+                OnlineServiceRequest(
+                    type=RequestType.ONLINE_SERVICE,
+                    meetup_latitude=36.8,
+                    meetup_longitude=10.18,
+                    **common,
+                ),
+            )
+    return page
+
+
+def former_to_dict(request: Request) -> dict:
+    """to_dict() as it was: every value converted to a string in Python."""
+    data = request.to_dict()
+    data.update(
+        {
+            "id": str(request.id),
+            "user_id": str(request.user_id),
+            "type": request.type.value,
+            "due_date": request.due_date.isoformat() if request.due_date else None,
+            "created_at": request.created_at.isoformat(),
+        },
+    )
+    return data
+
+
+def timed(label: str, serialize, iterations: int) -> float:  # noqa: ANN001
+    """Average µs to serialize the page."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        serialize()
+    avg = (time.perf_counter() - start) / iterations * 1_000_000
+    print(f"  {label:<48} {avg:10.1f} µs")  # noqa: T201
+    return avg
+
+
+def main() -> None:
+    """Print the timings of each page serialization."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    page = build_page(args.page_size)
+    pagination = {"next_cursor": "x" * 120, "has_more": True, "limit": args.page_size}
+
+    print(f"Page of {args.page_size} requests, avg of {args.iterations} runs")  # noqa: T201
+    timed(
+        "old: str()/isoformat() dicts + json.dumps",
+        lambda: json.dumps(
+            {"requests": [former_to_dict(r) for r in page], "pagination": pagination},
+        ),
+        args.iterations,
+    )
+    timed(
+        "new: models + stdlib serializer",
+        lambda: responses.stdlib_dumps({"requests": page, "pagination": pagination}),
+        args.iterations,
+    )
+    if responses.orjson is None:
+        print("  orjson not installed, skipped")  # noqa: T201
+        return
+    timed(
+        "new: models + orjson serializer",
+        lambda: responses.orjson_dumps({"requests": page, "pagination": pagination}),
+        args.iterations,
+    )
+
+
+if __name__ == "__main__":
+    main()
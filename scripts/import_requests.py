@@ -0,0 +1,58 @@
+"""Import requests of a user from a JSON Lines file (one RequestCreate object per line).
+
+Uses the same bulk path as POST /v0/requests:batchCreate: batch validation, multi-row
+INSERTs committed by chunks, user's quota enforced. Database and quotas are configured by
+the environment, as for the API (.env when RUN_ENV=local).
+
+Usage: python scripts/import_requests.py --user-id <uuid> requests.jsonl
+"""
+
+import argparse
+import json
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.repositories.request_repository import get_request_repository
+from src.schemas.request import validate_request_batch
+
+
+def main() -> int:
+    """Validate the JSON Lines file, create its valid records and report the others."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--user-id", type=uuid.UUID, required=True)
+    args = parser.parse_args()
+
+    lines = [line for line in args.path.read_text().splitlines() if line.strip()]
+    records, errors = [], []
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            records.append((line_number, json.loads(line)))
+        except json.JSONDecodeError as e:
+            errors.append((line_number, f"invalid JSON: {e}"))
+
+    valid, invalid = validate_request_batch([record for _, record in records])
+    errors += [(records[item["index"]][0], item["error"]) for item in invalid]
+
+    request_ids = get_request_repository().bulk_create(
+        user_id=args.user_id,
+        input_requests=[input_request for _, input_request in valid],
+    )
+    created = 0
+    for (index, _), request_id in zip(valid, request_ids, strict=True):
+        if request_id is None:
+            errors.append((records[index][0], "over the user's requests quota"))
+        else:
+            created += 1
+
+    for line_number, message in sorted(errors):
+        print(f"line {line_number}: {message}", file=sys.stderr)  # noqa: T201
+    print(f"{created} requests created, {len(errors)} errors")  # noqa: T201
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Add the requests created before the search index (request_terms) to it.
+
+Requests are read by id order, and those without any indexed term are indexed, committing
+by chunks that stay under DSQL's 3,000 modified rows per transaction. Then the due dates of
+requests indexed before request_terms.due_date existed are copied to their terms (searches
+skip the terms of expired requests by it). Running it again only indexes what is still
+missing. Database is configured by the environment, as for the API (.env when RUN_ENV=local).
+
+Usage: python scripts/index_requests.py [--batch-size 200]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import and_, exists, func, insert, select, update
+
+from src.db.session import get_db_session
+from src.lib.search import term_weights
+from src.models.request import Request
+from src.models.search import RequestTerm
+from src.repositories.request_repository import BULK_CREATE_MAX_ROWS
+
+
+def main() -> int:
+    """Index the missing requests, then date the terms indexed without due date."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+    index_requests(args.batch_size)
+    date_terms(args.batch_size)
+    return 0
+
+
+def index_requests(batch_size: int) -> None:
+    """Index the terms of the requests that have none."""
+    indexed, last_id = 0, None
+    while True:
+        with get_db_session() as db:
+            query = select(
+                Request.id,
+                Request.title,
+                Request.description,
+                Request.due_date,
+            ).where(
+                ~exists().where(RequestTerm.request_id == Request.id),
+            )
+            if last_id is not None:
+                query = query.where(Request.id > last_id)
+            batch = db.execute(query.order_by(Request.id).limit(batch_size)).all()
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        rows = [
+            {"request_id": request_id, "term": term, "weight": weight, "due_date": due_date}
+            for request_id, title, description, due_date in batch
+            for term, weight in term_weights(title, description).items()
+        ]
+        # A request's terms are never split between two transactions: a request without
+        # terms is still to be indexed
+        while rows:
+            end = min(len(rows), BULK_CREATE_MAX_ROWS)
+            while end < len(rows) and rows[end]["request_id"] == rows[end - 1]["request_id"]:
+                end -= 1
+            with get_db_session() as db:
+                db.execute(insert(RequestTerm.__table__).values(rows[:end]))
+            rows = rows[end:]
+        indexed += len(batch)
+        print(f"{indexed} requests indexed")  # noqa: T201
+
+
+def date_terms(batch_size: int) -> None:
+    """Copy due dates to the terms indexed without them."""
+    # Terms of a request are updated in the same transaction, transactions cut before
+    # exceeding BULK_CREATE_MAX_ROWS updated terms
+    undated = and_(RequestTerm.request_id == Request.id, RequestTerm.due_date.is_(None))
+    dated, last_id = 0, None
+    while True:
+        with get_db_session() as db:
+            query = (
+                select(Request.id, Request.due_date, func.count())
+                .join(RequestTerm, undated)
+                .where(Request.due_date.is_not(None))
+                .group_by(Request.id, Request.due_date)
+            )
+            if last_id is not None:
+                query = query.where(Request.id > last_id)
+            batch = db.execute(query.order_by(Request.id).limit(batch_size)).all()
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        while batch:
+            end, rows = 1, batch[0][2]
+            while end < len(batch) and rows + batch[end][2] <= BULK_CREATE_MAX_ROWS:
+                rows += batch[end][2]
+                end += 1
+            with get_db_session() as db:
+                for request_id, due_date, _ in batch[:end]:
+                    db.execute(
+                        update(RequestTerm)
+                        .where(RequestTerm.request_id == request_id)
+                        .values(due_date=due_date),
+                    )
+            dated += end
+            batch = batch[end:]
+        print(f"{dated} requests terms dated")  # noqa: T201
+
+
+if __name__ == "__main__":
+    sys.exit(main())
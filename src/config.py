@@ -1,35 +1,55 @@
 """Public module for application configuration."""
 
-import json
 import os
 
+from src.lib import metrics
+
 RUN_ENV = os.environ["RUN_ENV"]
 STAGE = os.environ["STAGE"]
 
 # running in cloud environment(ie deployed Lambda)
 if RUN_ENV == "cloud":
-    import boto3
+    from src.lib.secrets import SecretCache, SecretLoader, SecretsManagerBackend
 
-    client = boto3.client(
-        "secretsmanager",
-        region_name=os.environ["AWS_REGION"],
+    secret_loader = SecretLoader(
+        SecretsManagerBackend(region=os.environ["AWS_REGION"]),
+        cache=SecretCache.from_env(),
     )
-    # The secret here will be the one for the proper environment
-    secret_value = client.get_secret_value(SecretId=os.environ["DATABASE_SECRET_NAME"])
-    secret = json.loads(secret_value["SecretString"])
-
-    os.environ["DATABASE_URL"] = secret["DATABASE_URL"]
+    # The secret here will be the one for the proper environment.
+    # Fetch starts now in background (overlapping the remaining imports/init work) and is only
+    # waited for on first access of DATABASE_URL (see __getattr__ below), the wait being the
+    # invocation's secret_fetch timing
+    _database_secret = secret_loader.prefetch(os.environ["DATABASE_SECRET_NAME"])
 
 elif RUN_ENV == "local":
     # running locally / tests
     from dotenv import load_dotenv
 
     load_dotenv()
+    _database_secret = None
 else:
     exception_msg = f"RUN_ENV: {RUN_ENV} is not valid. It can only be 'cloud' or 'local'"
     raise ValueError(exception_msg)
 
 BASE_DOMAIN = os.environ["BASE_DOMAIN"]
-DATABASE_URL = os.environ["DATABASE_URL"]
 MAX_USER_CREATED_FAVORITES = int(os.environ["MAX_USER_CREATED_FAVORITES"])
 MAX_USER_CREATED_REQUESTS = int(os.environ["MAX_USER_CREATED_REQUESTS"])
+
+# In-process cache of GET /v0/requests/{request_id}: entries count, TTL of found requests
+# (bounds staleness of changes made by other containers) and of not found ones
+REQUEST_CACHE_SIZE = int(os.environ.get("REQUEST_CACHE_SIZE", "1024"))
+REQUEST_CACHE_TTL_S = float(os.environ.get("REQUEST_CACHE_TTL_S", "30"))
+REQUEST_CACHE_NEGATIVE_TTL_S = float(os.environ.get("REQUEST_CACHE_NEGATIVE_TTL_S", "5"))
+
+
+def __getattr__(name: str) -> str:
+    """Resolve DATABASE_URL lazily (PEP 562), on its first access."""
+    if name == "DATABASE_URL":
+        global DATABASE_URL  # noqa: PLW0603
+        if _database_secret is not None:
+            with metrics.timer("secret_fetch"):
+                os.environ["DATABASE_URL"] = _database_secret.result()["DATABASE_URL"]
+        DATABASE_URL = os.environ["DATABASE_URL"]
+        return DATABASE_URL
+    exception_msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(exception_msg)
@@ -0,0 +1,103 @@
+"""Retry of units of work aborted by Aurora DSQL optimistic concurrency control.
+
+DSQL takes no locks: a transaction conflicting with a concurrent one is aborted, mostly on
+commit (SQLSTATE 40001, OC000), or on any statement when the schema was changed meanwhile
+(OC001). Running the whole unit of work again usually succeeds.
+"""
+
+import os
+import random
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import ExceptionContext
+
+from src.lib import metrics
+
+T = TypeVar("T")
+
+# SQLSTATE of serialization failures, and DSQL error codes (found in the error message)
+RETRYABLE_SQLSTATES = ("40001",)
+RETRYABLE_DSQL_CODES = ("OC000", "OC001")
+
+# Attempts of a unit of work (first run included)
+MAX_ATTEMPTS = int(os.environ.get("DB_RETRY_MAX_ATTEMPTS", "5"))
+# Full jitter exponential backoff: random delay up to BASE * 2^(retry - 1), capped to MAX
+BASE_DELAY_MS = float(os.environ.get("DB_RETRY_BASE_DELAY_MS", "20"))
+MAX_DELAY_MS = float(os.environ.get("DB_RETRY_MAX_DELAY_MS", "500"))
+# Lambda time kept after the last retry, to answer before the invocation times out
+DEADLINE_MARGIN_MS = float(os.environ.get("DB_RETRY_DEADLINE_MARGIN_MS", "1000"))
+
+# Last conflict raised by the database in the current unit of work. Handlers turn exceptions
+# into error responses: this is how their caller knows a conflict caused the error.
+_last_conflict: ContextVar[BaseException | None] = ContextVar("last_conflict", default=None)
+
+
+def is_retryable(exc: BaseException | None) -> bool:
+    """Whether an error (or one it was raised from) is a DSQL concurrency conflict."""
+    while exc is not None:
+        driver_error = getattr(exc, "orig", None) or exc  # DBAPIError wraps the driver one
+        if getattr(driver_error, "sqlstate", None) in RETRYABLE_SQLSTATES:
+            return True
+        message = str(driver_error)
+        if any(f"({code})" in message for code in RETRYABLE_DSQL_CODES):
+            return True
+        exc = exc.__cause__
+    return False
+
+
+@event.listens_for(Engine, "handle_error")
+def _record_conflict(context: ExceptionContext) -> None:
+    if is_retryable(context.original_exception):
+        _last_conflict.set(context.sqlalchemy_exception or context.original_exception)
+
+
+def last_conflict() -> BaseException | None:
+    """Return the conflict raised by the database in the current attempt, if any."""
+    return _last_conflict.get()
+
+
+def retry_deadline(context: Any) -> float | None:  # noqa: ANN401
+    """Monotonic time after which no retry starts, from the Lambda remaining time.
+
+    None without a Lambda context (local runs, scripts): attempts are the only limit.
+    """
+    get_remaining_time = getattr(context, "get_remaining_time_in_millis", None)
+    if get_remaining_time is None:
+        return None
+    return time.monotonic() + (get_remaining_time() - DEADLINE_MARGIN_MS) / 1000
+
+
+def backoff_s(retry: int) -> float:
+    """Delay before the `retry`-th retry (1 for the first one)."""
+    return random.uniform(0, min(MAX_DELAY_MS, BASE_DELAY_MS * 2 ** (retry - 1))) / 1000  # noqa: S311
+
+
+def retry_conflicts(attempt: Callable[[], T], deadline: float | None = None) -> T:
+    """Call `attempt` again while it fails on a concurrency conflict.
+
+    `attempt` must run a whole unit of work (the outermost get_db_session() block): a
+    conflict aborts the transaction, so nothing less can be re-run. Retries are given up
+    after MAX_ATTEMPTS attempts or when the backoff would end past `deadline`: the last
+    error is then raised. Retries are counted in the invocation metrics (db_retries).
+    """
+    retry = 0
+    while True:
+        _last_conflict.set(None)
+        try:
+            return attempt()
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+            retry += 1
+            delay = backoff_s(retry)
+            if retry >= MAX_ATTEMPTS or (
+                deadline is not None and time.monotonic() + delay > deadline
+            ):
+                metrics.incr("db_retries_exhausted")
+                raise
+        metrics.incr("db_retries")
+        time.sleep(delay)
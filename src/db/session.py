@@ -2,15 +2,20 @@
 
 import os
 from contextlib import contextmanager
+from contextvars import ContextVar
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.engine.url import make_url
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.config import DATABASE_URL
+from src import config
+from src.db.tokens import DSQL_TOKEN_TTL_S, DsqlTokenCache
+from src.lib import metrics
+from src.lib.concurrency import run_in_background
 
 
-def _generate_dsql_token(client, hostname, region, db_role):
+def _generate_dsql_token(client, hostname, region, db_role, expires_in=DSQL_TOKEN_TTL_S):
     """Generate IAM token for Aurora DSQL connection.
 
     AWS provides two separate API methods:
@@ -21,64 +26,143 @@ def _generate_dsql_token(client, hostname, region, db_role):
     The database role is NOT passed to token generation - it's in the connection URL username.
     """
     if db_role == "admin":
-        return client.generate_db_connect_admin_auth_token(hostname, region)
+        return client.generate_db_connect_admin_auth_token(hostname, region, expires_in)
     else:
         # For custom roles like app_user, use generate_db_connect_auth_token
         # The role name is specified in the connection URL (username), not here
-        return client.generate_db_connect_auth_token(hostname, region)
+        return client.generate_db_connect_auth_token(hostname, region, expires_in)
 
 
-# For Aurora DSQL, we need to refresh IAM tokens on each connection
-if "auroradsql" in DATABASE_URL:
-    import boto3
+def _create_dsql_client():  # noqa: ANN202
+    import boto3  # noqa: PLC0415
 
-    # Parse the connection URL once
-    _url = make_url(DATABASE_URL)
-    _hostname = _url.host
-    _region = os.environ["AWS_REGION"]
-    _db_role = _url.username  # Extract role from DATABASE_URL (admin or app_user)
-    _dsql_client = boto3.client("dsql", region_name=_region)
+    return boto3.client("dsql", region_name=os.environ["AWS_REGION"])
 
-    # Generate initial token
-    _initial_token = _generate_dsql_token(_dsql_client, _hostname, _region, _db_role)
-    _auth_url = _url.set(password=_initial_token)
 
-    engine = create_engine(
-        _auth_url,
-        connect_args={"sslmode": "require"},
-        pool_pre_ping=True,
-        pool_recycle=600,  # Recycle connections after 10 minutes (tokens expire in 15)
-    )
+# In cloud (Aurora DSQL), build the boto3 client in background while the database secret is
+# being fetched (see src/config.py): both are slow and independent of each other.
+_dsql_client_future = run_in_background(_create_dsql_client) if config.RUN_ENV == "cloud" else None
+
+# Exposes hits/misses/refreshes counters through .stats() (Aurora DSQL only)
+dsql_token_cache: DsqlTokenCache | None = None
+
+
+def _create_engine() -> Engine:
+    """Create the application engine for the configured DATABASE_URL."""
+    database_url = config.DATABASE_URL  # Waits for the secret in cloud
+
+    # For Aurora DSQL, we need to refresh IAM tokens on each connection
+    if "auroradsql" in database_url:
+        # Parse the connection URL once
+        url = make_url(database_url)
+        hostname = url.host
+        region = os.environ["AWS_REGION"]
+        db_role = url.username  # Extract role from DATABASE_URL (admin or app_user)
+        if _dsql_client_future is not None:
+            dsql_client = _dsql_client_future.result()
+        else:
+            dsql_client = _create_dsql_client()
+
+        # Tokens are shared by all connections until close to their expiry
+        global dsql_token_cache  # noqa: PLW0603
+        dsql_token_cache = DsqlTokenCache(
+            lambda *args: _generate_dsql_token(dsql_client, *args),
+        )
+
+        # Generate initial token
+        initial_token = dsql_token_cache.get(hostname, region, db_role)
+        auth_url = url.set(password=initial_token)
 
-    # Refresh token on each checkout from pool
-    @event.listens_for(engine, "do_connect")
-    def receive_do_connect(dialect, conn_rec, cargs, cparams):
-        """Generate fresh IAM token for each new connection."""
-        token = _generate_dsql_token(_dsql_client, _hostname, _region, _db_role)
-        cparams["password"] = token
+        dsql_engine = create_engine(
+            auth_url,
+            connect_args={"sslmode": "require"},
+            pool_pre_ping=True,
+            pool_recycle=600,  # Recycle connections after 10 minutes (tokens expire in 15)
+        )
+
+        # Set a valid token on each new physical connection
+        @event.listens_for(dsql_engine, "do_connect")
+        def receive_do_connect(dialect, conn_rec, cargs, cparams):  # noqa
+            """Set a cached (or freshly generated when close to expiry) IAM token."""
+            cparams["password"] = dsql_token_cache.get(hostname, region, db_role)
+
+        return dsql_engine
 
-else:
     # Non-DSQL databases (SQLite for local dev)
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    return create_engine(
+        database_url,
+        connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
         pool_pre_ping=True,
     )
 
-SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+_engine: Engine | None = None
+
+
+def get_engine() -> Engine:
+    """Return the application engine, creating it on first use.
+
+    Engine creation (and for DSQL, boto3 client + IAM token) is deferred until a route
+    actually needs the database, so routes like /health do not pay for it on cold start.
+    Its time is the invocation's db_init timing, the wait for the database secret included
+    (also timed on its own as secret_fetch, see src/config.py).
+    """
+    global _engine  # noqa: PLW0603
+    if _engine is None:
+        with metrics.timer("db_init"):
+            _engine = _create_engine()
+    return _engine
+
+
+# Bound to the engine lazily, on session creation
+SessionLocal = sessionmaker(expire_on_commit=False)
+
+
+# Session of the unit of work in progress (i.e the outermost get_db_session() block)
+_current_session: ContextVar[Session | None] = ContextVar("current_session", default=None)
 
 
 # NOTE: Aurora DSQL handles connection pooling automatically (no proxy needed)
-# IAM auth tokens auto-refresh via the do_connect event listener above
+# IAM auth tokens are set via the do_connect event listener above, from DsqlTokenCache
 # In case I go back to RDS, I need to use RDS proxy for connections pooling
 @contextmanager
 def get_db_session():  # noqa
-    session = SessionLocal()
+    """Open a unit of work, or join the one already in progress.
+
+    The outermost block owns the session: it commits on normal exit, rolls back on exception
+    and closes it. Nested blocks (e.g repository calls made inside a handler decorated with
+    @transactional) reuse the same session and transaction, so one API call is one pool
+    checkout and one commit, and objects already loaded are reused from the identity map.
+    Commit (where DSQL checks for conflicts) and rollback time is the db_commit timing.
+    """
+    session = _current_session.get()
+    if session is not None:
+        yield session
+        return
+
+    session = SessionLocal(bind=get_engine())
+    token = _current_session.set(session)
     try:
         yield session
-        session.commit()
+        with metrics.timer("db_commit"):
+            session.commit()
     except Exception:
-        session.rollback()
+        with metrics.timer("db_commit"):
+            session.rollback()
         raise
     finally:
+        _current_session.reset(token)
         session.close()
+
+
+def in_unit_of_work() -> bool:
+    """Whether a get_db_session() block is in progress (nested blocks join its transaction)."""
+    return _current_session.get() is not None
+
+
+def dialect_insert(db: Session):  # noqa: ANN201
+    """Dialect specific insert() of the session database, supporting ON CONFLICT clauses.
+
+    Aurora DSQL is PostgreSQL compatible, SQLite (local/tests) has the same upsert syntax.
+    """
+    return sqlite.insert if db.get_bind().dialect.name == "sqlite" else postgresql.insert
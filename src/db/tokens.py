@@ -0,0 +1,99 @@
+"""Aurora DSQL IAM auth tokens cache.
+
+Token generation is a SigV4 presign: no network call, but it costs CPU (and the 256MB
+Lambda is CPU starved). A token is only checked when a connection is opened, so one token can
+be shared by every connection opened before its expiry.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.lib.concurrency import run_in_background
+
+DSQL_TOKEN_TTL_S = 900  # AWS default and what we request (15 minutes)
+DSQL_TOKEN_REFRESH_AHEAD_S = 180  # Refresh in background when less than this is left
+DSQL_TOKEN_MIN_VALIDITY_S = 30  # Never hand out a token expiring sooner than this
+
+TokenKey = tuple[str, str, str]  # (hostname, region, db_role)
+
+
+@dataclass
+class _CachedToken:
+    token: str
+    expires_at: float
+    refreshing: bool = False
+
+
+class DsqlTokenCache:
+    """Expiry-aware cache of DSQL tokens keyed by (hostname, region, db_role)."""
+
+    def __init__(
+        self,
+        generate: Callable[[str, str, str, int], str],
+        ttl_s: int = DSQL_TOKEN_TTL_S,
+        refresh_ahead_s: int = DSQL_TOKEN_REFRESH_AHEAD_S,
+        min_validity_s: int = DSQL_TOKEN_MIN_VALIDITY_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Cache tokens made by generate(hostname, region, db_role, expires_in)."""
+        self._generate = generate
+        self.ttl_s = ttl_s
+        self.refresh_ahead_s = refresh_ahead_s
+        self.min_validity_s = min_validity_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens: dict[TokenKey, _CachedToken] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def get(self, hostname: str, region: str, db_role: str) -> str:
+        """Return a token valid for at least `min_validity_s` seconds."""
+        key = (hostname, region, db_role)
+        now = self._clock()
+
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is not None and now < cached.expires_at - self.min_validity_s:
+                self.hits += 1
+                if now >= cached.expires_at - self.refresh_ahead_s and not cached.refreshing:
+                    cached.refreshing = True
+                    run_in_background(self._refresh, key)
+                return cached.token
+            self.misses += 1
+
+        return self._store(key)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+            }
+
+    def _store(self, key: TokenKey, *, refresh: bool = False) -> str:
+        # Expiry counted from before signing, so it can only be early, never late
+        issued_at = self._clock()
+        token = self._generate(*key, self.ttl_s)
+        with self._lock:
+            self._tokens[key] = _CachedToken(token=token, expires_at=issued_at + self.ttl_s)
+            # Counted with the swap, so that stats() never sees one without the other
+            if refresh:
+                self.refreshes += 1
+        return token
+
+    def _refresh(self, key: TokenKey) -> None:
+        try:
+            self._store(key, refresh=True)
+        except Exception:  # noqa: BLE001 - next get() falls back to a synchronous generation
+            with self._lock:
+                self.refresh_failures += 1
+                cached = self._tokens.get(key)
+                if cached is not None:
+                    cached.refreshing = False
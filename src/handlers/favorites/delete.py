@@ -3,9 +3,11 @@
 from uuid import UUID
 
 from src.lib.responses import error, success
+from src.lib.transactions import transactional
 from src.repositories.favorite_repository import get_favorite_repository
 
 
+@transactional
 def delete_favorite(event, _):  # noqa
     favorite_repo = get_favorite_repository()
     try:
@@ -27,7 +29,7 @@ def delete_favorite(event, _):  # noqa
         if favorite.user_id != user_id:
             return error("Forbidden: you can only delete your own favorites", status_code=403)
 
-        favorite_repo.delete(favorite_id=favorite_id)
+        favorite_repo.delete(favorite_id=favorite_id, favorite=favorite)
 
         return success(
             {
@@ -14,11 +14,19 @@ def list_user_favorites(event, _):  # noqa
         claims = event["requestContext"]["authorizer"]["jwt"]["claims"]
         user_id = UUID(claims["sub"])
 
-        favorites = favorite_repo.list_user_favorites(user_id=user_id)
+        # include=request embeds the favorited requests (saves one GET per favorite)
+        query_params = event.get("queryStringParameters") or {}
+        include_request = "request" in query_params.get("include", "").split(",")
+
+        favorites = favorite_repo.list_user_favorites(
+            user_id=user_id,
+            include_request=include_request,
+            as_rows=True,
+        )
         return success(
             {
-                "favorites": [fav.to_dict() for fav in favorites],
-                "user_id": str(user_id),
+                "favorites": [fav.to_dict(include_request=include_request) for fav in favorites],
+                "user_id": user_id,
                 "total": len(favorites),
             }
         )
@@ -3,7 +3,10 @@
 import json
 from typing import Any
 
+from src.handlers.router import router
 
+
+@router.route("GET", "/health")
 def health_check(event, context) -> dict[str, Any]:  # noqa: ANN001, ARG001
     """Check Lambda Functions Dummy."""
     # TODO: Change this to real health check
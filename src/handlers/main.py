@@ -1,84 +1,185 @@
 """Centralized Lambda handler - routes all requests to appropriate handlers."""
 
-import json
-import re
 import time
 
-from src.handlers.health.check import health_check
-from src.handlers.requests.list import list_requests
-from src.handlers.requests.create import create_request
-from src.handlers.requests.get import get_request
-from src.handlers.requests.delete import delete_request
-from src.handlers.requests.update import update_request
-from src.handlers.requests.list_user_requests import list_user_requests
-from src.handlers.favorites.create import create_favorite
-from src.handlers.favorites.delete import delete_favorite
-from src.handlers.favorites.list import list_user_favorites
-from src.lib.responses import error
+# Container init (cold start) is timed from the import of this module, the Lambda entry point
+_init_start = time.perf_counter()
 
+import json  # noqa: E402
+import os  # noqa: E402
 
-# Routes: (method, path_pattern, handler)
+from src.handlers.health import check  # noqa: E402, F401 - registers its routes with @router.route
+from src.handlers.router import LazyHandler, router  # noqa: E402
+from src.lib import metrics  # noqa: E402
+from src.lib.compression import compress_response  # noqa: E402
+from src.lib.rate_limit import (  # noqa: E402
+    DynamoDBBucketBackend,
+    InMemoryBucketBackend,
+    RateLimit,
+    RateLimiter,
+)
+from src.lib.responses import error, too_many_requests  # noqa: E402
+
+# Routes: (method, path_pattern, "module:handler")
+# NOTE: Handlers are referenced by import path and only imported on the first hit of their
+# route. Importing them all at load time (as @router.route decorators would require) pulls
+# SQLAlchemy, models, pydantic, boto3 (and DB init) into every cold start.
+# Lightweight handlers can instead be declared in their module with @router.route.
 ROUTES = [
-    # Health
-    ("GET", "/health", health_check),
     # Requests
-    ("GET", "/v0/requests", list_requests),
-    ("POST", "/v0/requests", create_request),
-    ("GET", "/v0/requests/{request_id}", get_request),
-    ("DELETE", "/v0/requests/{request_id}", delete_request),
-    ("PATCH", "/v0/requests/{request_id}", update_request),
-    ("GET", "/v0/users/{user_id}/requests", list_user_requests),
+    ("GET", "/v0/requests", "src.handlers.requests.list:list_requests"),
+    ("POST", "/v0/requests", "src.handlers.requests.create:create_request"),
+    ("GET", "/v0/requests/{request_id}", "src.handlers.requests.get:get_request"),
+    ("POST", "/v0/requests:batchGet", "src.handlers.requests.batch_get:batch_get_requests"),
+    (
+        "POST",
+        "/v0/requests:batchCreate",
+        "src.handlers.requests.batch_create:batch_create_requests",
+    ),
+    ("DELETE", "/v0/requests/{request_id}", "src.handlers.requests.delete:delete_request"),
+    ("PATCH", "/v0/requests/{request_id}", "src.handlers.requests.update:update_request"),
+    (
+        "GET",
+        "/v0/users/{user_id}/requests",
+        "src.handlers.requests.list_user_requests:list_user_requests",
+    ),
     # Favorites
-    ("POST", "/v0/favorites", create_favorite),
-    ("DELETE", "/v0/favorites/{favorite_id}", delete_favorite),
-    ("GET", "/v0/favorites", list_user_favorites),
+    ("POST", "/v0/favorites", "src.handlers.favorites.create:create_favorite"),
+    ("DELETE", "/v0/favorites/{favorite_id}", "src.handlers.favorites.delete:delete_favorite"),
+    ("GET", "/v0/favorites", "src.handlers.favorites.list:list_user_favorites"),
 ]
 
+for _method, _path, _target in ROUTES:
+    router.add(_method, _path, _target)
 
-def _path_to_regex(path: str) -> re.Pattern:
-    """Convert path pattern like /v0/requests/{request_id} to regex."""
-    pattern = re.escape(path)
-    pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", pattern)
-    return re.compile(f"^{pattern}$")
+# Handlers imported during init (comma separated names, e.g "list_requests,get_request").
+# Lambda init runs with boosted CPU, so warming the hottest routes there is cheaper than on
+# their first invocation.
+WARM_ROUTES = [name for name in os.environ.get("WARM_ROUTES", "").split(",") if name]
 
+# Import time above which the route is flagged in the log line (cold start budget)
+ROUTE_IMPORT_BUDGET_MS = float(os.environ.get("ROUTE_IMPORT_BUDGET_MS", "250"))
 
-# Pre-compile route patterns at module load time
-COMPILED_ROUTES = [
-    (method, _path_to_regex(path), route_handler)
-    for method, path, route_handler in ROUTES
-]
+# Response bodies smaller than this are sent uncompressed (not worth the CPU)
+COMPRESSION_MIN_BYTES = int(os.environ.get("COMPRESSION_MIN_BYTES", "1024"))
+
+# CloudWatch namespace of the metrics embedded in the log line (Embedded Metric Format)
+METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "nwassik")
+# Dimensions of the per invocation timings
+METRICS_DIMENSIONS = ("route", "status", "cold_start")
+
+# Per client (Cognito sub, source IP when anonymous) token buckets, by route class.
+# RATE_LIMIT_<CLASS>_PER_S / _BURST, 0 disables the class. Buckets are shared by containers
+# through the RATE_LIMIT_TABLE DynamoDB table (per container buckets without it).
+RATE_LIMITS = {
+    "reads": RateLimit.from_env("READS", per_s="20", burst="100"),
+    "writes": RateLimit.from_env("WRITES", per_s="2", burst="20"),
+}
+# Routes counted as reads despite their method
+READ_ROUTES = {"batch_get_requests"}
+# Routes never limited
+UNLIMITED_ROUTES = {"health_check"}
+
+RATE_LIMIT_TABLE = os.environ.get("RATE_LIMIT_TABLE")
+rate_limiter = RateLimiter(
+    DynamoDBBucketBackend(RATE_LIMIT_TABLE, region=os.environ.get("AWS_REGION"))
+    if RATE_LIMIT_TABLE
+    else InMemoryBucketBackend(),
+    RATE_LIMITS,
+)
+
+
+def _rate_limit_client(event: dict) -> str:
+    request_context = event["requestContext"]
+    claims = (request_context.get("authorizer") or {}).get("jwt", {}).get("claims", {})
+    if "sub" in claims:
+        return claims["sub"]
+    return f"ip:{request_context['http'].get('sourceIp')}"
+
+
+def _rate_limit_class(method: str, route: str) -> str:
+    return "reads" if method in ("GET", "HEAD") or route in READ_ROUTES else "writes"
+
+
+for _, _, _route_handler in router.routes:
+    if isinstance(_route_handler, LazyHandler) and _route_handler.__name__ in WARM_ROUTES:
+        _route_handler.load()
+
+# Container init time (warm routes included), reported by its first invocation only
+_init_ms: float | None = (time.perf_counter() - _init_start) * 1000
 
 
 def handler(event, context):
     """Main entry point - routes to appropriate handler."""
+    global _init_ms
     start = time.perf_counter()
+    metrics.reset()
+    init_ms, _init_ms = _init_ms, None
     method = event["requestContext"]["http"]["method"]
     path = event["rawPath"]
 
     response = None
     matched_route = None
+    import_ms = 0.0
+    compression = {}
 
     try:
-        for route_method, pattern, route_handler in COMPILED_ROUTES:
-            if method == route_method:
-                match = pattern.match(path)
-                if match:
-                    matched_route = route_handler.__name__
-                    if match.groupdict():
-                        event.setdefault("pathParameters", {}).update(match.groupdict())
-                    response = route_handler(event, context)
-                    return response
-
-        response = error("Not found", status_code=404)
+        resolved = router.resolve(event)
+        if resolved is None:
+            response = error("Not found", status_code=404)
+            return response
+
+        route_handler, path_params = resolved
+        matched_route = route_handler.__name__
+        # Checked before loading the handler: rejected floods cost no import nor DB work
+        if matched_route not in UNLIMITED_ROUTES:
+            retry_after = rate_limiter.check(
+                _rate_limit_client(event),
+                _rate_limit_class(method, matched_route),
+            )
+            if retry_after is not None:
+                response = too_many_requests(retry_after)
+                return response
+        if isinstance(route_handler, LazyHandler) and not route_handler.loaded:
+            route_handler.load()
+            import_ms = route_handler.import_ms
+        # Only needed when API Gateway did not match the route itself (local runs)
+        if path_params:
+            event["pathParameters"] = {**(event.get("pathParameters") or {}), **path_params}
+        response, compression = compress_response(
+            route_handler(event, context),
+            (event.get("headers") or {}).get("accept-encoding"),
+            COMPRESSION_MIN_BYTES,
+        )
         return response
     finally:
         duration_ms = (time.perf_counter() - start) * 1000
         status = response.get("statusCode", 500) if response else 500
-        print(json.dumps({
+        log_line = {
             "request_id": context.aws_request_id,
             "app_route": matched_route or "not_found",
             "app_method": method,
             "app_path": path,
             "app_status": status,
             "app_duration_ms": round(duration_ms, 2),
-        }))
+            "app_import_ms": round(import_ms, 2),
+            "app_import_over_budget": import_ms > ROUTE_IMPORT_BUDGET_MS,
+            # Compression stats: body and sent response sizes, encoding and CPU time
+            **{f"app_{name}": value for name, value in compression.items()},
+            # Counters recorded during the invocation (e.g. app_request_cache_hits)
+            **{f"app_{name}": value for name, value in metrics.snapshot().items()},
+            # Time spent by phase (e.g. app_db_ms, app_validation_ms, app_serialization_ms)
+            **{f"app_{name}_ms": ms for name, ms in metrics.timings().items()},
+            # Metric dimensions (strings)
+            "route": matched_route or "not_found",
+            "status": str(status),
+            "cold_start": str(init_ms is not None).lower(),
+        }
+        # Every *_ms member is a metric by route, status and cold start. Init time is its own
+        # metric, without dimensions: it does not depend on the invocation.
+        emf = {METRICS_DIMENSIONS: [name for name in log_line if name.endswith("_ms")]}
+        if init_ms is not None:
+            log_line["app_init_ms"] = round(init_ms, 2)
+            emf[()] = ["app_init_ms"]
+        log_line["_aws"] = metrics.emf_metadata(METRICS_NAMESPACE, emf)
+        print(json.dumps(log_line))
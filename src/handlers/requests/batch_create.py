@@ -0,0 +1,47 @@
+"""Requests Batch Creation Handler."""
+
+import json
+from uuid import UUID
+
+from src.lib import metrics
+from src.lib.responses import error, success
+from src.models.quota import QuotaKind
+from src.repositories.quota_repository import QuotaExceededError
+from src.repositories.request_repository import get_request_repository
+from src.schemas.request import MAX_BATCH_CREATE_RECORDS, validate_request_batch
+
+
+# NOTE: not @transactional: the repository commits each chunk of inserted requests on its own
+# (DSQL transaction size limit), so a failure does not undo the chunks already created
+def batch_create_requests(event, _):  # noqa
+    request_repo = get_request_repository()
+    try:
+        # HTTP API JWT authorizer structure: requestContext.authorizer.jwt.claims
+        claims = event["requestContext"]["authorizer"]["jwt"]["claims"]
+        user_id = UUID(claims["sub"])
+
+        body = json.loads(event.get("body") or "{}")
+        records = body.get("requests")
+        if not isinstance(records, list) or not 1 <= len(records) <= MAX_BATCH_CREATE_RECORDS:
+            return error(f"'requests' must be a list of 1 to {MAX_BATCH_CREATE_RECORDS} requests")
+
+        # Invalid records are reported, the valid ones are still created
+        with metrics.timer("validation"):
+            valid, errors = validate_request_batch(records)
+        request_ids = request_repo.bulk_create(
+            user_id=user_id,
+            input_requests=[input_request for _, input_request in valid],
+        )
+
+        created = []
+        over_quota = str(QuotaExceededError(QuotaKind.REQUESTS))
+        for (index, _), request_id in zip(valid, request_ids, strict=True):
+            if request_id is None:
+                errors.append({"index": index, "error": over_quota})
+            else:
+                created.append({"index": index, "request_id": request_id})
+        errors.sort(key=lambda record_error: record_error["index"])
+
+        return success({"created": created, "errors": errors})
+    except Exception as e:
+        return error(str(e))
@@ -0,0 +1,23 @@
+"""Requests Batch Get Handler."""
+
+import json
+
+from src.lib import metrics
+from src.lib.responses import error, success
+from src.repositories.request_repository import get_request_repository
+from src.schemas.request import RequestBatchGet
+
+
+def batch_get_requests(event, _):  # noqa
+    request_repo = get_request_repository()
+    try:
+        body = json.loads(event.get("body") or "{}")
+        with metrics.timer("validation"):
+            batch: RequestBatchGet = RequestBatchGet.model_validate(body)
+
+        # Read only: one query for the ids not in the container's cache
+        requests, missing_ids = request_repo.get_many(batch.ids)
+
+        return success({"requests": requests, "missing_ids": missing_ids})
+    except Exception as e:
+        return error(str(e))
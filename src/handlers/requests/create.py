@@ -3,12 +3,15 @@
 import json
 from uuid import UUID
 
-from src.config import BASE_DOMAIN, MAX_USER_CREATED_REQUESTS
+from src.config import BASE_DOMAIN
+from src.lib import metrics
 from src.lib.responses import error, success
+from src.lib.transactions import transactional
 from src.repositories.request_repository import get_request_repository
 from src.schemas.request import RequestCreate
 
 
+@transactional
 def create_request(event, _):  # noqa
     request_repo = get_request_repository()
     try:
@@ -16,19 +19,17 @@ def create_request(event, _):  # noqa
         claims = event["requestContext"]["authorizer"]["jwt"]["claims"]
         user_id = UUID(claims["sub"])
 
-        # NOTE: Fail early
-        if len(request_repo.get_user_requests(user_id=user_id)) >= MAX_USER_CREATED_REQUESTS:
-            exception_msg = "Too many requests created"
-            raise Exception(exception_msg)  # noqa: TRY301
-
         body = json.loads(event.get("body", "{}"))
 
         # NOTE: Validation could have been outside of Lambda, at API Gateway level,
         # for faster error response and no Lambda execution time on schema validation failure,
         # but I need dynamic cross attributes check which is not possible in API Gateway.
         # Only static stuff is supported for now in API Gateway
-        input_request: RequestCreate = RequestCreate.model_validate(body)
+        with metrics.timer("validation"):
+            input_request: RequestCreate = RequestCreate.model_validate(body)
 
+        # NOTE: Quota (MAX_USER_CREATED_REQUESTS) is checked and counted by the repository,
+        # in the same transaction as the insert
         request = request_repo.create(
             user_id=user_id,  # already UUID from line 17
             input_request=input_request,
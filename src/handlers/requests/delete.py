@@ -3,10 +3,28 @@
 from uuid import UUID
 
 from src.lib.responses import error, success
+from src.lib.transactions import transactional
 from src.repositories.request_repository import get_request_repository
 
 
-def delete_request(event, _):  # noqa
+# NOTE: not @transactional as a whole: favorites in excess of what fits in one DSQL
+# transaction are purged first, by chunks committed on their own. The request itself is then
+# deleted in a single unit of work (_delete_request), with one commit.
+def delete_request(event, context):  # noqa
+    request_repo = get_request_repository()
+    try:
+        request_id = UUID(event.get("pathParameters", {}).get("request_id"))
+        # HTTP API JWT authorizer structure: requestContext.authorizer.jwt.claims
+        claims = event["requestContext"]["authorizer"]["jwt"]["claims"]
+        request_repo.purge_favorites(request_id, user_id=UUID(claims["sub"]))
+    except Exception as e:
+        return error(str(e))
+
+    return _delete_request(event, context)
+
+
+@transactional
+def _delete_request(event, _):  # noqa
     request_repo = get_request_repository()
     try:
         request_id = UUID(event.get("pathParameters", {}).get("request_id"))
@@ -29,7 +47,7 @@ def delete_request(event, _):  # noqa
         if request.user_id != user_id:
             return error("Forbidden: you can only delete your own requests", status_code=403)
 
-        request_repo.delete(request_id=request_id)
+        request_repo.delete(request_id=request_id, request=request)
 
         return success(
             data={
@@ -2,7 +2,8 @@
 
 from uuid import UUID
 
-from src.lib.responses import error, success
+from src.lib.etags import if_none_match, make_etag, matching_etag
+from src.lib.responses import error, not_modified, success
 from src.repositories.request_repository import get_request_repository
 
 
@@ -10,11 +11,24 @@ def get_request(event, _):  # noqa
     request_repo = get_request_repository()
     try:
         request_id = UUID(event.get("pathParameters", {}).get("request_id"))
-        request = request_repo.get_by_id(request_id=request_id)
+
+        # Conditional GET: the current version is enough to tell whether the client's copy
+        # is still valid (index only lookup, the request itself is not loaded)
+        if if_none_match(event):
+            version = request_repo.get_version(request_id)
+            matched = version is not None and matching_etag(event, make_etag(request_id, version))
+            if matched:
+                return not_modified(matched)
+
+        # Read only: served from the container's cache when possible
+        request = request_repo.get_by_id_cached(request_id=request_id)
 
         if not request:
             return error("Request not found", 404)
 
-        return success({"request": request.to_dict()})
+        return success(
+            {"request": request},
+            extra_headers={"ETag": make_etag(request.id, request.version)},
+        )
     except Exception as e:
         return error(str(e))
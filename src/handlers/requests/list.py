@@ -1,7 +1,13 @@
 """Requests List Handler."""
 
-from src.lib.responses import error, success
+from src.lib import metrics
+from src.lib.etags import make_etag, matching_etag
+from src.lib.responses import error, not_modified, success
 from src.repositories.request_repository import get_request_repository
+from src.schemas.request import DueDateFilter, LocationFilter, RequestFilter
+
+LOCATION_PARAMS = ("lat", "lng", "radius_km")
+DUE_DATE_PARAMS = ("due_after", "due_before", "include_expired")
 
 
 def list_requests(event, _):  # noqa
@@ -12,21 +18,45 @@ def list_requests(event, _):  # noqa
         cursor = query_params.get("cursor")
         limit = int(query_params.get("limit", 20))
         request_type = query_params.get("type")
+        # Full text search over titles and descriptions: results by relevance
+        search = query_params.get("q")
+
+        # Geo radius filter: lat & lng required together, radius_km is optional
+        location_params = {p: query_params[p] for p in LOCATION_PARAMS if p in query_params}
+        # Due date window (ISO 8601 with timezone); expired requests are excluded by default
+        due_params = {p: query_params[p] for p in DUE_DATE_PARAMS if p in query_params}
+        with metrics.timer("validation"):
+            location = LocationFilter.model_validate(location_params) if location_params else None
+            due = DueDateFilter.model_validate(due_params)
+            filters = RequestFilter(type=request_type, location=location, search=search, due=due)
 
         # Get paginated results
         result = request_repo.list_of_requests(
-            request_type=request_type,
+            filters=filters,
             limit=limit,
             cursor=cursor,
+            as_rows=True,
         )
 
-        # Convert requests to dicts for JSON response
-        requests_data = [req.to_dict() for req in result["requests"]]
+        # The page is identified by its requests (ids + versions) and its pagination
+        pagination = result["pagination"]
+        etag = make_etag(
+            *(f"{req.id}:{req.version}" for req in result["requests"]),
+            pagination["next_cursor"],
+            pagination["limit"],
+        )
+        matched = matching_etag(event, etag)
+        if matched:
+            return not_modified(matched)
 
-        return success({
-            "requests": requests_data,
-            "pagination": result["pagination"],
-        })
+        # Models are encoded by the response serializer
+        return success(
+            {
+                "requests": result["requests"],
+                "pagination": pagination,
+            },
+            extra_headers={"ETag": etag},
+        )
 
     # TODO: need to hide backend errors to the end user, or at least send
     # a default "an error has occured", maybe identified with number
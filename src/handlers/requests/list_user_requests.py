@@ -16,11 +16,11 @@ def list_user_requests(event, _):  # noqa
         # which also the same behaviour as a user who exists but that still didnt create requests
         # Simply return an error with value 'user do not exist'. or maybe this is useless...
         user_id = UUID(event.get("pathParameters", {}).get("user_id"))
-        requests = request_repo.get_user_requests(user_id=user_id)
+        requests = request_repo.get_user_requests(user_id=user_id, as_rows=True)
         return success(
             {
-                "requests": [req.to_dict() for req in requests],
-                "user_id": str(user_id),
+                "requests": requests,
+                "user_id": user_id,
                 "total": len(requests),
             },
         )
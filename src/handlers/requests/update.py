@@ -3,11 +3,14 @@
 import json
 from uuid import UUID
 
+from src.lib import metrics
 from src.lib.responses import error, success
+from src.lib.transactions import transactional
 from src.repositories.request_repository import get_request_repository
 from src.schemas.request import RequestUpdate
 
 
+@transactional
 def update_request(event, _):  # noqa
     request_repo = get_request_repository()
     try:
@@ -25,9 +28,14 @@ def update_request(event, _):  # noqa
             return error("Not authorized to update this request", 403)
 
         body = json.loads(event.get("body", "{}"))
-        request_update: RequestUpdate = RequestUpdate.model_validate(body)
+        with metrics.timer("validation"):
+            request_update: RequestUpdate = RequestUpdate.model_validate(body)
 
-        request_repo.update(request_id=request_id, request_update=request_update)
+        request_repo.update(
+            request_id=request_id,
+            request_update=request_update,
+            request=request,
+        )
 
         # TODO:
         #   - return whether 204 or 200 with proper respective response body content
@@ -0,0 +1,157 @@
+"""HTTP router for the centralized Lambda handler.
+
+Dispatch is O(1) in the number of routes:
+- API Gateway (HTTP API) events carry the matched `routeKey` (e.g "GET /v0/requests/{request_id}")
+  and already extracted `pathParameters`, so a dict lookup is enough.
+- Other events (local runs, tests, `$default` route) are matched segment by segment against a
+  trie of path patterns, whose cost only depends on the path depth.
+"""
+
+import importlib
+import time
+from collections.abc import Callable
+from typing import Any
+
+Handler = Callable[[dict[str, Any], Any], dict[str, Any]]
+
+
+class LazyHandler:
+    """Route handler imported on first call."""
+
+    def __init__(self, target: str) -> None:
+        """Store the "module:function" import path of the handler, imported on first call."""
+        self.target = target
+        self.module_name, self.__name__ = target.split(":")
+        self._handler = None
+        self.import_ms = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self._handler is not None
+
+    def load(self) -> Handler:
+        """Import the handler module (once) and return the handler function."""
+        if self._handler is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self.module_name)
+            self._handler = getattr(module, self.__name__)
+            self.import_ms = (time.perf_counter() - start) * 1000
+        return self._handler
+
+    def __call__(self, event, context):  # noqa: ANN001, ANN204
+        return self.load()(event, context)
+
+
+class _Node:
+    """Trie node: one per path segment."""
+
+    __slots__ = ("handlers", "param_child", "param_name", "static_children")
+
+    def __init__(self) -> None:
+        self.static_children: dict[str, _Node] = {}
+        self.param_name: str | None = None
+        self.param_child: _Node | None = None
+        self.handlers: dict[str, Handler | LazyHandler] = {}
+
+
+class Router:
+    """Method + path pattern router, with lazy or eager handlers."""
+
+    def __init__(self) -> None:
+        """Create a router without routes."""
+        self.routes: list[tuple[str, str, Handler | LazyHandler]] = []
+        self._by_route_key: dict[str, Handler | LazyHandler] = {}
+        self._root = _Node()
+
+    def add(self, method: str, path: str, handler: Handler | str) -> None:
+        """Register a handler, given either as a callable or as a lazy "module:function"."""
+        if isinstance(handler, str):
+            handler = LazyHandler(handler)
+
+        route_key = f"{method} {path}"
+        if route_key in self._by_route_key:
+            exception_msg = f"Route already registered: {route_key}"
+            raise ValueError(exception_msg)
+
+        node = self._root
+        for segment in _segments(path):
+            if segment.startswith("{") and segment.endswith("}"):
+                name = segment[1:-1]
+                if node.param_child is None:
+                    node.param_name, node.param_child = name, _Node()
+                elif node.param_name != name:
+                    exception_msg = f"Conflicting path parameter {segment} in {path}"
+                    raise ValueError(exception_msg)
+                node = node.param_child
+            else:
+                node = node.static_children.setdefault(segment, _Node())
+
+        node.handlers[method] = handler
+        self._by_route_key[route_key] = handler
+        self.routes.append((method, path, handler))
+
+    def route(self, method: str, path: str) -> Callable[[Handler], Handler]:
+        """Register the decorated function as handler of `method path`."""
+
+        def decorator(fn: Handler) -> Handler:
+            self.add(method, path, fn)
+            return fn
+
+        return decorator
+
+    def resolve(
+        self,
+        event: dict[str, Any],
+    ) -> tuple[Handler | LazyHandler, dict[str, str] | None] | None:
+        """Find the handler of an event.
+
+        Returns (handler, path parameters) or None. Path parameters are None when API
+        Gateway already matched the route (and filled event["pathParameters"] itself).
+        """
+        handler = self._by_route_key.get(event.get("routeKey", ""))
+        if handler is not None:
+            return handler, None
+
+        params: dict[str, str] = {}
+        method = event["requestContext"]["http"]["method"]
+        handler = self._match(self._root, _segments(event["rawPath"]), 0, method, params)
+        if handler is None:
+            return None
+        return handler, params
+
+    def _match(
+        self,
+        node: _Node,
+        segments: list[str],
+        index: int,
+        method: str,
+        params: dict[str, str],
+    ) -> Handler | LazyHandler | None:
+        if index == len(segments):
+            return node.handlers.get(method)
+
+        segment = segments[index]
+        static_child = node.static_children.get(segment)
+        if static_child is not None:
+            found = self._match(static_child, segments, index + 1, method, params)
+            if found is not None:
+                return found
+
+        # Static segments take precedence, parameters are tried as a fallback (also when the
+        # static path has no handler for the method)
+        if node.param_child is not None and segment:
+            params[node.param_name] = segment
+            found = self._match(node.param_child, segments, index + 1, method, params)
+            if found is not None:
+                return found
+            del params[node.param_name]
+
+        return None
+
+
+def _segments(path: str) -> list[str]:
+    return path.strip("/").split("/")
+
+
+# Application router: routes are registered by src/handlers/main.py, or with @router.route
+router = Router()
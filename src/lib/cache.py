@@ -0,0 +1,81 @@
+"""In-process LRU cache with TTL.
+
+Module level instances live as long as the Lambda container: they are shared by its warm
+invocations, and never by other containers. Entries must then expire quickly enough for
+changes made through other containers to show up (the TTL bounds the staleness).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# Returned by get() on a miss (None is a valid cached value: a cached "not found")
+MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire `ttl_s` seconds after being stored.
+
+    None values (negative results) are kept `negative_ttl_s` seconds only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_s: float,
+        negative_ttl_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache of at most `maxsize` entries."""
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self.negative_ttl_s = ttl_s if negative_ttl_s is None else negative_ttl_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:  # noqa: ANN401
+        """Return the cached value, or MISSING when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return MISSING
+
+    def put(self, key: Hashable, value: Any) -> None:  # noqa: ANN401
+        """Store a value, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        ttl_s = self.negative_ttl_s if value is None else self.ttl_s
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop an entry (after the cached item was changed or deleted)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries, expired ones included until evicted."""
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
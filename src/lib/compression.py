@@ -0,0 +1,101 @@
+"""Response body compression, negotiated from the Accept-Encoding request header.
+
+HTTP API forwards Lambda bodies as they are: compressed bodies are returned base64 encoded
+(isBase64Encoded), API Gateway decodes them and the client receives the compressed bytes.
+"""
+
+import base64
+import gzip
+import time
+from typing import Any
+
+from src.lib.etags import encoded_etag
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only without it
+    brotli = None
+
+# Dynamic content levels: most of the size gain for a fraction of the max level CPU cost
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Encodings by order of preference, when the client accepts several
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str | None) -> str | None:
+    """Pick the preferred supported encoding accepted by the client (None: identity)."""
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in SUPPORTED_ENCODINGS:
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress data with the given content encoding (br or gzip)."""
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_response(
+    response: dict[str, Any],
+    accept_encoding: str | None,
+    min_bytes: int,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Compress the response body when big enough and accepted by the client.
+
+    Returns the response and its compression stats (sizes in bytes, CPU time in ms).
+    """
+    body = response.get("body")
+    headers = response.get("headers") or {}
+    if (
+        not body
+        or not isinstance(body, str)
+        or response.get("isBase64Encoded")
+        or "Content-Encoding" in headers
+    ):
+        return response, {}
+
+    raw = body.encode()
+    stats = {"body_bytes": len(raw), "response_bytes": len(raw), "content_encoding": None}
+    if len(raw) < min_bytes:
+        return response, stats
+
+    # Representation depends on Accept-Encoding from this size on (for caches)
+    headers = {**headers, "Vary": "Accept-Encoding"}
+    encoding = negotiate(accept_encoding)
+    if encoding is None:
+        return {**response, "headers": headers}, stats
+
+    cpu_start = time.process_time()
+    compressed = compress(raw, encoding)
+    stats["compression_cpu_ms"] = round((time.process_time() - cpu_start) * 1000, 3)
+    stats["response_bytes"] = len(compressed)
+    stats["content_encoding"] = encoding
+
+    headers = {**headers, "Content-Encoding": encoding}
+    if "ETag" in headers:
+        headers["ETag"] = encoded_etag(headers["ETag"], encoding)
+    return {
+        **response,
+        "headers": headers,
+        "body": base64.b64encode(compressed).decode(),
+        "isBase64Encoded": True,
+    }, stats
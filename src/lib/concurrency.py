@@ -0,0 +1,14 @@
+"""Small shared thread pool for overlapping blocking init work (network, SDK clients)."""
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+# Lambda gives little CPU at 256MB: this pool is only meant to overlap I/O bound calls
+# (Secrets Manager, boto3 client creation) with imports, not for parallel computing.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background")
+
+
+def run_in_background(fn: Callable[..., Any], *args: object, **kwargs: object) -> Future:
+    """Submit `fn` to the shared background pool and return its future."""
+    return _executor.submit(fn, *args, **kwargs)
@@ -0,0 +1,50 @@
+"""Strong ETags and If-None-Match handling for GET endpoints."""
+
+import hashlib
+from typing import Any
+
+# Bump when the JSON representation changes (e.g. new field), so that clients holding a
+# response of the former representation don't get a 304 for it
+REPRESENTATION_VERSION = "1"
+
+# Content codings of compressed bodies (see src/lib/compression.py)
+CONTENT_CODINGS = ("gzip", "br")
+
+
+def make_etag(*parts: Any) -> str:  # noqa: ANN401
+    """Strong ETag identifying the representation built from `parts` (ids, versions...)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(REPRESENTATION_VERSION.encode())
+    for part in parts:
+        digest.update(b"\x1f")
+        digest.update(str(part).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag of the `encoding` coded body: a strong ETag identifies the bytes sent."""
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def if_none_match(event: dict[str, Any]) -> list[str]:
+    """Return the ETags of the request If-None-Match header (HTTP API lowercases headers)."""
+    header = (event.get("headers") or {}).get("if-none-match")
+    if not header:
+        return []
+    # Comparison is weak for If-None-Match: W/ prefixes are ignored
+    return [tag.strip().removeprefix("W/") for tag in header.split(",")]
+
+
+def matching_etag(event: dict[str, Any], etag: str) -> str | None:
+    """Return the If-None-Match tag of the representation identified by `etag`, if any.
+
+    The client may hold the identity body or a compressed one (encoded_etag()): the tag it
+    sent is the one to send back with the 304.
+    """
+    encoded = {encoded_etag(etag, encoding) for encoding in CONTENT_CODINGS}
+    for tag in if_none_match(event):
+        if tag == "*":
+            return etag
+        if tag == etag or tag in encoded:
+            return tag
+    return None
@@ -0,0 +1,153 @@
+"""Geospatial helpers: geohash cells, bounding boxes and haversine distances.
+
+Coordinates are indexed through geohash strings so that a radius search can be
+pre-filtered in SQL with plain B-tree range scans (works the same on Aurora DSQL
+and SQLite, no PostGIS needed), then refined exactly in Python.
+"""
+
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Precision stored in DB. 9 chars is ~4.8m x 4.8m which is far more than we need
+# but allows any coarser prefix to be used at query time.
+GEOHASH_PRECISION = 9
+
+# Upper bound of cells used to cover a search area. More cells means a tighter
+# prefilter but a bigger OR in the SQL statement.
+MAX_COVERING_CELLS = 16
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Sentinel used as exclusive upper bound of a geohash prefix range: every base32
+# char sorts before "{" in ASCII/C collation.
+_PREFIX_RANGE_END = "{"
+
+
+def encode_geohash(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate into a geohash string."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # geohash interleaves bits, starting with longitude
+
+    while len(chars) < precision:
+        interval, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (interval[0] + interval[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            interval[0] = mid
+        else:
+            bits <<= 1
+            interval[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:  # noqa: PLR2004
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def geohash_prefix_range(prefix: str) -> tuple[str, str]:
+    """Return the [start, end) string range matching every geohash under a prefix."""
+    return prefix, prefix + _PREFIX_RANGE_END
+
+
+def cell_size_degrees(precision: int) -> tuple[float, float]:
+    """Return (height, width) in degrees of a geohash cell at the given precision."""
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two coordinates in kilometers."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(
+    lat: float,
+    lng: float,
+    radius_km: float,
+) -> tuple[float, float, list[tuple[float, float]]]:
+    """Compute the bounding box of a circle.
+
+    Returns (min_lat, max_lat, lng_ranges). Longitude is returned as a list of ranges
+    because a box crossing the antimeridian has to be split in two.
+    """
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat = lat - d_lat
+    max_lat = lat + d_lat
+
+    # Circle contains a pole: every longitude is possible
+    if min_lat <= -90 or max_lat >= 90:  # noqa: PLR2004
+        return max(min_lat, -90.0), min(max_lat, 90.0), [(-180.0, 180.0)]
+
+    d_lng = math.degrees(
+        math.asin(min(1.0, math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(lat)))),
+    )
+    min_lng = lng - d_lng
+    max_lng = lng + d_lng
+
+    if min_lng < -180:  # noqa: PLR2004
+        lng_ranges = [(min_lng + 360, 180.0), (-180.0, max_lng)]
+    elif max_lng > 180:  # noqa: PLR2004
+        lng_ranges = [(min_lng, 180.0), (-180.0, max_lng - 360)]
+    else:
+        lng_ranges = [(min_lng, max_lng)]
+
+    return min_lat, max_lat, lng_ranges
+
+
+def covering_cells(
+    lat: float,
+    lng: float,
+    radius_km: float,
+    max_cells: int = MAX_COVERING_CELLS,
+) -> list[str]:
+    """Return geohash prefixes whose union covers the circle's bounding box.
+
+    The finest precision needing at most `max_cells` cells is picked. An empty list
+    means the area is too large to be worth pre-filtering by cell (whole planet).
+    """
+    min_lat, max_lat, lng_ranges = bounding_box(lat, lng, radius_km)
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = cell_size_degrees(precision)
+        lat_steps = _grid_steps(min_lat, max_lat, height, -90.0)
+        lng_steps = [_grid_steps(lo, hi, width, -180.0) for lo, hi in lng_ranges]
+        n_cells = len(lat_steps) * sum(len(steps) for steps in lng_steps)
+        if n_cells > max_cells:
+            continue
+
+        cells = {
+            encode_geohash(cell_lat, cell_lng, precision)
+            for cell_lat in lat_steps
+            for steps in lng_steps
+            for cell_lng in steps
+        }
+        return sorted(cells)
+
+    return []
+
+
+def _grid_steps(low: float, high: float, step: float, origin: float) -> list[float]:
+    """Centers of grid cells (aligned on `origin`) intersecting [low, high]."""
+    first = math.floor((low - origin) / step)
+    last = math.floor((high - origin) / step)
+    upper = -origin  # 90 for latitudes, 180 for longitudes
+    centers = []
+    for i in range(first, last + 1):
+        center = origin + (i + 0.5) * step
+        if -upper < center < upper:
+            centers.append(center)
+    return centers
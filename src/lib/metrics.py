@@ -0,0 +1,99 @@
+"""Per invocation metrics, added to the handler log line (see src/handlers/main.py).
+
+A Lambda container runs one invocation at a time: module level state is that invocation's.
+
+Counters (incr) count events, timers (timer/timed) sum the time spent in a phase of the
+invocation (database, validation, serialization...). The log line is also written in
+CloudWatch Embedded Metric Format (see emf_metadata): CloudWatch extracts its timings as
+metrics from the log itself, without PutMetricData calls.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_counters: dict[str, float] = {}
+_timings: dict[str, float] = {}
+# Timers in progress: a phase nested in itself (e.g a repository calling another one) is
+# only timed by the outermost block
+_running: set[str] = set()
+
+
+def incr(name: str, value: float = 1) -> None:
+    """Add `value` to a counter of the current invocation."""
+    _counters[name] = _counters.get(name, 0) + value
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """Add the time spent in the block to the `name` timing of the current invocation."""
+    if name in _running:
+        yield
+        return
+    _running.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _running.discard(name)
+        _timings[name] = _timings.get(name, 0) + (time.perf_counter() - start) * 1000
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorate a function whose calls are timed by timer(name)."""
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            with timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def snapshot() -> dict[str, float]:
+    """Return the counters of the current invocation."""
+    return dict(_counters)
+
+
+def timings() -> dict[str, float]:
+    """Return the timings (milliseconds) of the current invocation."""
+    return {name: round(ms, 2) for name, ms in _timings.items()}
+
+
+def reset() -> None:
+    """Start a new invocation."""
+    _counters.clear()
+    _timings.clear()
+    _running.clear()
+
+
+def emf_metadata(
+    namespace: str,
+    metrics: dict[tuple[str, ...], list[str]],
+    timestamp_s: float | None = None,
+) -> dict[str, Any]:
+    """Return the `_aws` member making a JSON log line an Embedded Metric Format document.
+
+    `metrics` maps each dimension set (names of the line's dimension members) to the names
+    of the line's members extracted as millisecond metrics with those dimensions. Dimension
+    values must be strings, metric values numbers.
+    """
+    return {
+        "Timestamp": int((time.time() if timestamp_s is None else timestamp_s) * 1000),
+        "CloudWatchMetrics": [
+            {
+                "Namespace": namespace,
+                "Dimensions": [list(dimensions)],
+                "Metrics": [{"Name": name, "Unit": "Milliseconds"} for name in names],
+            }
+            for dimensions, names in metrics.items()
+            if names
+        ],
+    }
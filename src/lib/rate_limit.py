@@ -0,0 +1,197 @@
+"""Per client token bucket rate limiting.
+
+Buckets (one per client and route class) live in a backend shared by all Lambda containers:
+DynamoDB in cloud, memory locally. To avoid a backend call on every request, each container
+takes tokens from the shared bucket by leases of several tokens and spends them locally. A
+denied client is also remembered locally until its next token is due, so floods are answered
+without reaching the backend.
+"""
+
+import math
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.lib import metrics
+from src.lib.cache import MISSING, TTLCache
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Bucket of `burst` tokens, refilled at `per_s` tokens per second (one per request)."""
+
+    per_s: float
+    burst: int
+
+    @classmethod
+    def from_env(cls, name: str, per_s: str, burst: str) -> "RateLimit | None":
+        """Read RATE_LIMIT_<NAME>_PER_S and RATE_LIMIT_<NAME>_BURST (None when disabled)."""
+        limit = cls(
+            per_s=float(os.environ.get(f"RATE_LIMIT_{name}_PER_S", per_s)),
+            burst=int(os.environ.get(f"RATE_LIMIT_{name}_BURST", burst)),
+        )
+        return limit if limit.per_s > 0 and limit.burst > 0 else None
+
+
+def refill(tokens: float, updated_at: float, now: float, limit: RateLimit) -> float:
+    """Tokens of a bucket at `now`, that had `tokens` at `updated_at`."""
+    return min(limit.burst, tokens + max(0.0, now - updated_at) * limit.per_s)
+
+
+class BucketBackend(Protocol):
+    """Shared token buckets storage."""
+
+    def take(self, key: str, count: int, limit: RateLimit, now: float) -> tuple[int, float]:
+        """Take up to `count` tokens from a bucket.
+
+        Returns the number of tokens taken, and when none, the seconds until one is available.
+        """
+
+
+class InMemoryBucketBackend:
+    """Buckets of the current process, for local runs and tests."""
+
+    def __init__(self) -> None:
+        """Create a backend without buckets."""
+        self._buckets: dict[str, tuple[float, float]] = {}  # key: (tokens, updated_at)
+        self.calls = 0
+
+    def take(self, key: str, count: int, limit: RateLimit, now: float) -> tuple[int, float]:
+        self.calls += 1
+        tokens, updated_at = self._buckets.get(key, (limit.burst, now))
+        tokens = refill(tokens, updated_at, now, limit)
+        taken = min(count, math.floor(tokens))
+        self._buckets[key] = (tokens - taken, now)
+        return taken, 0.0 if taken else (1 - tokens) / limit.per_s
+
+
+class DynamoDBBucketBackend:
+    """Buckets stored as DynamoDB items: {pk, tokens, updated_at, version, expires_at}.
+
+    A bucket is read (strongly consistent), refilled and updated with a write conditional on
+    the `version` read: concurrent takes from other containers make it fail, and the take
+    is done again from the new state. Items of idle buckets expire (`expires_at` TTL).
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, table_name: str, region: str | None = None, client=None) -> None:  # noqa: ANN001
+        """Use the table, through the given client or one created on first use."""
+        self.table_name = table_name
+        self.region = region
+        self._client = client
+
+    @property
+    def client(self):  # noqa: ANN201
+        # Client created on first use: boto3 is slow to import and build (cold start)
+        if self._client is None:
+            import boto3  # noqa: PLC0415
+
+            self._client = boto3.client("dynamodb", region_name=self.region)
+        return self._client
+
+    def take(self, key: str, count: int, limit: RateLimit, now: float) -> tuple[int, float]:
+        tokens = float(limit.burst)
+        for _ in range(self.MAX_ATTEMPTS):
+            item = self.client.get_item(
+                TableName=self.table_name,
+                Key={"pk": {"S": key}},
+                ConsistentRead=True,
+            ).get("Item")
+            if item is None:
+                tokens, version = float(limit.burst), 0
+                condition, values = "attribute_not_exists(pk)", {}
+            else:
+                tokens = refill(
+                    float(item["tokens"]["N"]),
+                    float(item["updated_at"]["N"]),
+                    now,
+                    limit,
+                )
+                version = int(item["version"]["N"])
+                condition = "version = :read_version"
+                values = {":read_version": {"N": str(version)}}
+
+            taken = min(count, math.floor(tokens))
+            if taken == 0:
+                return 0, (1 - tokens) / limit.per_s
+            try:
+                self.client.update_item(
+                    TableName=self.table_name,
+                    Key={"pk": {"S": key}},
+                    UpdateExpression=(
+                        "SET tokens = :tokens, updated_at = :now, version = :version, "
+                        "expires_at = :expires_at"
+                    ),
+                    ConditionExpression=condition,
+                    ExpressionAttributeValues={
+                        ":tokens": {"N": repr(tokens - taken)},
+                        ":now": {"N": repr(now)},
+                        ":version": {"N": str(version + 1)},
+                        # Full again by then: the item is not needed anymore
+                        ":expires_at": {"N": str(math.ceil(now + limit.burst / limit.per_s))},
+                        **values,
+                    },
+                )
+            except self.client.exceptions.ConditionalCheckFailedException:
+                continue
+            return taken, 0.0
+        # Bucket heavily contended: treat as empty for now
+        return 0, 1 / limit.per_s
+
+
+class RateLimiter:
+    """Token buckets per (client, route class), with the local lease tier in front."""
+
+    def __init__(
+        self,
+        backend: BucketBackend,
+        limits: dict[str, RateLimit | None],
+        lease_fraction: float = 0.1,
+        clock: Callable[[], float] = time.time,
+        local_size: int = 4096,
+    ) -> None:
+        """Apply `limits` (None: unlimited) per route class, buckets kept in `backend`."""
+        self.backend = backend
+        self.limits = limits
+        self.lease_fraction = lease_fraction
+        self._clock = clock
+        # (client, route class): [leased tokens left, denied until]. Entries expire so that
+        # unused leases are not kept forever by idle clients.
+        self._local = TTLCache(maxsize=local_size, ttl_s=60, clock=clock)
+
+    def check(self, client: str, route_class: str) -> float | None:
+        """Spend a token of the client's bucket: None when allowed, else seconds to wait."""
+        limit = self.limits.get(route_class)
+        if limit is None:
+            return None
+        now = self._clock()
+        key = (client, route_class)
+        state = self._local.get(key)
+        if state is MISSING:
+            state = [0, 0.0]
+            self._local.put(key, state)
+
+        if state[1] > now:
+            metrics.incr("rate_limited")
+            return state[1] - now
+        if state[0] > 0:
+            state[0] -= 1
+            return None
+
+        lease = max(1, int(limit.burst * self.lease_fraction))
+        metrics.incr("rate_limit_backend_calls")
+        try:
+            with metrics.timer("rate_limit"):
+                taken, retry_after = self.backend.take(f"{route_class}#{client}", lease, limit, now)
+        except Exception:  # noqa: BLE001 - Limiting must not take the API down: let it through
+            metrics.incr("rate_limit_backend_errors")
+            return None
+        if taken == 0:
+            metrics.incr("rate_limited")
+            state[1] = now + retry_after
+            return retry_after
+        state[0] = taken - 1
+        return None
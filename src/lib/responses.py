@@ -1,7 +1,58 @@
 """Common responses."""
 
 import json
+import math
+from collections.abc import Callable
+from datetime import date
+from enum import Enum
 from typing import Any
+from uuid import UUID
+
+from src.lib import metrics
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used without it
+    orjson = None
+
+
+def _default(obj: Any) -> Any:  # noqa: ANN401
+    """Encode values JSON backends don't support natively.
+
+    Models (anything with `to_dict()`) and SQLAlchemy rows can be handed to success() as is.
+    """
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "_asdict"):
+        return obj._asdict()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, date):  # datetime included
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    exception_msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(exception_msg)
+
+
+def stdlib_dumps(data: Any) -> str:  # noqa: ANN401
+    """Serialize with the stdlib json module."""
+    return json.dumps(data, default=_default)
+
+
+def orjson_dumps(data: Any) -> str:  # noqa: ANN401
+    """Serialize with orjson: UUIDs, datetimes and enums are encoded natively (in C)."""
+    return orjson.dumps(data, default=_default).decode()
+
+
+# Serializer used for response bodies (see set_serializer)
+dumps: Callable[[Any], str] = orjson_dumps if orjson is not None else stdlib_dumps
+
+
+def set_serializer(serializer: Callable[[Any], str]) -> None:
+    """Replace the serializer used for response bodies."""
+    global dumps  # noqa: PLW0603
+    dumps = serializer
 
 
 def success(
@@ -9,14 +60,36 @@ def success(
     extra_headers: dict[str, str] | None = None,
     status_code: int = 200,
 ) -> dict[str, Any]:
-    """Wrap success object."""
+    """Wrap success object.
+
+    `data` may contain models, rows, UUIDs and datetimes: they are encoded by the serializer
+    (timed as the invocation's serialization).
+    """
+    with metrics.timer("serialization"):
+        body = dumps(data)
     return {
         "statusCode": status_code,
         "headers": {"Content-Type": "application/json", **(extra_headers or {})},
-        "body": json.dumps(data),
+        "body": body,
+    }
+
+
+def not_modified(etag: str) -> dict[str, Any]:
+    """Answer a conditional GET whose If-None-Match matched: no body."""
+    return {
+        "statusCode": 304,
+        "headers": {"ETag": etag},
+        "body": "",
     }
 
 
+def too_many_requests(retry_after_s: float) -> dict[str, Any]:
+    """Answer a rate limited request, telling when to retry (whole seconds, at least 1)."""
+    response = error("Too many requests", status_code=429)
+    response["headers"]["Retry-After"] = str(max(1, math.ceil(retry_after_s)))
+    return response
+
+
 def error(
     message: dict[str, Any],
     status_code: int = 400,
@@ -25,5 +98,5 @@ def error(
     return {
         "statusCode": status_code,
         "headers": {"Content-Type": "application/json"},
-        "body": json.dumps({"error": message}),
+        "body": dumps({"error": message}),
     }
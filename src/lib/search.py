@@ -0,0 +1,64 @@
+"""Text helpers of the requests search index: tokenization and term weights.
+
+Titles and descriptions are indexed as terms in an inverted index table (request_terms),
+maintained by RequestRepository and searched with plain B-tree lookups: it works the same
+on Aurora DSQL (no full-text extension) and SQLite.
+"""
+
+import re
+import unicodedata
+
+# Longer words are truncated (to the indexed column size)
+TERM_MAX_LENGTH = 32
+
+# Most terms of a search query used (the next ones are ignored)
+MAX_QUERY_TERMS = 8
+
+# Weight of an occurrence in the title / in the description, and cap of a term's weight in
+# a request (repeating a word does not make a request rank higher indefinitely)
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+MAX_TERM_WEIGHT = 10
+
+# Words too common to help finding a request (English and French)
+STOP_WORDS = frozenset(
+    (  # noqa: SIM905 - one string: the list stays readable
+        "a an and are as at be by for from has have in is it of on or that the this to was "
+        "were will with au aux avec ce ces dans de des du elle en est et il je la le les leur "
+        "ma mais me mes mon ne nous ou par pas pour qu que qui sa se ses son sur ta te tes ton "
+        "tu un une vos votre vous"
+    ).split(),
+)
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Casefold and strip accents/diacritics (e.g "Médicaments" -> "medicaments")."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Return the searchable terms of a text, in order (with repetitions)."""
+    if not text:
+        return []
+    return [
+        word[:TERM_MAX_LENGTH]
+        for word in _WORD.findall(normalize(text))
+        if len(word) > 1 and word not in STOP_WORDS
+    ]
+
+
+def term_weights(title: str | None, description: str | None) -> dict[str, int]:
+    """Weight of each term of a request, as stored in the index."""
+    weights: dict[str, int] = {}
+    for text, weight in ((title, TITLE_WEIGHT), (description, DESCRIPTION_WEIGHT)):
+        for term in tokenize(text):
+            weights[term] = min(MAX_TERM_WEIGHT, weights.get(term, 0) + weight)
+    return weights
+
+
+def query_terms(query: str) -> list[str]:
+    """Distinct terms of a search query, in order, at most MAX_QUERY_TERMS."""
+    return list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
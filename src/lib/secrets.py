@@ -0,0 +1,120 @@
+"""Secrets loading with a TTL'd file cache.
+
+Secrets are cached under /tmp, which survives runtime restarts within the same Lambda
+execution environment, so a re-initialized runtime does not pay a Secrets Manager round
+trip again. Cache files can be encrypted at rest by setting SECRETS_CACHE_KEY (a Fernet
+key, requires the optional `cryptography` package).
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Protocol
+
+from src.lib.concurrency import run_in_background
+
+SECRETS_CACHE_DIR = os.environ.get("SECRETS_CACHE_DIR", "/tmp")  # noqa: S108
+SECRETS_CACHE_TTL_S = int(os.environ.get("SECRETS_CACHE_TTL_S", "300"))
+
+
+class SecretsBackend(Protocol):
+    """Anything able to return a secret string from its id."""
+
+    def get_secret_string(self, secret_id: str) -> str: ...
+
+
+class SecretsManagerBackend:
+    """AWS Secrets Manager backend."""
+
+    def __init__(self, region: str) -> None:
+        """Read secrets of the region, the client being created on first use."""
+        self.region = region
+        self._client = None
+
+    def get_secret_string(self, secret_id: str) -> str:
+        # Client created on first use: it is slow to build and this typically runs in background
+        if self._client is None:
+            import boto3  # noqa: PLC0415
+
+            self._client = boto3.client("secretsmanager", region_name=self.region)
+        return self._client.get_secret_value(SecretId=secret_id)["SecretString"]
+
+
+class SecretCache:
+    """File cache of secret strings, with expiry and optional encryption."""
+
+    def __init__(
+        self,
+        directory: str | Path = SECRETS_CACHE_DIR,
+        ttl_s: int = SECRETS_CACHE_TTL_S,
+        key: str | None = None,
+    ) -> None:
+        """Cache secrets in `directory`, encrypted when given a Fernet `key`."""
+        self.directory = Path(directory)
+        self.ttl_s = ttl_s
+        self._fernet = None
+        if key:
+            try:
+                from cryptography.fernet import Fernet  # noqa: PLC0415
+            except ImportError as e:
+                exception_msg = "SECRETS_CACHE_KEY is set but 'cryptography' is not installed"
+                raise ValueError(exception_msg) from e
+            self._fernet = Fernet(key)
+
+    @classmethod
+    def from_env(cls) -> "SecretCache":
+        return cls(key=os.environ.get("SECRETS_CACHE_KEY"))
+
+    def _path(self, secret_id: str) -> Path:
+        digest = hashlib.sha256(secret_id.encode()).hexdigest()[:32]
+        return self.directory / f"secret-{digest}.json"
+
+    def get(self, secret_id: str) -> str | None:
+        """Return the cached secret string, None when missing, expired or unreadable."""
+        try:
+            entry = json.loads(self._path(secret_id).read_text())
+            if entry["expires_at"] <= time.time():
+                return None
+            value = entry["value"]
+            if self._fernet is not None:
+                value = self._fernet.decrypt(value.encode()).decode()
+        except Exception:  # noqa: BLE001 - a broken cache must never break the app
+            return None
+        return value
+
+    def put(self, secret_id: str, value: str) -> None:
+        if self._fernet is not None:
+            value = self._fernet.encrypt(value.encode()).decode()
+        path = self._path(secret_id)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"expires_at": time.time() + self.ttl_s, "value": value}, f)
+            tmp_path.replace(path)  # atomic, readers never see a partial file
+        except OSError:
+            pass  # Cache is best effort (e.g read-only filesystem)
+
+
+class SecretLoader:
+    """Load JSON secrets from a backend, through an optional cache."""
+
+    def __init__(self, backend: SecretsBackend, cache: SecretCache | None = None) -> None:
+        """Load secrets from `backend`, through `cache` when given."""
+        self.backend = backend
+        self.cache = cache
+
+    def get(self, secret_id: str) -> dict[str, Any]:
+        secret_string = self.cache.get(secret_id) if self.cache else None
+        if secret_string is None:
+            secret_string = self.backend.get_secret_string(secret_id)
+            if self.cache:
+                self.cache.put(secret_id, secret_string)
+        return json.loads(secret_string)
+
+    def prefetch(self, secret_id: str) -> Future:
+        """Start loading a secret in background, so that it overlaps other init work."""
+        return run_in_background(self.get, secret_id)
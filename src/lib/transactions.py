@@ -0,0 +1,46 @@
+"""Handler level unit of work."""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from src.db.retry import is_retryable, last_conflict, retry_conflicts, retry_deadline
+from src.db.session import get_db_session
+from src.lib.responses import error
+
+# Answer to a unit of work still conflicting after its retries: the client may retry it
+CONFLICT_MESSAGE = "Conflict with concurrent requests, please retry"
+
+
+def transactional(handler: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """Run a whole handler in a single DB session and transaction.
+
+    Repositories called by the handler join that session instead of opening their own.
+    Changes are committed once, after the handler returns a success response, and rolled
+    back when it returns an error response (handlers catch their own exceptions).
+
+    A handler whose transaction is aborted by a DSQL concurrency conflict (on commit, or on
+    a statement, then turned into an error response) is run again, with backoff, within the
+    Lambda remaining time (see src/db/retry.py). Still conflicting after that, it gets a 409.
+    """
+
+    @wraps(handler)
+    def wrapper(event, context):  # noqa: ANN001, ANN202
+        def attempt() -> dict[str, Any]:
+            with get_db_session() as session:
+                response = handler(event, context)
+                if response.get("statusCode", 500) >= 400:  # noqa: PLR2004
+                    session.rollback()
+                    conflict = last_conflict()
+                    if conflict is not None:
+                        raise conflict
+            return response
+
+        try:
+            return retry_conflicts(attempt, retry_deadline(context))
+        except Exception as e:  # Commit failure, or conflicts still failing after retries
+            if is_retryable(e):
+                return error(CONFLICT_MESSAGE, status_code=409)
+            return error(str(e))
+
+    return wrapper
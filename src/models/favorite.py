@@ -2,8 +2,9 @@
 
 import uuid
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import Column, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -15,13 +16,20 @@ class Favorite(Base):
 
     __tablename__ = "favorites"
     __allow_unmapped__ = True
-    __table_args__ = (UniqueConstraint("user_id", "request_id", name="uq_favorite_user_request"),)
+    # NOTE: the unique constraint also indexes the (user_id, request_id) existence check.
+    # request_id is indexed for cascade deletes of a request's favorites.
+    __table_args__ = (
+        UniqueConstraint("user_id", "request_id", name="uq_favorite_user_request"),
+        Index("ix_favorites_user_created", "user_id", "created_at"),
+        Index("ix_favorites_request_id", "request_id"),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     user_id = Column(GUID(), nullable=False)
     request_id = Column(
         GUID(),
-        ForeignKey("requests.id", ondelete="CASCADE"),  # NOTE: Not enforced by DSQL; handled by SQLAlchemy cascade
+        # NOTE: Not enforced by DSQL; see RequestRepository.delete
+        ForeignKey("requests.id", ondelete="CASCADE"),
         nullable=False,
     )  # TODO: Enhance this behaviour, to keep maybe only title available so that users are not
     # surprised when the request owner deletes the request. For now it just vanishes
@@ -36,12 +44,20 @@ class Favorite(Base):
     # We dont want to load complete request object with it
     request = relationship("Request", back_populates="favorites", lazy="select")
 
-    # TODO: not sure if we should return requests here, or should we let the client do a GET for
-    # how many requests there are might be too much (even though favorites number is limited)
-    def to_dict(self) -> dict[str, str]:
-        return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "request_id": str(self.request_id),
-            "created_at": self.created_at.isoformat(),
+    def to_dict(self, include_request: bool = False) -> dict[str, Any]:  # noqa: FBT001, FBT002
+        """Serialize favorite, optionally embedding its request (None when it was deleted).
+
+        Values are left as UUID/datetime for the response serializer to encode.
+
+        The request must have been loaded beforehand (see list_user_favorites), otherwise
+        each favorite triggers its own lazy load.
+        """
+        data = {
+            "id": self.id,
+            "user_id": self.user_id,
+            "request_id": self.request_id,
+            "created_at": self.created_at,
         }
+        if include_request:
+            data["request"] = self.request.to_dict() if self.request else None
+        return data
@@ -0,0 +1,30 @@
+"""User Quota SQLAlchemy Model definition."""
+
+from enum import Enum
+
+from sqlalchemy import Column, Integer, String
+
+from .base import Base
+from .types import GUID
+
+
+class QuotaKind(str, Enum):
+    """Kinds of items counted per user."""
+
+    REQUESTS = "requests"
+    FAVORITES = "favorites"
+
+
+class UserQuota(Base):
+    """Per user counter of created items, maintained in the same transaction as the items.
+
+    A single counter row (instead of a COUNT over the items) is what makes the quota check
+    race-safe on Aurora DSQL: concurrent creates of the same user all write this row, so
+    optimistic concurrency lets only one of them commit.
+    """
+
+    __tablename__ = "user_quotas"
+
+    user_id = Column(GUID(), primary_key=True)
+    kind = Column(String(20), primary_key=True)
+    used = Column(Integer, nullable=False, default=0)
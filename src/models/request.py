@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import UTC, datetime
+from typing import Any
 
 from sqlalchemy import (
     Column,
@@ -9,16 +10,29 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
+    Integer,
     String,
 )
 from sqlalchemy.orm import relationship
 
+from src.lib.geo import GEOHASH_PRECISION, encode_geohash
 from src.schemas.request import RequestType
 
 from .base import Base
 from .types import GUID
 
 
+def _geohash_default(prefix: str):  # noqa: ANN202
+    """Build a column default computing the geohash of `<prefix>_latitude/longitude`."""
+
+    def default(context) -> str:  # noqa: ANN001
+        params = context.get_current_parameters()
+        return encode_geohash(params[f"{prefix}_latitude"], params[f"{prefix}_longitude"])
+
+    return default
+
+
 # TODO: Add fragile field, item size and weight
 class Request(Base):
     """Request base Table Definition."""
@@ -38,62 +52,67 @@ class Request(Base):
     created_at: "datetime" = Column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
     )
+    # Bumped by every update: identifies the request representation (ETag)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
-    # Relationships for easy access
-    # NOTE: SQLAlchemy cascade used in place of DB-level CASCADE due to Aurora DSQL
-    # (DSQL doesn't enforce FK constraints, so deletes must be handled at app level)
-    buy_and_deliver: "BuyAndDeliverRequest" = relationship(
-        "BuyAndDeliverRequest",
-        uselist=False,
-        cascade="all, delete",
-        lazy="joined",  # ⬅️ Always eager load with JOIN
-    )
-    pickup_and_deliver: "PickupAndDeliverRequest" = relationship(
-        "PickupAndDeliverRequest",
-        uselist=False,
-        cascade="all, delete",
-        lazy="joined",
-    )
-    online_service: "OnlineServiceRequest" = relationship(
-        "OnlineServiceRequest",
-        uselist=False,
-        cascade="all, delete",
-        lazy="joined",
-    )
+    # NOTE: DSQL doesn't enforce FK constraints, so deletes must be handled at app level.
+    # RequestRepository.delete() removes favorites with set-based DELETEs: no ORM cascade
+    # (it loads then deletes favorites one by one), and the ORM never loads nor updates them
+    # on a request delete (passive_deletes="all").
     favorites = relationship(
         "Favorite",
         back_populates="request",
-        cascade="all, delete",
+        passive_deletes="all",
     )
 
-    def to_dict(self) -> dict[str, str]:
-        tmp_due_date = None
-        if self.due_date:
-            tmp_due_date = self.due_date.isoformat()
-        data = {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "type": self.type.value,
+    # Joined table inheritance: each request type is a subclass with its own table, picked
+    # from `type`. Querying a subclass joins its table only. How subtype columns are loaded when
+    # querying Request is chosen per query (see RequestRepository): selectin_polymorphic (one
+    # extra SELECT per type present in results) or with_polymorphic (LEFT JOINs).
+    __mapper_args__ = {  # noqa: RUF012
+        "polymorphic_on": "type",
+        "polymorphic_abstract": True,
+    }
+
+    # Keyset pagination indexes: they match the feed order (due_date, created_at, id) so a
+    # page is an index range scan from the cursor, whatever its depth. The per-type one also
+    # serves any `type` + `due_date` lookup (leftmost prefix).
+    __table_args__ = (
+        Index("ix_requests_feed", "due_date", "created_at", "id"),
+        Index("ix_requests_type_feed", "type", "due_date", "created_at", "id"),
+        Index("ix_requests_user_created", "user_id", "created_at"),
+        # Covering index: the version of a request is read from the index only (ETag checks)
+        Index("ix_requests_id_version", "id", "version"),
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the request fields as Python values (UUID, datetime, RequestType).
+
+        They are encoded by the response serializer (src/lib/responses.py), natively when
+        orjson is available, which is much cheaper than str()/isoformat() on each field.
+        """
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "type": self.type,
             "title": self.title,
             "description": self.description,
-            "due_date": tmp_due_date,
-            "created_at": self.created_at.isoformat(),
+            "due_date": self.due_date,
+            "created_at": self.created_at,
         }
 
-        if self.buy_and_deliver:
-            data.update(self.buy_and_deliver.to_dict())
-        elif self.pickup_and_deliver:
-            data.update(self.pickup_and_deliver.to_dict())
-        elif self.online_service:
-            data.update(self.online_service.to_dict())
-
-        return data
+    def locations(self) -> list[tuple[float, float]]:
+        """Return every (latitude, longitude) point of the request."""
+        return []
 
 
-class BuyAndDeliverRequest(Base):
+class BuyAndDeliverRequest(Request):
     """BuyAndDeliverRequest Table Definition."""
 
     __tablename__ = "buy_and_deliver_requests"
+    __mapper_args__ = {  # noqa: RUF012
+        "polymorphic_identity": RequestType.BUY_AND_DELIVER,
+    }
 
     request_id = Column(
         GUID(),
@@ -102,21 +121,35 @@ class BuyAndDeliverRequest(Base):
     )
     dropoff_latitude = Column(Float, nullable=False)
     dropoff_longitude = Column(Float, nullable=False)
+    # Spatial cell key, precomputed on insert (see src/lib/geo.py). Rows inserted before the
+    # geohash columns existed are filled by scripts/backfill_geohashes.py
+    dropoff_geohash = Column(
+        String(GEOHASH_PRECISION),
+        default=_geohash_default("dropoff"),
+        index=True,
+    )
 
-    request = relationship("Request", back_populates="buy_and_deliver")
+    def to_dict(self) -> dict[str, Any]:
+        data = super().to_dict()
+        data.update(
+            {
+                "dropoff_latitude": self.dropoff_latitude,
+                "dropoff_longitude": self.dropoff_longitude,
+            },
+        )
+        return data
 
-    def to_dict(self) -> dict[str, Float]:
-        # Only return subtype-specific fields
-        return {
-            "dropoff_latitude": self.dropoff_latitude,
-            "dropoff_longitude": self.dropoff_longitude,
-        }
+    def locations(self) -> list[tuple[float, float]]:
+        return [(self.dropoff_latitude, self.dropoff_longitude)]
 
 
-class PickupAndDeliverRequest(Base):
+class PickupAndDeliverRequest(Request):
     """PickupAndDeliverRequest Table Definition."""
 
     __tablename__ = "pickup_and_deliver_requests"
+    __mapper_args__ = {  # noqa: RUF012
+        "polymorphic_identity": RequestType.PICKUP_AND_DELIVER,
+    }
 
     request_id = Column(
         GUID(),
@@ -127,22 +160,43 @@ class PickupAndDeliverRequest(Base):
     pickup_longitude = Column(Float, nullable=False)
     dropoff_latitude = Column(Float, nullable=False)
     dropoff_longitude = Column(Float, nullable=False)
+    pickup_geohash = Column(
+        String(GEOHASH_PRECISION),
+        default=_geohash_default("pickup"),
+        index=True,
+    )
+    dropoff_geohash = Column(
+        String(GEOHASH_PRECISION),
+        default=_geohash_default("dropoff"),
+        index=True,
+    )
 
-    request = relationship("Request", back_populates="pickup_and_deliver")
+    def to_dict(self) -> dict[str, Any]:
+        data = super().to_dict()
+        data.update(
+            {
+                "pickup_latitude": self.pickup_latitude,
+                "pickup_longitude": self.pickup_longitude,
+                "dropoff_latitude": self.dropoff_latitude,
+                "dropoff_longitude": self.dropoff_longitude,
+            },
+        )
+        return data
 
-    def to_dict(self) -> dict[str, Float]:
-        return {
-            "pickup_latitude": self.pickup_latitude,
-            "pickup_longitude": self.pickup_longitude,
-            "dropoff_latitude": self.dropoff_latitude,
-            "dropoff_longitude": self.dropoff_longitude,
-        }
+    def locations(self) -> list[tuple[float, float]]:
+        return [
+            (self.pickup_latitude, self.pickup_longitude),
+            (self.dropoff_latitude, self.dropoff_longitude),
+        ]
 
 
-class OnlineServiceRequest(Base):
+class OnlineServiceRequest(Request):
     """OnlineServiceRequest Table Definition."""
 
     __tablename__ = "online_service_requests"
+    __mapper_args__ = {  # noqa: RUF012
+        "polymorphic_identity": RequestType.ONLINE_SERVICE,
+    }
 
     request_id = Column(
         GUID(),
@@ -151,11 +205,29 @@ class OnlineServiceRequest(Base):
     )
     meetup_latitude = Column(Float, nullable=False)
     meetup_longitude = Column(Float, nullable=False)
+    meetup_geohash = Column(
+        String(GEOHASH_PRECISION),
+        default=_geohash_default("meetup"),
+        index=True,
+    )
 
-    request = relationship("Request", back_populates="online_service")
+    def to_dict(self) -> dict[str, Any]:
+        data = super().to_dict()
+        data.update(
+            {
+                "meetup_latitude": self.meetup_latitude,
+                "meetup_longitude": self.meetup_longitude,
+            },
+        )
+        return data
 
-    def to_dict(self) -> dict[str, float]:
-        return {
-            "meetup_latitude": self.meetup_latitude,
-            "meetup_longitude": self.meetup_longitude,
-        }
+    def locations(self) -> list[tuple[float, float]]:
+        return [(self.meetup_latitude, self.meetup_longitude)]
+
+
+# Subtype model of each request type
+REQUEST_SUBTYPES: dict[RequestType, type[Request]] = {
+    RequestType.BUY_AND_DELIVER: BuyAndDeliverRequest,
+    RequestType.PICKUP_AND_DELIVER: PickupAndDeliverRequest,
+    RequestType.ONLINE_SERVICE: OnlineServiceRequest,
+}
@@ -0,0 +1,189 @@
+"""Lightweight read-only rows, for list endpoints.
+
+Loaded with Core statements selecting only the needed columns: no identity map, no
+attribute instrumentation nor relationship state. They expose the same `to_dict()` and
+`locations()` as the models, so handlers and the response serializer use them the same way.
+"""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import FromClause, Select, func, null, select
+
+from src.schemas.request import RequestType
+
+from .request import (
+    REQUEST_SUBTYPES,
+    BuyAndDeliverRequest,
+    OnlineServiceRequest,
+    PickupAndDeliverRequest,
+    Request,
+)
+
+# Coordinate columns of each request type, in their to_dict() order
+_TYPE_FIELDS: dict[RequestType, tuple[str, ...]] = {
+    RequestType.BUY_AND_DELIVER: ("dropoff_latitude", "dropoff_longitude"),
+    RequestType.PICKUP_AND_DELIVER: (
+        "pickup_latitude",
+        "pickup_longitude",
+        "dropoff_latitude",
+        "dropoff_longitude",
+    ),
+    RequestType.ONLINE_SERVICE: ("meetup_latitude", "meetup_longitude"),
+}
+
+# Points of each request type: (latitude field, longitude field)
+_TYPE_POINTS: dict[RequestType, tuple[tuple[str, str], ...]] = {
+    RequestType.BUY_AND_DELIVER: (("dropoff_latitude", "dropoff_longitude"),),
+    RequestType.PICKUP_AND_DELIVER: (
+        ("pickup_latitude", "pickup_longitude"),
+        ("dropoff_latitude", "dropoff_longitude"),
+    ),
+    RequestType.ONLINE_SERVICE: (("meetup_latitude", "meetup_longitude"),),
+}
+
+_BASE_COLUMNS = (
+    Request.id,
+    Request.user_id,
+    Request.type,
+    Request.title,
+    Request.description,
+    Request.due_date,
+    Request.created_at,
+    Request.version,
+)
+
+# Coordinate columns, each one stored by one or more subtype tables
+_COORDINATE_COLUMNS = {
+    "pickup_latitude": (PickupAndDeliverRequest.pickup_latitude,),
+    "pickup_longitude": (PickupAndDeliverRequest.pickup_longitude,),
+    "dropoff_latitude": (
+        BuyAndDeliverRequest.dropoff_latitude,
+        PickupAndDeliverRequest.dropoff_latitude,
+    ),
+    "dropoff_longitude": (
+        BuyAndDeliverRequest.dropoff_longitude,
+        PickupAndDeliverRequest.dropoff_longitude,
+    ),
+    "meetup_latitude": (OnlineServiceRequest.meetup_latitude,),
+    "meetup_longitude": (OnlineServiceRequest.meetup_longitude,),
+}
+
+
+class RequestRow:
+    """A request (any type) with its coordinates, as selected by request_rows_select()."""
+
+    __slots__ = (
+        "id",
+        "user_id",
+        "type",
+        "title",
+        "description",
+        "due_date",
+        "created_at",
+        "version",
+        *_COORDINATE_COLUMNS,
+    )
+
+    def __init__(self, *values: Any) -> None:  # noqa: ANN401
+        """Set the fields from values in __slots__ order (a row of request_rows_select)."""
+        for name, value in zip(self.__slots__, values, strict=True):
+            setattr(self, name, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the same dict as the request model (coordinates of the request type only)."""
+        data = {
+            "id": self.id,
+            "user_id": self.user_id,
+            "type": self.type,
+            "title": self.title,
+            "description": self.description,
+            "due_date": self.due_date,
+            "created_at": self.created_at,
+        }
+        for name in _TYPE_FIELDS[self.type]:
+            data[name] = getattr(self, name)
+        return data
+
+    def locations(self) -> list[tuple[float, float]]:
+        """Return every (latitude, longitude) point of the request."""
+        return [(getattr(self, lat), getattr(self, lng)) for lat, lng in _TYPE_POINTS[self.type]]
+
+
+def request_row_columns(subtypes: list[type[Request]] | None = None) -> list[Any]:
+    """Columns of a RequestRow, coordinates coalesced over the given subtype tables.
+
+    Coordinates no given subtype has are selected as NULL.
+    """
+    subtypes = subtypes or list(REQUEST_SUBTYPES.values())
+    columns = list(_BASE_COLUMNS)
+    for name, candidates in _COORDINATE_COLUMNS.items():
+        present = [column for column in candidates if column.class_ in subtypes]
+        if not present:
+            columns.append(null().label(name))
+        elif len(present) == 1:
+            columns.append(present[0].label(name))
+        else:
+            columns.append(func.coalesce(*present).label(name))
+    return columns
+
+
+def request_rows_join(
+    subtypes: list[type[Request]] | None = None,
+    from_clause: FromClause | None = None,
+) -> FromClause:
+    """Join requests to the given subtype tables on their primary key.
+
+    With a single subtype, its table is INNER JOINed (only requests of that type),
+    otherwise every subtype table is LEFT JOINed. `from_clause` is a FROM clause already
+    including requests to chain the joins onto (flat joins plan better than nested ones).
+    """
+    subtypes = subtypes or list(REQUEST_SUBTYPES.values())
+    if from_clause is None:
+        from_clause = Request.__table__
+    for subtype in subtypes:
+        from_clause = from_clause.join(
+            subtype.__table__,
+            subtype.request_id == Request.id,
+            isouter=len(subtypes) > 1,
+        )
+    return from_clause
+
+
+def request_rows_select(subtypes: list[type[Request]] | None = None) -> Select:
+    """SELECT the RequestRow columns of requests (of the given subtypes, default all)."""
+    return select(*request_row_columns(subtypes)).select_from(request_rows_join(subtypes))
+
+
+class FavoriteRow:
+    """A favorite, optionally with its request, as loaded by list_user_favorites(as_rows=True)."""
+
+    __slots__ = ("created_at", "id", "request", "request_id", "user_id")
+
+    def __init__(
+        self,
+        id: UUID,  # noqa: A002
+        user_id: UUID,
+        request_id: UUID,
+        created_at: datetime,
+        request: RequestRow | None = None,
+    ) -> None:
+        """Set the fields, `request` being the favorited request when included."""
+        self.id = id
+        self.user_id = user_id
+        self.request_id = request_id
+        self.created_at = created_at
+        self.request = request
+
+    def to_dict(self, include_request: bool = False) -> dict[str, Any]:  # noqa: FBT001, FBT002
+        """Return the fields of Favorite.to_dict()."""
+        data = {
+            "id": self.id,
+            "user_id": self.user_id,
+            "request_id": self.request_id,
+            "created_at": self.created_at,
+        }
+        if include_request:
+            data["request"] = self.request.to_dict() if self.request else None
+        return data
@@ -0,0 +1,32 @@
+"""Requests search index SQLAlchemy Model definition."""
+
+from sqlalchemy import Column, DateTime, Index, Integer, String
+
+from src.lib.search import TERM_MAX_LENGTH
+
+from .base import Base
+from .types import GUID
+
+
+class RequestTerm(Base):
+    """Inverted index of request titles and descriptions: one row per (request, term).
+
+    Maintained by RequestRepository in the same transaction as the request (see
+    src/lib/search.py for tokenization and weights).
+    """
+
+    __tablename__ = "request_terms"
+    # NOTE: the primary key serves the deletes of a request's terms (on update/delete).
+    # Searches read each term's postings by decreasing weight from ix_request_terms_impact,
+    # so the best matches of a term are found without reading all of its postings. due_date
+    # is part of it so that postings of expired requests (never deleted) are skipped within
+    # the index, before counting towards the per term cap.
+    __table_args__ = (
+        Index("ix_request_terms_impact", "term", "weight", "request_id", "due_date"),
+    )
+
+    request_id = Column(GUID(), primary_key=True)
+    term = Column(String(TERM_MAX_LENGTH), primary_key=True)
+    weight = Column(Integer, nullable=False)
+    # Copy of the request's due date (None: no due date), which updates can't change
+    due_date = Column(DateTime(timezone=True), nullable=True)
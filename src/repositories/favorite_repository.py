@@ -1,12 +1,19 @@
 """Request Repository."""
 
-from uuid import UUID
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
 
-from sqlalchemy import desc
+from sqlalchemy import desc, exists, literal, select
+from sqlalchemy.orm import make_transient_to_detached, selectinload, with_polymorphic
 
-from src.db.session import get_db_session
+from src.db.session import dialect_insert, get_db_session
+from src.lib import metrics
 from src.models.favorite import Favorite
+from src.models.quota import QuotaKind
+from src.models.request import Request
+from src.models.rows import FavoriteRow, RequestRow, request_row_columns, request_rows_join
 from src.repositories.interfaces import FavoriteRepositoryInterface
+from src.repositories.quota_repository import get_quota_repository
 
 _favorite_repo_instance = None
 
@@ -27,53 +34,123 @@ class FavoriteRepository(FavoriteRepositoryInterface):
     and rolls back on exception.
     """
 
-    def create(self, user_id: UUID, request_id: UUID) -> Favorite:
+    @metrics.timed("db")
+    def create(self, user_id: UUID, request_id: UUID) -> tuple[Favorite | None, bool]:
         """Create Favorite for User.
 
-        Add a favorite for user -> request. If the favorite already exists,
-        return the existing Favorite object (idempotent).
+        Add a favorite for user -> request, with a single statement inserting it only when the
+        request exists and the user did not already favorite it (INSERT ... SELECT WHERE EXISTS
+        ... ON CONFLICT DO NOTHING): no race between an existence check and the insert.
+        Returns (favorite, created): the existing favorite when there is one (idempotent), None
+        when the request does not exist. New favorites are counted in the user's quota
+        (raises QuotaExceededError).
         """
         with get_db_session() as db:
-            # Check existing first to provide idempotency and avoid IntegrityError
-            existing = (
-                db.query(Favorite)
-                .filter(Favorite.user_id == user_id, Favorite.request_id == request_id)
-                .first()
+            # ID set here rather than by default, so it is known before the unit of work commits
+            favorite = Favorite(
+                id=uuid4(),
+                user_id=user_id,
+                request_id=request_id,
+                created_at=datetime.now(UTC),
+            )
+            columns = ("id", "user_id", "request_id", "created_at")
+            values = select(
+                *(
+                    literal(getattr(favorite, name), Favorite.__table__.c[name].type)
+                    for name in columns
+                ),
+            ).where(exists().where(Request.id == request_id))
+            statement = (
+                dialect_insert(db)(Favorite.__table__)
+                .from_select(columns, values)
+                .on_conflict_do_nothing(index_elements=["user_id", "request_id"])
+                .returning(Favorite.id)
             )
-            if existing:
-                return existing
-
-            favorite = Favorite(user_id=user_id, request_id=request_id)
-            db.add(favorite)
-            return favorite
 
+            if db.execute(statement).first() is not None:
+                get_quota_repository().acquire(user_id, QuotaKind.FAVORITES, inserted=True)
+                # Persistent in the session (e.g deletable) without loading it back
+                make_transient_to_detached(favorite)
+                db.add(favorite)
+                return favorite, True
+
+            # Already favorited, or no such request
+            existing = db.scalars(
+                select(Favorite).where(
+                    Favorite.user_id == user_id,
+                    Favorite.request_id == request_id,
+                ),
+            ).first()
+            return existing, False
+
+    @metrics.timed("db")
     def get_by_id(self, favorite_id: UUID) -> Favorite | None:
         with get_db_session() as db:
-            return db.query(Favorite).filter(Favorite.id == favorite_id).first()
+            # Session.get() checks the unit of work identity map before querying
+            return db.get(Favorite, favorite_id)
 
-    def delete(self, favorite_id: UUID) -> bool:
+    @metrics.timed("db")
+    def delete(self, favorite_id: UUID, favorite: Favorite | None = None) -> bool:
         """Delete a Favorite by its ID.
 
+        The favorite can be given as an already loaded object to avoid fetching it again.
         Returns Boolean whether a row was deleted or not (idempotent).
         """
         with get_db_session() as db:
-            favorite = db.query(Favorite).filter(Favorite.id == favorite_id).first()
-            if not favorite:  # Already removed
-                return True
+            if favorite is None:
+                favorite = db.get(Favorite, favorite_id)
+                if not favorite:  # Already removed
+                    return True
+            get_quota_repository().release(favorite.user_id, QuotaKind.FAVORITES)
             db.delete(favorite)
             return True
 
-    def list_user_favorites(self, user_id: UUID) -> list[Favorite]:
+    @metrics.timed("db")
+    def list_user_favorites(
+        self,
+        user_id: UUID,
+        include_request: bool = False,  # noqa: FBT001, FBT002
+        as_rows: bool = False,  # noqa: FBT001, FBT002
+    ) -> list[Favorite] | list[FavoriteRow]:
         """List a User's Favorites.
 
         Return all favorites for a user, ordered by created_at DESC (most recent first).
-        This intentionally returns the Favorite objects (with .request relationship available
-        if your model defines it as eager/joined).
+        With `include_request`, the favorited requests (with their subtype data) are loaded
+        in one batched `WHERE id IN (...)` query, instead of one lazy load per favorite.
+        `.request` is None for favorites whose request was deleted (DSQL does not enforce FKs).
+
+        With `as_rows`, read-only FavoriteRow are returned instead, from a single Core SELECT
+        (requests and their subtype tables LEFT JOINed when `include_request`).
         """
         with get_db_session() as db:
-            return (
-                db.query(Favorite)
-                .filter(Favorite.user_id == user_id)
-                .order_by(desc(Favorite.created_at))
-                .all()
+            if as_rows:
+                return self._list_user_favorite_rows(db, user_id, include_request)
+            query = db.query(Favorite).filter(Favorite.user_id == user_id)
+            if include_request:
+                query = query.options(
+                    selectinload(Favorite.request.of_type(with_polymorphic(Request, "*"))),
+                )
+            return query.order_by(desc(Favorite.created_at)).all()
+
+    def _list_user_favorite_rows(self, db, user_id, include_request):  # noqa
+        favorite_columns = (Favorite.id, Favorite.user_id, Favorite.request_id, Favorite.created_at)
+        if not include_request:
+            query = select(*favorite_columns)
+        else:
+            favorites_requests = Favorite.__table__.outerjoin(
+                Request.__table__,
+                Request.id == Favorite.request_id,
+            )
+            query = select(*favorite_columns, *request_row_columns()).select_from(
+                request_rows_join(from_clause=favorites_requests),
             )
+        query = query.where(Favorite.user_id == user_id).order_by(desc(Favorite.created_at))
+
+        favorites = []
+        for row in db.execute(query):
+            request = None
+            # Request columns are NULL when it was deleted
+            if include_request and row[4] is not None:
+                request = RequestRow(*row[4:])
+            favorites.append(FavoriteRow(*row[:4], request=request))
+        return favorites
@@ -1,13 +1,17 @@
 """Repositories Interfaces."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any
 from uuid import UUID
 
+from sqlalchemy import Select
+
 from src.models.favorite import Favorite
+from src.models.quota import QuotaKind
 from src.models.request import Request
-from src.schemas.request import RequestCreate
+from src.models.rows import FavoriteRow, RequestRow
+from src.schemas.request import RequestCreate, RequestUpdate
 
 
 # FIXME: For every method should return whether Request or Union of sub types
@@ -16,12 +20,32 @@ class RequestRepositoryInterface(ABC):  # noqa: D101
     def create(self, user_id: UUID, request_data: RequestCreate) -> Request:
         """Create a new request with its specific subtype."""
 
+    @abstractmethod
+    def bulk_create(self, user_id: UUID, input_requests: list[RequestCreate]) -> list[UUID | None]:
+        """Create many requests of a user, return their ids (None when over quota)."""
+
     @abstractmethod
     def get_by_id(self, request_id: UUID) -> Request | None:
         """Get a request by its ID."""
 
     @abstractmethod
-    def get_user_requests(self, user_id: UUID) -> list[Request]:
+    def get_by_id_cached(self, request_id: UUID) -> RequestRow | None:
+        """Get a read-only request by its ID, possibly from cache."""
+
+    @abstractmethod
+    def get_many(self, request_ids: list[UUID]) -> tuple[list[RequestRow], list[UUID]]:
+        """Get read-only requests by ids (in order), possibly from cache, and the missing ids."""
+
+    @abstractmethod
+    def get_version(self, request_id: UUID) -> int | None:
+        """Get the version of a request (bumped by every update)."""
+
+    @abstractmethod
+    def get_user_requests(
+        self,
+        user_id: UUID,
+        as_rows: bool = False,  # noqa: FBT001, FBT002
+    ) -> list[Request] | list[RequestRow]:
         """Get requests of a user."""
 
     # TODO: @abstractmethod
@@ -37,11 +61,16 @@ class RequestRepositoryInterface(ABC):  # noqa: D101
         """Get a batch of requests starting from specific due date."""
 
     @abstractmethod
-    def update(self, request_id: UUID, data: dict[str, Any]) -> Request | None:
+    def update(
+        self,
+        request_id: UUID,
+        request_update: RequestUpdate,
+        request: Request | None = None,
+    ) -> Request | None:
         """Update request fields."""
 
     @abstractmethod
-    def delete(self, request_id: UUID) -> bool:
+    def delete(self, request_id: UUID, request: Request | None = None) -> bool:
         """Delete a request by ID."""
 
 
@@ -49,17 +78,45 @@ class FavoriteRepositoryInterface(ABC):
     """Interface for managing user favorites."""
 
     @abstractmethod
-    def create(self, user_id: UUID, request_id: UUID) -> Favorite:
-        """Create a new favorite for a user (idempotent)."""
+    def create(self, user_id: UUID, request_id: UUID) -> tuple[Favorite | None, bool]:
+        """Create a new favorite for a user (idempotent), return it and whether it is new.
+
+        The favorite is None when the request does not exist.
+        """
 
     @abstractmethod
     def get_by_id(self, favorite_id: UUID) -> Favorite | None:
         """Get a favorite by its ID."""
 
     @abstractmethod
-    def delete(self, favorite_id: UUID) -> bool:
+    def delete(self, favorite_id: UUID, favorite: Favorite | None = None) -> bool:
         """Delete a favorite by its ID."""
 
     @abstractmethod
-    def list_user_favorites(self, user_id: UUID) -> list[Favorite]:
+    def list_user_favorites(
+        self,
+        user_id: UUID,
+        include_request: bool = False,  # noqa: FBT001, FBT002
+        as_rows: bool = False,  # noqa: FBT001, FBT002
+    ) -> list[Favorite] | list[FavoriteRow]:
         """List all favorites for a given user with no pagination."""
+
+
+class QuotaRepositoryInterface(ABC):
+    """Interface for per user quotas on created items."""
+
+    @abstractmethod
+    def acquire(self, user_id: UUID, kind: QuotaKind, *, inserted: bool = False) -> None:
+        """Count one more item for a user, failing when the quota is reached."""
+
+    @abstractmethod
+    def acquire_many(self, user_id: UUID, kind: QuotaKind, count: int) -> int:
+        """Count up to `count` more items for a user, return how many fit in the quota."""
+
+    @abstractmethod
+    def release(self, user_id: UUID, kind: QuotaKind, count: int = 1) -> None:
+        """Count less items for a user."""
+
+    @abstractmethod
+    def release_many(self, user_ids: Iterable[UUID] | Select, kind: QuotaKind) -> None:
+        """Count one less item for each of the users."""
@@ -0,0 +1,166 @@
+"""Quota Repository."""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import Select, case, func, select, update
+
+from src.config import MAX_USER_CREATED_FAVORITES, MAX_USER_CREATED_REQUESTS
+from src.db.session import dialect_insert, get_db_session
+from src.lib import metrics
+from src.models.favorite import Favorite
+from src.models.quota import QuotaKind, UserQuota
+from src.models.request import Request
+from src.repositories.interfaces import QuotaRepositoryInterface
+
+_quota_repo_instance = None
+
+QUOTA_LIMITS = {
+    QuotaKind.REQUESTS: MAX_USER_CREATED_REQUESTS,
+    QuotaKind.FAVORITES: MAX_USER_CREATED_FAVORITES,
+}
+
+# Items counted by each quota (used to initialize missing counters)
+_COUNTED_MODELS = {
+    QuotaKind.REQUESTS: Request,
+    QuotaKind.FAVORITES: Favorite,
+}
+
+
+class QuotaExceededError(Exception):
+    """Raised when a user reached the maximum number of items of a kind."""
+
+    def __init__(self, kind: QuotaKind) -> None:
+        """Report the quota exceeded for `kind`."""
+        super().__init__(f"Too many {kind.value} created")
+        self.kind = kind
+
+
+def get_quota_repository() -> "QuotaRepository":
+    """Get a quota repository instance."""
+    global _quota_repo_instance  # noqa: PLW0603
+    if _quota_repo_instance is None:
+        _quota_repo_instance = QuotaRepository()
+    return _quota_repo_instance
+
+
+class QuotaRepository(QuotaRepositoryInterface):
+    """Per user quotas, backed by the user_quotas counters table.
+
+    Methods are meant to be called inside the unit of work creating/deleting the counted
+    items (see get_db_session()), so counters and items are committed together.
+    """
+
+    @metrics.timed("db")
+    def acquire(self, user_id: UUID, kind: QuotaKind, *, inserted: bool = False) -> None:
+        """Count one more item for the user, or raise QuotaExceededError.
+
+        Common case is a single conditional UPDATE on the counter primary key. `inserted`
+        tells the item was already inserted in the unit of work (so it is not counted twice
+        when initializing the counter from the user's items).
+        """
+        limit = QUOTA_LIMITS[kind]
+        increment = (
+            update(UserQuota)
+            .where(
+                UserQuota.user_id == user_id,
+                UserQuota.kind == kind.value,
+                UserQuota.used < limit,
+            )
+            .values(used=UserQuota.used + 1)
+            .execution_options(synchronize_session=False)
+        )
+        with get_db_session() as db:
+            if db.execute(increment).rowcount == 1:
+                return
+
+            if db.get(UserQuota, (user_id, kind.value)) is None:
+                # First item of the user (or user created before quotas): initialize from
+                # items. A counter created meanwhile by a concurrent call is kept as is.
+                used = self._count_items(db, user_id, kind) - int(inserted)
+                db.execute(
+                    dialect_insert(db)(UserQuota.__table__)
+                    .values(user_id=user_id, kind=kind.value, used=used)
+                    .on_conflict_do_nothing(),
+                )
+                if db.execute(increment).rowcount == 1:
+                    return
+            raise QuotaExceededError(kind)
+
+    @metrics.timed("db")
+    def acquire_many(self, user_id: UUID, kind: QuotaKind, count: int) -> int:
+        """Count up to `count` more items for the user, return how many fit in the quota.
+
+        One conditional UPDATE capping the counter to the limit (the counter is initialized
+        from the user's items on first use). No retry loop here: under snapshot isolation a
+        concurrent change of the counter aborts the transaction on commit, and the whole unit
+        of work is run again (see src/db/retry.py).
+        """
+        limit = QUOTA_LIMITS[kind]
+        with get_db_session() as db:
+            used = db.scalar(
+                select(UserQuota.used).where(
+                    UserQuota.user_id == user_id,
+                    UserQuota.kind == kind.value,
+                ),
+            )
+            if used is None:
+                # Concurrent first uses insert the same key: the later one conflicts
+                used = self._count_items(db, user_id, kind)
+                db.execute(
+                    dialect_insert(db)(UserQuota.__table__)
+                    .values(user_id=user_id, kind=kind.value, used=used)
+                    .on_conflict_do_nothing(),
+                )
+            if used >= limit:
+                return 0
+
+            # LEAST(used + count, limit), also supported by SQLite
+            used_after = db.scalar(
+                update(UserQuota)
+                .where(
+                    UserQuota.user_id == user_id,
+                    UserQuota.kind == kind.value,
+                    UserQuota.used < limit,
+                )
+                .values(
+                    used=case(
+                        (UserQuota.used + count < limit, UserQuota.used + count),
+                        else_=limit,
+                    ),
+                )
+                .returning(UserQuota.used)
+                .execution_options(synchronize_session=False),
+            )
+            return 0 if used_after is None else used_after - used
+
+    def _count_items(self, db, user_id: UUID, kind: QuotaKind) -> int:  # noqa: ANN001
+        model = _COUNTED_MODELS[kind]
+        return db.scalar(select(func.count()).where(model.user_id == user_id))
+
+    @metrics.timed("db")
+    def release(self, user_id: UUID, kind: QuotaKind, count: int = 1) -> None:
+        """Count `count` less items for the user (never below zero)."""
+        with get_db_session() as db:
+            db.execute(
+                update(UserQuota)
+                .where(UserQuota.user_id == user_id, UserQuota.kind == kind.value)
+                .values(
+                    used=case(
+                        (UserQuota.used > count, UserQuota.used - count),
+                        else_=0,
+                    ),
+                )
+                .execution_options(synchronize_session=False),
+            )
+
+    @metrics.timed("db")
+    def release_many(self, user_ids: Iterable[UUID] | Select, kind: QuotaKind) -> None:
+        """Count one less item for each of the users (ids, or a SELECT of them) at once."""
+        with get_db_session() as db:
+            db.execute(
+                update(UserQuota)
+                .where(UserQuota.user_id.in_(user_ids), UserQuota.kind == kind.value)
+                .values(used=case((UserQuota.used > 1, UserQuota.used - 1), else_=0))
+                .execution_options(synchronize_session=False),
+            )
@@ -2,24 +2,130 @@
 
 import base64
 import json
-from datetime import datetime
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any
-from uuid import UUID
-
-from sqlalchemy import and_, asc, or_
-
-from src.db.session import get_db_session
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    and_,
+    asc,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union,
+    union_all,
+)
+from sqlalchemy.orm import selectin_polymorphic, with_polymorphic
+
+from src import config
+from src.db.retry import retry_conflicts
+from src.db.session import get_db_session, in_unit_of_work
+from src.lib import metrics
+from src.lib.cache import MISSING, TTLCache
+from src.lib.geo import bounding_box, covering_cells, geohash_prefix_range, haversine_km
+from src.lib.search import MAX_QUERY_TERMS, MAX_TERM_WEIGHT, query_terms, term_weights
+from src.models.favorite import Favorite
+from src.models.quota import QuotaKind
 from src.models.request import (
+    REQUEST_SUBTYPES,
     BuyAndDeliverRequest,
     OnlineServiceRequest,
     PickupAndDeliverRequest,
     Request,
 )
+from src.models.rows import RequestRow, request_rows_select
+from src.models.search import RequestTerm
 from src.repositories.interfaces import RequestRepositoryInterface
-from src.schemas.request import RequestCreate, RequestType, RequestUpdate
+from src.repositories.quota_repository import get_quota_repository
+from src.schemas.request import (
+    LocationFilter,
+    RequestCreate,
+    RequestFilter,
+    RequestType,
+    RequestUpdate,
+)
 
 _request_repo_instance = None
 
+# Read-through cache of get_by_id_cached()/get_many(), shared by the warm invocations of the
+# container.
+# Invalidated by update/delete here; changes made through other containers show up after TTL.
+_request_cache = TTLCache(
+    maxsize=config.REQUEST_CACHE_SIZE,
+    ttl_s=config.REQUEST_CACHE_TTL_S,
+    negative_ttl_s=config.REQUEST_CACHE_NEGATIVE_TTL_S,
+)
+
+# Requests inserted per bulk create transaction, at most. Each request writes 2 rows (base +
+# subtype) plus one per indexed term, and DSQL caps a transaction to 3,000 modified rows:
+# chunks are also cut before exceeding BULK_CREATE_MAX_ROWS
+BULK_CREATE_CHUNK_SIZE = 1000
+BULK_CREATE_MAX_ROWS = 2500
+
+# Favorites deleted per transaction when deleting a request. Each deleted favorite modifies
+# 2 rows (itself + its owner's quota counter): 1,000 stays under DSQL's 3,000 rows
+DELETE_CHUNK_SIZE = 1000
+
+# Postings read per search term, by decreasing weight. This bounds the cost of a search
+# whatever the number of requests, at the price of ignoring the weakest matches of terms
+# found in more requests than that
+SEARCH_MAX_POSTINGS_PER_TERM = 2000
+# Search rank: matched terms * factor + their weights. The factor exceeds any weights sum,
+# so requests matching more of the terms always rank first
+_SEARCH_RANK_MATCH_FACTOR = MAX_QUERY_TERMS * MAX_TERM_WEIGHT + 1
+
+# Subtype table columns set from RequestCreate fields (geohashes are computed by defaults)
+_SUBTYPE_INPUT_FIELDS = {
+    subtype: tuple(
+        column.name
+        for column in subtype.__table__.columns
+        if column.name != "request_id" and not column.name.endswith("_geohash")
+    )
+    for subtype in REQUEST_SUBTYPES.values()
+}
+
+# Loader option for queries on the Request base model: subtype columns are loaded with one
+# SELECT per request type present in the results, each joining only that type's table
+_LOAD_SUBTYPES = selectin_polymorphic(Request, list(REQUEST_SUBTYPES.values()))
+
+# (geohash, latitude, longitude) columns of every point of each subtype
+_LOCATION_COLUMNS = {
+    BuyAndDeliverRequest: (
+        (
+            BuyAndDeliverRequest.dropoff_geohash,
+            BuyAndDeliverRequest.dropoff_latitude,
+            BuyAndDeliverRequest.dropoff_longitude,
+        ),
+    ),
+    PickupAndDeliverRequest: (
+        (
+            PickupAndDeliverRequest.pickup_geohash,
+            PickupAndDeliverRequest.pickup_latitude,
+            PickupAndDeliverRequest.pickup_longitude,
+        ),
+        (
+            PickupAndDeliverRequest.dropoff_geohash,
+            PickupAndDeliverRequest.dropoff_latitude,
+            PickupAndDeliverRequest.dropoff_longitude,
+        ),
+    ),
+    OnlineServiceRequest: (
+        (
+            OnlineServiceRequest.meetup_geohash,
+            OnlineServiceRequest.meetup_latitude,
+            OnlineServiceRequest.meetup_longitude,
+        ),
+    ),
+}
+
 
 # NOTE: for now I keep this as a singleton, though it does not mean that
 # DB sessions are the same across multiple sequential calls via a single aws
@@ -40,41 +146,44 @@ def get_request_repository() -> "RequestRepository":
 class RequestRepository(RequestRepositoryInterface):
     """Request Repository containing all necessary methods."""
 
+    @metrics.timed("db")
     def create(self, user_id: "UUID", input_request: "RequestCreate") -> Request:
+        """Create a request, counted in the user's quota (raises QuotaExceededError)."""
         with get_db_session() as db:
-            request = Request(
-                user_id=user_id,
-                type=input_request.type,
-                title=input_request.title,
-                description=input_request.description,
-                due_date=input_request.due_date,
-            )
-
+            get_quota_repository().acquire(user_id, QuotaKind.REQUESTS)
+
+            # ID set here rather than at flush, so it is known before the unit of work commits
+            common = {
+                "id": uuid4(),
+                "user_id": user_id,
+                "title": input_request.title,
+                "description": input_request.description,
+                "due_date": input_request.due_date,
+            }
+
+            # NOTE: `type` column is set by SQLAlchemy from the subclass (polymorphic identity)
             if input_request.type == RequestType.BUY_AND_DELIVER:
-                subtype = BuyAndDeliverRequest(
-                    request_id=request.id,
+                request = BuyAndDeliverRequest(
+                    **common,
                     dropoff_latitude=input_request.dropoff_latitude,
                     dropoff_longitude=input_request.dropoff_longitude,
                 )
-                request.buy_and_deliver = subtype
 
             elif input_request.type == RequestType.PICKUP_AND_DELIVER:
-                subtype = PickupAndDeliverRequest(
-                    request_id=request.id,
+                request = PickupAndDeliverRequest(
+                    **common,
                     pickup_latitude=input_request.pickup_latitude,
                     pickup_longitude=input_request.pickup_longitude,
                     dropoff_latitude=input_request.dropoff_latitude,
                     dropoff_longitude=input_request.dropoff_longitude,
                 )
-                request.pickup_and_deliver = subtype
 
             elif input_request.type == RequestType.ONLINE_SERVICE:
-                subtype = OnlineServiceRequest(
-                    request_id=request.id,
+                request = OnlineServiceRequest(
+                    **common,
                     meetup_latitude=input_request.meetup_latitude,
                     meetup_longitude=input_request.meetup_longitude,
                 )
-                request.online_service = subtype
 
             else:
                 exception_msg = "New request type was added but not integrated here"
@@ -84,115 +193,717 @@ class RequestRepository(RequestRepositoryInterface):
             # So still no commit. The commit happends automatically
             # in the wrapper
 
-            # SINGLE OPERATION - cascade handles everything
+            # SINGLE OPERATION - base and subtype rows are inserted together
             db.add(request)
+            self._index_terms(
+                db,
+                [(request.id, request.title, request.description, request.due_date)],
+            )
             return request
 
+    @metrics.timed("db")
+    def bulk_create(
+        self,
+        user_id: UUID,
+        input_requests: list[RequestCreate],
+    ) -> list[UUID | None]:
+        """Create many requests of a user with multi-row INSERTs.
+
+        Requests are inserted by chunks (see BULK_CREATE_CHUNK_SIZE), each chunk in its own
+        transaction (unless already inside a unit of work), retried as a whole on DSQL
+        conflicts: base rows in one INSERT, then
+        subtype rows in one INSERT per type, then search terms in one INSERT. Requests beyond
+        the user's quota are skipped.
+        Returns the id of each created request, None for skipped ones (same order as input).
+        """
+        created: list[UUID | None] = []
+        quota_repo = get_quota_repository()
+        weights = [term_weights(request.title, request.description) for request in input_requests]
+
+        def create_chunk(indexes: list[int]) -> list[UUID | None]:
+            chunk_created: list[UUID | None] = []
+            with get_db_session() as db:
+                granted = quota_repo.acquire_many(user_id, QuotaKind.REQUESTS, len(indexes))
+                base_rows = []
+                subtype_rows = defaultdict(list)
+                term_rows = []
+                for index in indexes[:granted]:
+                    input_request = input_requests[index]
+                    request_id = uuid4()
+                    base_rows.append(
+                        {
+                            "id": request_id,
+                            "user_id": user_id,
+                            "type": input_request.type,
+                            "title": input_request.title,
+                            "description": input_request.description,
+                            "due_date": input_request.due_date,
+                        },
+                    )
+                    subtype = REQUEST_SUBTYPES[input_request.type]
+                    subtype_rows[subtype].append(
+                        {
+                            "request_id": request_id,
+                            **{
+                                field: getattr(input_request, field)
+                                for field in _SUBTYPE_INPUT_FIELDS[subtype]
+                            },
+                        },
+                    )
+                    term_rows.extend(
+                        {
+                            "request_id": request_id,
+                            "term": term,
+                            "weight": weight,
+                            "due_date": input_request.due_date,
+                        }
+                        for term, weight in weights[index].items()
+                    )
+                    chunk_created.append(request_id)
+
+                # One INSERT ... VALUES (...), (...), ... statement per table
+                if base_rows:
+                    db.execute(insert(Request.__table__).values(base_rows))
+                    for subtype, rows in subtype_rows.items():
+                        db.execute(insert(subtype.__table__).values(rows))
+                if term_rows:
+                    db.execute(insert(RequestTerm.__table__).values(term_rows))
+            return chunk_created + [None] * (len(indexes) - granted)
+
+        for indexes in self._bulk_create_chunks(weights):
+            # A chunk committed on its own is retried as a whole on DSQL conflicts
+            if in_unit_of_work():
+                created.extend(create_chunk(indexes))
+            else:
+                created.extend(retry_conflicts(partial(create_chunk, indexes)))
+        return created
+
+    @metrics.timed("db")
     def get_by_id(self, request_id: UUID) -> Request | None:
         with get_db_session() as db:
-            return db.query(Request).filter(Request.id == request_id).first()
+            # Type is unknown before loading: subtype tables are LEFT JOINed on their primary
+            # key, which keeps a single round trip (instead of base + subtype SELECTs)
+            return db.execute(
+                select(with_polymorphic(Request, "*")).where(Request.id == request_id),
+            ).scalar_one_or_none()
+
+    @metrics.timed("db")
+    def get_by_id_cached(self, request_id: UUID) -> RequestRow | None:
+        """Get a read-only request row, through the container's cache.
+
+        Not found results are cached too (shorter TTL). Meant for reads only: use get_by_id()
+        for requests to be changed.
+        """
+        found, _ = self.get_many([request_id])
+        return found[0] if found else None
+
+    @metrics.timed("db")
+    def get_many(self, request_ids: list[UUID]) -> tuple[list[RequestRow], list[UUID]]:
+        """Get read-only request rows by id, through the container's cache.
+
+        Ids missing from the cache are loaded by a single `WHERE id IN (...)` SELECT, subtype
+        tables LEFT JOINed. Returns (found requests in the order of `request_ids`, ids not found).
+        Duplicated ids are returned once.
+        """
+        request_ids = list(dict.fromkeys(request_ids))
+        cached = {}
+        to_load = []
+        for request_id in request_ids:
+            request = _request_cache.get(request_id)
+            if request is MISSING:
+                to_load.append(request_id)
+            else:
+                cached[request_id] = request
+        if cached:
+            metrics.incr("request_cache_hits", len(cached))
+
+        if to_load:
+            metrics.incr("request_cache_misses", len(to_load))
+            with get_db_session() as db:
+                loaded = {
+                    row.id: RequestRow(*row)
+                    for row in db.execute(request_rows_select().where(Request.id.in_(to_load)))
+                }
+            for request_id in to_load:
+                cached[request_id] = loaded.get(request_id)
+                _request_cache.put(request_id, cached[request_id])
+
+        found, missing = [], []
+        for request_id in request_ids:
+            if cached[request_id] is None:
+                missing.append(request_id)
+            else:
+                found.append(cached[request_id])
+        return found, missing
+
+    @metrics.timed("db")
+    def get_version(self, request_id: UUID) -> int | None:
+        """Return the version of a request (None when not found).
+
+        Served by an index only scan of ix_requests_id_version on PostgreSQL/DSQL. SQLite
+        always picks the primary key index for `id =`, and then reads the row.
+        """
+        with get_db_session() as db:
+            return db.scalar(select(Request.version).where(Request.id == request_id))
 
-    def get_user_requests(self, user_id: UUID) -> list[Request]:
+    @metrics.timed("db")
+    def get_user_requests(
+        self,
+        user_id: UUID,
+        as_rows: bool = False,  # noqa: FBT001, FBT002
+    ) -> list[Request] | list[RequestRow]:
+        """Return a user's requests, most recent first (ix_requests_user_created order).
+
+        With `as_rows`, read-only RequestRow are returned (see src/models/rows.py).
+        """
         with get_db_session() as db:
-            return db.query(Request).filter(Request.user_id == user_id).all()
+            query = request_rows_select() if as_rows else select(Request).options(_LOAD_SUBTYPES)
+            query = query.where(Request.user_id == user_id).order_by(desc(Request.created_at))
+            return self._fetcher(db, as_rows)(query)
 
-    # FIXME: The list is not working properly, and has a bug when create_at and due_date are
-    # the same in two requests. This is expected as they are necessarly unique (though it is
-    # a possible rare case due to millisecond precision on both attributes)
+    @metrics.timed("db")
     def list_of_requests(
         self,
-        request_type: str | None = None,
+        filters: RequestFilter | None = None,
         limit: int = 20,
         cursor: str | None = None,
+        as_rows: bool = False,  # noqa: FBT001, FBT002
     ) -> dict[str, Any]:
         """List Requests in pagination mode.
 
-        Fetch paginated requests with proper cursor-based pagination.
+        Fetch paginated requests with keyset (cursor-based) pagination.
         Earlier due dates show first, later due dates show after.
         Requests without due_date come last, ordered by created_at ASC (oldest first).
-        Uses only date fields for ordering (UUIDs are random).
-        """
-        with get_db_session() as db:
-            try:
-                # Build base query
-                query = db.query(Request)
-
-                # Apply type filter if provided
-                if request_type:
-                    query = query.filter(Request.type == request_type)
-
-                # Apply cursor-based pagination
-                if cursor:
-                    cursor_data = self._decode_cursor(cursor)
-                    query = self._apply_cursor_filter(query, cursor_data)
-
-                # Order by due_date ASC (earlier first), NULLS LAST, then created_at ASC
-                # No ID ordering since UUIDs are random
-                query = query.order_by(
-                    asc(Request.due_date).nulls_last(),  # Earlier due_dates first, NULLs last
-                    asc(
-                        Request.created_at,
-                    ),  # Older requests first for same due_date AND for NULL due_dates
-                )
+        The id is the last ordering key: it is meaningless (random UUIDs) but makes the order
+        total, so rows with equal dates are neither skipped nor duplicated across pages.
 
-                # Get one extra item to check if there's more
-                requests = query.limit(limit + 1).all()
-
-                # Check if there are more items
-                has_more = len(requests) > limit
-                if has_more:
-                    requests = requests[:-1]  # Remove the extra item
-
-                # Generate next cursor
-                next_cursor = None
-                if has_more and requests:
-                    next_cursor = self._generate_next_cursor(requests[-1])
-
-                return {
-                    "requests": requests,
-                    "pagination": {
-                        "next_cursor": next_cursor,
-                        "has_more": has_more,
-                        "limit": limit,
-                    },
-                }
+        When a location is given, only requests having at least one point (pickup, dropoff
+        or meetup) within `radius_km` of (lat, lng) are returned. Candidates are selected in
+        SQL through geohash cell ranges + bounding box, then refined with haversine distance.
+
+        With `as_rows`, read-only RequestRow are returned instead of models: a single Core
+        SELECT of the needed columns, subtype coordinates coalesced in SQL.
+
+        With a `search`, only requests whose title or description contain some of its terms
+        are returned, best matches first (see _search_ranks), other filters still applying.
+        Cursors then hold the rank position instead of the feed one.
 
+        Requests whose due date has passed are left out, and `due` restricts due dates to
+        a window (see DueDateFilter). The window bounds the due_date range scanned in the
+        feed indexes, and skips the undated section when requests without due date can't
+        match.
+        """
+        filters = filters or RequestFilter()
+        with get_db_session():
+            try:
+                if filters.search is None:
+                    return self._list_feed(filters, limit, cursor, as_rows)
+                return self._list_search(filters, limit, cursor, as_rows)
             except Exception as e:
                 exception_msg = f"Error listing requests: {e!r}"
                 raise Exception(exception_msg) from e
 
-    def update(self, request_id: UUID, request_update: RequestUpdate) -> Request:
+    @metrics.timed("db")
+    def update(
+        self,
+        request_id: UUID,
+        request_update: RequestUpdate,
+        request: Request | None = None,
+    ) -> Request:
+        """Update a request, optionally given as an already loaded object (no re-fetch)."""
         with get_db_session() as db:
-            # Apply updates
-            request = db.query(Request).filter(Request.id == request_id).first()
-            if not request:
-                exception_msg = "Workflow should not be happening"
-                raise Exception(exception_msg)
+            if request is None:
+                request = self.get_by_id(request_id)
+                if not request:
+                    exception_msg = "Workflow should not be happening"
+                    raise Exception(exception_msg)
+            else:
+                db.add(request)  # No-op when already part of the unit of work
 
-            for attr, value in request_update.model_dump(exclude_unset=True).items():
+            # Apply updates
+            changes = request_update.model_dump(exclude_unset=True)
+            for attr, value in changes.items():
                 setattr(request, attr, value)
+            request.version += 1
+            if changes.keys() & {"title", "description"}:
+                db.execute(delete(RequestTerm).where(RequestTerm.request_id == request_id))
+                self._index_terms(
+                    db,
+                    [(request_id, request.title, request.description, request.due_date)],
+                )
+            _request_cache.invalidate(request_id)
             return request
 
-    def delete(self, request_id: UUID) -> bool:
+    @metrics.timed("db")
+    def delete(self, request_id: UUID, request: Request | None = None) -> bool:
+        """Delete a request and its favorites, optionally given as an already loaded object.
+
+        DSQL does not enforce FK cascades: favorites, subtype and base rows are deleted here
+        with set-based `DELETE ... WHERE` statements, favorites being released from their
+        owners' quotas with one UPDATE. Outside of a unit of work, favorites in excess of what
+        fits in the request's transaction are purged first (see purge_favorites()); inside
+        one, the caller must have purged them before starting it.
+        """
+        if not in_unit_of_work():
+            self.purge_favorites(request_id)
+
         with get_db_session() as db:
-            req = db.query(Request).filter(Request.id == request_id).first()
-            if not req:
-                return True
-            db.delete(req)
+            if request is None:
+                request = self.get_by_id(request_id)
+                if not request:
+                    _request_cache.invalidate(request_id)
+                    return True
+
+            of_request = Favorite.request_id == request_id
+            if db.scalar(select(func.count()).where(of_request)):
+                self._delete_favorites(db, of_request)
+
+            get_quota_repository().release(request.user_id, QuotaKind.REQUESTS)
+            subtype_table = REQUEST_SUBTYPES[request.type].__table__
+            db.execute(delete(RequestTerm).where(RequestTerm.request_id == request_id))
+            db.execute(delete(subtype_table).where(subtype_table.c.request_id == request_id))
+            db.execute(delete(Request.__table__).where(Request.id == request_id))
+            if request in db:
+                db.expunge(request)
+            _request_cache.invalidate(request_id)
             return True
 
-    def _generate_next_cursor(self, last_request: Request) -> str:
-        """Generate Next Cursor For List Pagination.
+    def purge_favorites(self, request_id: UUID, user_id: UUID | None = None) -> None:
+        """Delete the favorites of a request in excess of DELETE_CHUNK_SIZE, by chunks.
+
+        Each chunk is committed on its own, retried as a whole on DSQL conflicts, so this must
+        not run inside a unit of work: it runs before the one deleting the request, whose
+        transaction then fits the remaining favorites. With `user_id`, only the favorites of
+        that user's request are purged. A failure leaves the request in place, and deleting
+        it again resumes.
+        """
+        if in_unit_of_work():
+            exception_msg = "Favorites must be purged before the unit of work deleting the request"
+            raise RuntimeError(exception_msg)
+        while retry_conflicts(partial(self._purge_favorites_chunk, request_id, user_id)):
+            pass
+
+    @metrics.timed("db")
+    def _purge_favorites_chunk(self, request_id: UUID, user_id: UUID | None) -> bool:
+        """Delete one chunk of the excess favorites of a request, return whether more are left."""
+        with get_db_session() as db:
+            of_request = Favorite.request_id == request_id
+            excess = db.scalar(select(func.count()).where(of_request)) - DELETE_CHUNK_SIZE
+            if excess <= 0:
+                return False
+            if user_id is not None:
+                owner_id = db.scalar(select(Request.user_id).where(Request.id == request_id))
+                if owner_id != user_id:
+                    return False
+
+            chunk = db.scalars(
+                select(Favorite.id).where(of_request).limit(min(excess, DELETE_CHUNK_SIZE)),
+            )
+            self._delete_favorites(db, Favorite.id.in_(chunk.all()))
+            return excess > DELETE_CHUNK_SIZE
+
+    def _delete_favorites(self, db, criteria) -> None:  # noqa
+        """Delete favorites matching `criteria`, released from their owners' quotas.
 
-        Generate cursor from the last request in the current page.
-        Only uses date fields since IDs are random UUIDs.
+        A user favorites a request once at most: each owner of a request's favorites gets one
+        released, all with a single UPDATE.
         """
-        cursor_data = {
-            "due_date": last_request.due_date.isoformat() if last_request.due_date else None,
-            "created_at": last_request.created_at.isoformat(),
+        owners = select(Favorite.user_id).where(criteria)
+        get_quota_repository().release_many(owners, QuotaKind.FAVORITES)
+        db.execute(delete(Favorite).where(criteria).execution_options(synchronize_session=False))
+
+    def _bulk_create_chunks(self, weights: list[dict[str, int]]) -> Iterator[list[int]]:
+        """Split requests (given by their terms weights) in chunks, as indexes lists.
+
+        A chunk has at most BULK_CREATE_CHUNK_SIZE requests and BULK_CREATE_MAX_ROWS rows.
+        """
+        chunk, rows = [], 0
+        for index, terms in enumerate(weights):
+            request_rows = 2 + len(terms)  # Base, subtype, terms
+            if chunk and (
+                len(chunk) == BULK_CREATE_CHUNK_SIZE or rows + request_rows > BULK_CREATE_MAX_ROWS
+            ):
+                yield chunk
+                chunk, rows = [], 0
+            chunk.append(index)
+            rows += request_rows
+        if chunk:
+            yield chunk
+
+    def _index_terms(
+        self,
+        db,  # noqa: ANN001
+        requests: list[tuple[UUID, str | None, str | None, datetime | None]],
+    ) -> None:
+        """Insert the search index terms of (request id, title, description, due date) items."""
+        rows = [
+            {"request_id": request_id, "term": term, "weight": weight, "due_date": due_date}
+            for request_id, title, description, due_date in requests
+            for term, weight in term_weights(title, description).items()
+        ]
+        if rows:
+            db.execute(insert(RequestTerm.__table__).values(rows))
+
+    def _filtered_query(self, filters: RequestFilter, as_rows: bool):  # noqa: ANN202, FBT001
+        """Return the base SELECT of a listing, with its type and location filters."""
+        # With a type filter, the subtype model is queried directly so only its table is
+        # joined. The `type` predicate is still needed, for the per-type feed index
+        # (ix_requests_type_feed) to be used.
+        subtypes = list(REQUEST_SUBTYPES.values())
+        if filters.type:
+            subtypes = [REQUEST_SUBTYPES[filters.type]]
+
+        if as_rows:
+            query = request_rows_select(subtypes)
+        elif filters.type:
+            query = select(subtypes[0])
+        elif filters.location is not None:
+            # Geo filter needs coordinates of every subtype in the same statement
+            query = select(with_polymorphic(Request, subtypes))
+        else:
+            query = select(Request).options(_LOAD_SUBTYPES)
+
+        if filters.location is not None:
+            return self._apply_location_prefilter(query, filters.location, subtypes)
+        if filters.type:
+            return query.where(Request.type == filters.type)
+        return query
+
+    def _list_feed(
+        self,
+        filters: RequestFilter,
+        limit: int,
+        cursor: str | None,
+        as_rows: bool,  # noqa: FBT001
+    ) -> dict[str, Any]:
+        """Page of list_of_requests in feed order (see _fetch_batch)."""
+        due_from, due_until = filters.due.window(datetime.now(UTC))
+        with get_db_session() as db:
+            query = self._filtered_query(filters, as_rows)
+            fetch = self._fetcher(db, as_rows)
+
+            def fetch_batch(cursor_data, size):  # noqa: ANN001, ANN202
+                return self._fetch_batch(
+                    fetch,
+                    query,
+                    cursor_data,
+                    size,
+                    due_from=due_from,
+                    due_until=due_until,
+                    include_undated=filters.due.includes_undated,
+                )
+
+            cursor_data = self._decode_cursor(cursor) if cursor else None
+            return self._paginate(fetch_batch, self._cursor_data, cursor_data, limit, filters)
+
+    def _list_search(
+        self,
+        filters: RequestFilter,
+        limit: int,
+        cursor: str | None,
+        as_rows: bool,  # noqa: FBT001
+    ) -> dict[str, Any]:
+        """Page of list_of_requests by decreasing search rank (see _search_ranks)."""
+        terms = query_terms(filters.search)
+        if not terms:  # Nothing searchable (e.g only stop words)
+            return {
+                "requests": [],
+                "pagination": {"next_cursor": None, "has_more": False, "limit": limit},
+            }
+
+        due = filters.due
+        due_from, due_until = due.window(datetime.now(UTC))
+        with get_db_session() as db:
+            ranks = self._search_ranks(terms, due_from, due_until, due.includes_undated)
+            # Ranks order the results: due dates are plain criteria here. Postings are
+            # already filtered on them, this also covers those whose due_date was indexed
+            # before it was copied to request_terms (NULL)
+            query = self._filtered_query(filters, as_rows)
+            due_dates = self._due_date_criteria(due_from, due_until)
+            if due_dates and due.includes_undated:
+                query = query.where(or_(and_(*due_dates), Request.due_date.is_(None)))
+            elif due_dates:
+                query = query.where(*due_dates)
+            rank_of = {}
+
+            def fetch_batch(cursor_data, size):  # noqa: ANN001, ANN202
+                return self._fetch_ranked(db, query, ranks, cursor_data, size, as_rows, rank_of)
+
+            def cursor_of(request):  # noqa: ANN001, ANN202
+                return {"rank": rank_of[request.id], "id": request.id}
+
+            cursor_data = self._decode_search_cursor(cursor) if cursor else None
+            return self._paginate(fetch_batch, cursor_of, cursor_data, limit, filters)
+
+    def _paginate(self, fetch_batch, cursor_of, cursor_data, limit, filters) -> dict[str, Any]:  # noqa
+        """Fetch the page of `limit` rows after the cursor, with its pagination.
+
+        fetch_batch(cursor_data, size) fetches rows in order after a cursor position, and
+        cursor_of(row) returns the cursor position of a row.
+        """
+        # Get one extra item to check if there's more
+        if filters.location is None:
+            requests = fetch_batch(cursor_data, limit + 1)
+        else:
+            requests = self._fetch_within_radius(
+                fetch_batch,
+                cursor_of,
+                cursor_data,
+                limit + 1,
+                filters.location,
+            )
+
+        # Check if there are more items
+        has_more = len(requests) > limit
+        if has_more:
+            requests = requests[:-1]  # Remove the extra item
+
+        # Generate next cursor
+        next_cursor = None
+        if has_more and requests:
+            next_cursor = self._encode_cursor(cursor_of(requests[-1]))
+
+        return {
+            "requests": requests,
+            "pagination": {
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+                "limit": limit,
+            },
         }
 
-        cursor_json = json.dumps(cursor_data)
+    def _search_ranks(  # noqa: ANN202
+        self,
+        terms: list[str],
+        due_from: datetime | None,
+        due_until: datetime | None,
+        include_undated: bool,  # noqa: FBT001
+    ):
+        """Subquery of (request_id, rank) of the requests containing some of the terms.
+
+        Each term's postings are read from the impact index (term, weight, request_id,
+        due_date), by decreasing weight and up to SEARCH_MAX_POSTINGS_PER_TERM: the cost
+        depends on the number of terms, not of requests. Postings out of the due date window
+        (expired requests included) are filtered in the index before the cap, so they never
+        crowd out matching requests. rank = matched terms * _SEARCH_RANK_MATCH_FACTOR + sum
+        of their weights: requests matching more terms first, then those where the terms
+        weigh more (in the title, repeated).
+        """
+        due_dates = self._due_date_criteria(due_from, due_until, RequestTerm.due_date)
+        if due_dates and include_undated:
+            due_dates = [or_(and_(*due_dates), RequestTerm.due_date.is_(None))]
+        postings = [
+            select(RequestTerm.request_id, RequestTerm.weight)
+            .where(RequestTerm.term == term, *due_dates)
+            .order_by(desc(RequestTerm.weight), desc(RequestTerm.request_id))
+            .limit(SEARCH_MAX_POSTINGS_PER_TERM)
+            .subquery()
+            for term in terms
+        ]
+        hits = union_all(*(select(p.c.request_id, p.c.weight) for p in postings)).subquery()
+        rank = func.count() * _SEARCH_RANK_MATCH_FACTOR + func.sum(hits.c.weight)
+        return (
+            select(hits.c.request_id, rank.label("rank"))
+            .group_by(hits.c.request_id)
+            .subquery("search_ranks")
+        )
+
+    def _fetch_ranked(self, db, query, ranks, cursor_data, size, as_rows, rank_of):  # noqa
+        """Fetch the next `size` rows by decreasing search rank, then id, after the cursor.
+
+        The rank of each returned request is recorded in `rank_of` (for cursors).
+        """
+        query = query.join(ranks, ranks.c.request_id == Request.id).add_columns(ranks.c.rank)
+        if cursor_data:
+            query = query.filter(
+                or_(
+                    ranks.c.rank < cursor_data["rank"],
+                    and_(
+                        ranks.c.rank == cursor_data["rank"],
+                        Request.id > literal(cursor_data["id"], Request.id.type),
+                    ),
+                ),
+            )
+        rows = db.execute(query.order_by(desc(ranks.c.rank), asc(Request.id)).limit(size))
+        requests = []
+        for *columns, rank in rows:
+            request = RequestRow(*columns) if as_rows else columns[0]
+            rank_of[request.id] = rank
+            requests.append(request)
+        return requests
+
+    def _fetcher(self, db, as_rows: bool):  # noqa
+        """Return a function executing a SELECT: models, or RequestRow with `as_rows`."""
+        if as_rows:
+            return lambda query: [RequestRow(*row) for row in db.execute(query)]
+        return lambda query: db.scalars(query).all()
+
+    def _due_date_criteria(
+        self,
+        due_from: datetime | None,
+        due_until: datetime | None,
+        column=Request.due_date,  # noqa: ANN001
+    ) -> list:
+        """Criteria of due dates in [due_from, due_until) (None: unbounded)."""
+        criteria = []
+        if due_from is not None:
+            criteria.append(column >= literal(due_from, column.type))
+        if due_until is not None:
+            criteria.append(column < literal(due_until, column.type))
+        return criteria
+
+    def _fetch_batch(  # noqa: PLR0913
+        self,
+        fetch,  # noqa: ANN001
+        query,  # noqa: ANN001
+        cursor_data: dict[str, Any] | None,
+        size: int,
+        *,
+        due_from: datetime | None = None,
+        due_until: datetime | None = None,
+        include_undated: bool = True,
+    ) -> list:
+        """Fetch the next `size` rows in feed order, after the cursor position.
+
+        Feed order is (due_date ASC NULLS LAST, created_at ASC, id ASC). It is read as two
+        index range scans instead of one NULLS LAST sort, so that it works the same on
+        engines whose ascending indexes put NULLs first (SQLite):
+        - dated section: due_date IS NOT NULL AND (due_date, created_at, id) > cursor
+        - undated section: due_date IS NULL AND (created_at, id) > cursor
+        Both are served in order by the (due_date, created_at, id) composite indexes.
+        Due dates in [due_from, due_until) bound the dated section range scan; the undated
+        section is only read with `include_undated`.
+        """
+        rows = []
+        if cursor_data is None or cursor_data["due_date"] is not None:
+            dated = query.filter(
+                Request.due_date.is_not(None),
+                *self._due_date_criteria(due_from, due_until),
+            )
+            if cursor_data:
+                dated = dated.filter(
+                    tuple_(Request.due_date, Request.created_at, Request.id)
+                    > tuple_(
+                        literal(cursor_data["due_date"], Request.due_date.type),
+                        literal(cursor_data["created_at"], Request.created_at.type),
+                        literal(cursor_data["id"], Request.id.type),
+                    ),
+                )
+            rows = fetch(
+                dated.order_by(asc(Request.due_date), asc(Request.created_at), asc(Request.id))
+                .limit(size),
+            )
+            if len(rows) == size:
+                return rows
+            cursor_data = None  # Dated section exhausted: continue from undated section start
+
+        if not include_undated:
+            return rows
+        undated = query.filter(Request.due_date.is_(None))
+        if cursor_data:
+            undated = undated.filter(
+                tuple_(Request.created_at, Request.id)
+                > tuple_(
+                    literal(cursor_data["created_at"], Request.created_at.type),
+                    literal(cursor_data["id"], Request.id.type),
+                ),
+            )
+        rows += fetch(
+            undated.order_by(asc(Request.created_at), asc(Request.id)).limit(size - len(rows)),
+        )
+        return rows
+
+    def _fetch_within_radius(self, fetch_batch, cursor_of, cursor_data, size, location):  # noqa
+        """Fetch `size` rows that are really within the radius.
+
+        The SQL prefilter returns a superset (cells and bounding box are squares), so batches
+        (from `fetch_batch(cursor_data, size)`, in feed or search rank order) are scanned in
+        order until enough rows survive the exact distance check or the candidates are
+        exhausted. Scanning resumes from the last *scanned* row (`cursor_of(row)`), which
+        keeps the returned page consistent with cursor ordering.
+        """
+        matches = []
+        while True:
+            batch = fetch_batch(cursor_data, size)
+            matches.extend(
+                request
+                for request in batch
+                if any(
+                    haversine_km(location.lat, location.lng, lat, lng) <= location.radius_km
+                    for lat, lng in request.locations()
+                )
+            )
+            if len(matches) >= size or len(batch) < size:
+                return matches[:size]
+            cursor_data = cursor_of(batch[-1])
+
+    def _apply_location_prefilter(self, query, location: LocationFilter, subtypes):  # noqa
+        """Restrict query to requests having a point in the search area cells/bounding box.
+
+        Candidates are driven by the geohash indexes: a UNION of one range scan per covering
+        cell and geohash column of `subtypes`, whose request ids select the requests (so the
+        feed indexes are not walked). The bounding box is then checked on their coordinates
+        (cells are coarser). Without covering cells (area too large), the bounding box is the
+        only prefilter.
+        """
+        cells = covering_cells(location.lat, location.lng, location.radius_km)
+        min_lat, max_lat, lng_ranges = bounding_box(
+            location.lat,
+            location.lng,
+            location.radius_km,
+        )
+
+        if cells:
+            ranges = [geohash_prefix_range(cell) for cell in cells]
+            candidates = union(
+                *(
+                    # Subtype table only: no join of the base table per range scan
+                    select(table.c.request_id).where(
+                        table.c[geohash_col.key] >= start,
+                        table.c[geohash_col.key] < end,
+                    )
+                    for subtype in subtypes
+                    for table in (subtype.__table__,)
+                    for geohash_col, _, _ in _LOCATION_COLUMNS[subtype]
+                    for start, end in ranges
+                ),
+            )
+            query = query.where(Request.id.in_(candidates))
+        elif len(subtypes) < len(REQUEST_SUBTYPES):
+            query = query.where(
+                Request.type.in_([subtype.__mapper__.polymorphic_identity for subtype in subtypes]),
+            )
+
+        return query.filter(
+            or_(
+                *(
+                    and_(
+                        lat_col.between(min_lat, max_lat),
+                        or_(*(lng_col.between(low, high) for low, high in lng_ranges)),
+                    )
+                    for subtype in subtypes
+                    for _, lat_col, lng_col in _LOCATION_COLUMNS[subtype]
+                ),
+            ),
+        )
+
+    def _cursor_data(self, last_request: Request) -> dict[str, Any]:
+        """Extract the ordering fields of a request (i.e the cursor position)."""
+        return {
+            "due_date": last_request.due_date,
+            "created_at": last_request.created_at,
+            "id": last_request.id,
+        }
+
+    def _encode_cursor(self, cursor_data: dict[str, Any]) -> str:
+        """Encode a cursor position (every ordering key, including the id tiebreaker)."""
+        cursor_json = json.dumps(
+            {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in cursor_data.items()
+            },
+            default=str,
+        )
         return base64.b64encode(cursor_json.encode()).decode()
 
     def _decode_cursor(self, cursor: str) -> dict[str, Any]:
@@ -205,34 +916,19 @@ class RequestRepository(RequestRepositoryInterface):
             if cursor_data.get("due_date"):
                 cursor_data["due_date"] = datetime.fromisoformat(cursor_data["due_date"])
             cursor_data["created_at"] = datetime.fromisoformat(cursor_data["created_at"])
+            # Cursors issued before the id tiebreaker resume at the first row of their position
+            cursor_data["id"] = UUID(cursor_data.get("id", str(UUID(int=0))))
 
             return cursor_data
-        except (ValueError, json.JSONDecodeError) as e:
+        except (ValueError, KeyError, json.JSONDecodeError) as e:
             exception_msg = "Invalid cursor"
             raise ValueError(exception_msg) from e
 
-    def _apply_cursor_filter(self, query, cursor_data):  # noqa
-        """Apply cursor filter using only date fields.
-
-        Since UUIDs are random, we accept that items with identical dates might have minor
-        pagination issues.
-        """
-        due_date = cursor_data["due_date"]
-        created_at = cursor_data["created_at"]
-
-        if due_date:
-            # Case 1: due_date is not NULL in cursor
-            condition = or_(
-                # Requests with later due_date (should come after)
-                Request.due_date > due_date,
-                # Requests with same due_date but newer created_at (should come after)
-                and_(Request.due_date == due_date, Request.created_at > created_at),
-                # Requests with NULL due_date (these come last)
-                Request.due_date.is_(None),
-            )
-        else:
-            # Case 2: cursor had NULL due_date (we're in the NULL section)
-            # Simply get requests with newer created_at
-            condition = Request.created_at > created_at
-
-        return query.filter(condition)
+    def _decode_search_cursor(self, cursor: str) -> dict[str, Any]:
+        """Decode a search results cursor: rank position."""
+        try:
+            cursor_data = json.loads(base64.b64decode(cursor.encode()).decode())
+            return {"rank": int(cursor_data["rank"]), "id": UUID(cursor_data["id"])}
+        except (ValueError, KeyError, TypeError, json.JSONDecodeError) as e:
+            exception_msg = "Invalid cursor"
+            raise ValueError(exception_msg) from e
@@ -2,10 +2,10 @@
 
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Self
+from typing import Any, Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, ValidationError, model_validator
 
 
 class RequestType(str, Enum):
@@ -118,6 +118,28 @@ class RequestCreate(BaseModel):
         return self
 
 
+def validate_request_batch(
+    records: list[Any],
+) -> tuple[list[tuple[int, RequestCreate]], list[dict[str, Any]]]:
+    """Validate many RequestCreate records, each one once.
+
+    Returns (index, request) of the valid records, and {"index", "error"} of the invalid ones:
+    an invalid record never fails the others.
+    """
+    valid: list[tuple[int, RequestCreate]] = []
+    errors: list[dict[str, Any]] = []
+    for index, record in enumerate(records):
+        try:
+            valid.append((index, RequestCreate.model_validate(record)))
+        except ValidationError as e:
+            msgs = []
+            for err in e.errors():
+                field = ".".join(map(str, err["loc"]))
+                msgs.append(f"{field}: {err['msg']}" if field else err["msg"])
+            errors.append({"index": index, "error": "; ".join(msgs)})
+    return valid, errors
+
+
 class BaseRequest(BaseModel):
     """Base schema for request responses with common fields."""
 
@@ -169,6 +191,19 @@ class RequestUpdate(BaseModel):
         return self
 
 
+# Most ids accepted by POST /v0/requests:batchGet
+MAX_BATCH_GET_IDS = 100
+
+# Most records accepted by POST /v0/requests:batchCreate
+MAX_BATCH_CREATE_RECORDS = 1000
+
+
+class RequestBatchGet(BaseModel):
+    """Schema for fetching several requests by id."""
+
+    ids: list[UUID] = Field(min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
 class LocationFilter(BaseModel):
     """Filter requests by geographic location and radius."""
 
@@ -185,3 +220,57 @@ class LocationFilter(BaseModel):
             exception_msg = "All of lat, lng, and radius_km must be provided together."
             raise ValueError(exception_msg)
         return self
+
+
+class DueDateFilter(BaseModel):
+    """Filter requests by due date: due_after <= due_date < due_before.
+
+    Expired requests (due date passed) are excluded unless `include_expired`. Requests
+    without due date only match when no bound is given.
+    """
+
+    due_after: datetime | None = None
+    due_before: datetime | None = None
+    include_expired: bool = False
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> Self:
+        """Ensure bounds are timezone-aware, stored in UTC, and make a non-empty window."""
+        for field in ("due_after", "due_before"):
+            value = getattr(self, field)
+            if value is None:
+                continue
+            if value.tzinfo is None:
+                exception_msg = f"{field} must be timezone-aware (UTC)"
+                raise ValueError(exception_msg)
+            # Dates are compared as stored: in UTC
+            setattr(self, field, value.astimezone(UTC))
+        if self.due_after and self.due_before and self.due_after >= self.due_before:
+            exception_msg = "due_after must be before due_before"
+            raise ValueError(exception_msg)
+        return self
+
+    @property
+    def includes_undated(self) -> bool:
+        """Whether requests without due date match."""
+        return self.due_after is None and self.due_before is None
+
+    def window(self, now: datetime) -> tuple[datetime | None, datetime | None]:
+        """Return the (from, until) due dates matched at `now`, each None when unbounded."""
+        due_from = self.due_after
+        if not self.include_expired and (due_from is None or due_from < now):
+            due_from = now
+        return due_from, self.due_before
+
+
+class RequestFilter(BaseModel):
+    """Filters of a requests listing, all optional.
+
+    `search` keeps the requests whose title or description contain some of its terms, best
+    matches first (instead of the feed order).
+    """
+
+    type: RequestType | None = None
+    location: LocationFilter | None = None
+    search: str | None = None
+    due: DueDateFilter = Field(default_factory=DueDateFilter)
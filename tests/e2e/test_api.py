@@ -206,10 +206,19 @@ class TestFavoritesCRUD:
             json={"request_id": request_for_favorite},
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 201
         data = response.json()
         assert "favorite_id" in data
 
+        # Favoriting again is idempotent
+        again = httpx.post(
+            f"{api_endpoint}/v0/favorites",
+            headers={**auth_headers, "Content-Type": "application/json"},
+            json={"request_id": request_for_favorite},
+        )
+        assert again.status_code == 200
+        assert again.json()["favorite_id"] == data["favorite_id"]
+
         # Cleanup
         httpx.delete(
             f"{api_endpoint}/v0/favorites/{data['favorite_id']}",
@@ -241,7 +250,7 @@ class TestFavoritesCRUD:
             headers={**auth_headers, "Content-Type": "application/json"},
             json={"request_id": request_for_favorite},
         )
-        assert create_response.status_code == 200
+        assert create_response.status_code == 201
         favorite_id = create_response.json()["favorite_id"]
 
         # Verify it appears in list
@@ -0,0 +1,120 @@
+"""Integration test fixtures - application code against a local SQLite database."""
+
+import os
+import tempfile
+import uuid
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+
+# NOTE: src.config reads the environment at import time, so it must be set before any
+# application module gets imported.
+_db_path = Path(tempfile.mkdtemp(prefix="nwassik-tests-")) / "nwassik.db"
+os.environ["RUN_ENV"] = "local"
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+os.environ.setdefault("STAGE", "test")
+os.environ.setdefault("BASE_DOMAIN", "http://localhost:3000")
+os.environ.setdefault("MAX_USER_CREATED_REQUESTS", "20")
+os.environ.setdefault("MAX_USER_CREATED_FAVORITES", "100")
+# Rate limiting has its own tests (test_rate_limit.py): off for the others
+os.environ.setdefault("RATE_LIMIT_READS_PER_S", "0")
+os.environ.setdefault("RATE_LIMIT_WRITES_PER_S", "0")
+
+from src.db.session import get_engine  # noqa: E402
+from src.models import favorite, quota, request, search  # noqa: E402, F401
+from src.models.base import Base  # noqa: E402
+from src.repositories import request_repository  # noqa: E402
+from src.repositories.request_repository import RequestRepository  # noqa: E402
+from src.schemas.request import RequestCreate, RequestType  # noqa: E402
+
+# Valid locations of each request type
+REQUEST_LOCATIONS = {
+    RequestType.BUY_AND_DELIVER: {"dropoff_latitude": 36.8, "dropoff_longitude": 10.1},
+    RequestType.PICKUP_AND_DELIVER: {
+        "pickup_latitude": 36.8,
+        "pickup_longitude": 10.1,
+        "dropoff_latitude": 36.9,
+        "dropoff_longitude": 10.2,
+    },
+    RequestType.ONLINE_SERVICE: {"meetup_latitude": 36.8, "meetup_longitude": 10.1},
+}
+
+
+@pytest.fixture(autouse=True)
+def database() -> Generator[Any, None, None]:
+    """Create a fresh schema for every test."""
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Generator[None, None, None]:
+    """Empty the request cache, which outlives the per-test schema."""
+    request_repository._request_cache.clear()  # noqa: SLF001
+    yield
+    request_repository._request_cache.clear()  # noqa: SLF001
+
+
+def create_request(
+    user_id: uuid.UUID,
+    request_type: RequestType = RequestType.ONLINE_SERVICE,
+) -> uuid.UUID:
+    """Create a request of the user, return its id."""
+    data = RequestCreate(
+        type=request_type,
+        title="title",
+        description="description",
+        **REQUEST_LOCATIONS[request_type],
+    )
+    return RequestRepository().create(user_id=user_id, input_request=data).id
+
+
+class StatementRecorder:
+    """Record executed statements and pool checkouts on the engine."""
+
+    def __init__(self) -> None:
+        """Start without any recorded statement or checkout."""
+        self.statements: list[str] = []
+        self.checkouts = 0
+
+    def count(self, prefix: str) -> int:
+        return sum(1 for statement in self.statements if statement.startswith(prefix))
+
+
+@pytest.fixture
+def recorder() -> Generator[StatementRecorder, None, None]:
+    """Record statements executed during the test."""
+    engine = get_engine()
+    recorder = StatementRecorder()
+
+    def before_cursor_execute(conn, cursor, statement, *args: Any) -> None:  # noqa: ANN001, ARG001
+        recorder.statements.append(statement.lstrip().upper())
+
+    def checkout(*args: Any) -> None:  # noqa: ARG001
+        recorder.checkouts += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.pool, "checkout", checkout)
+    yield recorder
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    event.remove(engine.pool, "checkout", checkout)
+
+
+@pytest.fixture
+def statements() -> Generator[list[tuple[str, Any]], None, None]:
+    """Record (statement, parameters) of every SELECT/UPDATE/DELETE executed."""
+    engine = get_engine()
+    recorded: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args: Any) -> None:  # noqa: ANN001, ARG001
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            recorded.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield recorded
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,105 @@
+"""POST /v0/requests:batchCreate tests."""
+
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.handlers.requests.batch_create import batch_create_requests
+from src.repositories import request_repository
+from src.repositories.request_repository import RequestRepository
+from src.schemas import request as request_schemas
+from src.schemas.request import MAX_BATCH_CREATE_RECORDS
+from tests.integration.conftest import StatementRecorder
+
+pytestmark = pytest.mark.integration
+
+QUOTA = 20  # MAX_USER_CREATED_REQUESTS of the integration tests environment
+
+
+def _record(i: int) -> dict:
+    return {
+        "type": "pickup_and_deliver",
+        "title": f"request {i}",
+        "description": "d",
+        "pickup_latitude": 36.8,
+        "pickup_longitude": 10.18,
+        "dropoff_latitude": 35.8,
+        "dropoff_longitude": 10.6,
+    }
+
+
+def _batch_create(user_id: uuid.UUID, records: object) -> tuple[int, dict]:
+    event = {
+        "requestContext": {"authorizer": {"jwt": {"claims": {"sub": str(user_id)}}}},
+        "body": json.dumps({"requests": records}),
+    }
+    response = batch_create_requests(event, None)
+    return response["statusCode"], json.loads(response["body"])
+
+
+def test_valid_records_are_created_invalid_ones_reported() -> None:
+    """Valid records are created, invalid ones are reported by index."""
+    user_id = uuid.uuid4()
+    records = [_record(0), {**_record(1), "meetup_latitude": 1}, _record(2), {"type": "x"}]
+
+    status, body = _batch_create(user_id, records)
+
+    assert status == 200
+    assert [item["index"] for item in body["created"]] == [0, 2]
+    assert [item["index"] for item in body["errors"]] == [1, 3]
+    assert "meetup_latitude" in body["errors"][0]["error"]
+
+    request = RequestRepository().get_by_id(uuid.UUID(body["created"][1]["request_id"]))
+    assert request.title == "request 2"
+    assert request.user_id == user_id
+    assert request.pickup_geohash.startswith("snx")
+
+
+def test_record_expiring_during_validation_is_reported(monkeypatch) -> None:  # noqa: ANN001
+    """A record expiring between two validations is only validated once."""
+    start = datetime.now(UTC)
+
+    class Clock(datetime):
+        calls = 0
+
+        @classmethod
+        def now(cls, tz=None) -> datetime:  # noqa: ANN001, ARG003
+            cls.calls += 1
+            return start + timedelta(hours=2 * (cls.calls - 1))
+
+    monkeypatch.setattr(request_schemas, "datetime", Clock)
+    # Due in 1 hour: valid when validated first, expired for any later validation
+    due_soon = {**_record(0), "due_date": (start + timedelta(hours=1)).isoformat()}
+
+    status, body = _batch_create(uuid.uuid4(), [due_soon, {"type": "x"}, _record(2)])
+
+    assert status == 200
+    assert [item["index"] for item in body["created"]] == [0, 2]
+    assert [item["index"] for item in body["errors"]] == [1]
+
+
+def test_records_over_quota_are_reported(recorder: StatementRecorder, monkeypatch) -> None:  # noqa: ANN001
+    """Records beyond the user's quota are reported, and no INSERT is made for them."""
+    monkeypatch.setattr(request_repository, "BULK_CREATE_CHUNK_SIZE", 8)
+    user_id = uuid.uuid4()
+    _batch_create(user_id, [_record(i) for i in range(5)])
+    recorder.statements.clear()
+
+    status, body = _batch_create(user_id, [_record(i) for i in range(20)])
+
+    assert status == 200
+    assert len(body["created"]) == QUOTA - 5
+    assert [item["index"] for item in body["errors"]] == list(range(QUOTA - 5, 20))
+    assert body["errors"][0]["error"] == "Too many requests created"
+    # Chunks of 8: 2 multi-row INSERTs (8 + 7 requests), nothing left for the 3rd chunk
+    assert recorder.count("INSERT INTO REQUESTS") == 2
+    assert len(RequestRepository().get_user_requests(user_id)) == QUOTA
+
+
+@pytest.mark.parametrize("records", [[], "x", [_record(0)] * (MAX_BATCH_CREATE_RECORDS + 1)])
+def test_batch_size_is_limited(records: object) -> None:
+    """An empty or too large batch is refused with a 400."""
+    status, _ = _batch_create(uuid.uuid4(), records)
+    assert status == 400
@@ -0,0 +1,76 @@
+"""POST /v0/requests:batchGet tests."""
+
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from src.handlers import main
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import MAX_BATCH_GET_IDS, RequestType
+from tests.integration.conftest import REQUEST_LOCATIONS, StatementRecorder, create_request
+
+pytestmark = pytest.mark.integration
+
+
+def _create_requests() -> list[uuid.UUID]:
+    return [create_request(uuid.uuid4(), request_type) for request_type in RequestType]
+
+
+def _batch_get(ids: list) -> tuple[int, dict]:
+    event = {
+        "requestContext": {"http": {"method": "POST"}},
+        "rawPath": "/v0/requests:batchGet",
+        "routeKey": "POST /v0/requests:batchGet",
+        "body": json.dumps({"ids": [str(request_id) for request_id in ids]}),
+    }
+    response = main.handler(event, SimpleNamespace(aws_request_id="test"))
+    return response["statusCode"], json.loads(response["body"])
+
+
+def test_batch_get_preserves_order_and_reports_missing(recorder: StatementRecorder) -> None:
+    """Requests are returned in the ids order with one SELECT, unknown ids listed apart."""
+    request_ids = _create_requests()
+    unknown = uuid.uuid4()
+    ids = [request_ids[2], unknown, request_ids[0], request_ids[1], request_ids[0]]
+    recorder.statements.clear()
+
+    status, body = _batch_get(ids)
+
+    assert status == 200
+    assert recorder.count("SELECT") == 1
+    assert [request["id"] for request in body["requests"]] == [
+        str(request_ids[2]),
+        str(request_ids[0]),
+        str(request_ids[1]),
+    ]
+    assert body["missing_ids"] == [str(unknown)]
+    pickup = REQUEST_LOCATIONS[RequestType.PICKUP_AND_DELIVER]
+    assert body["requests"][2]["pickup_latitude"] == pickup["pickup_latitude"]
+    online = REQUEST_LOCATIONS[RequestType.ONLINE_SERVICE]
+    assert body["requests"][0]["meetup_longitude"] == online["meetup_longitude"]
+
+
+def test_batch_get_shares_single_get_cache(recorder: StatementRecorder) -> None:
+    """Requests cached by single gets are not read again."""
+    request_ids = _create_requests()
+    repo = RequestRepository()
+    repo.get_by_id_cached(request_ids[0])
+    recorder.statements.clear()
+
+    _batch_get(request_ids)
+    assert recorder.count("SELECT") == 1  # only the 2 ids not cached yet
+
+    recorder.statements.clear()
+    assert repo.get_by_id_cached(request_ids[1]).id == request_ids[1]
+    _batch_get(request_ids)
+    assert recorder.count("SELECT") == 0
+
+
+@pytest.mark.parametrize("count", [0, MAX_BATCH_GET_IDS + 1])
+def test_batch_get_size_is_limited(count: int) -> None:
+    """An empty or too large list of ids is refused with a 400."""
+    status, body = _batch_get([uuid.uuid4() for _ in range(count)])
+    assert status == 400
+    assert "ids" in body["error"]
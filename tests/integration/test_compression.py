@@ -0,0 +1,77 @@
+"""Compressed responses through the Lambda entry point."""
+
+import base64
+import gzip
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from src.handlers import main
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestCreate, RequestType
+from tests.integration.conftest import create_request
+
+pytestmark = pytest.mark.integration
+
+
+def test_list_page_is_gzipped_and_sizes_logged(capsys: pytest.CaptureFixture) -> None:
+    """GET /v0/requests should be gzipped when accepted, sizes in the log line."""
+    repo = RequestRepository()
+    for i in range(20):
+        data = RequestCreate(
+            type=RequestType.ONLINE_SERVICE,
+            title=f"request {i}",
+            description="description",
+            meetup_latitude=36.8,
+            meetup_longitude=10.1,
+        )
+        repo.create(user_id=uuid.uuid4(), input_request=data)
+    event = {
+        "requestContext": {"http": {"method": "GET"}},
+        "rawPath": "/v0/requests",
+        "routeKey": "GET /v0/requests",
+        "headers": {"accept-encoding": "gzip"},
+        "queryStringParameters": {"limit": "20"},
+    }
+
+    capsys.readouterr()
+    response = main.handler(event, SimpleNamespace(aws_request_id="test"))
+    log_line = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+
+    assert response["statusCode"] == 200
+    assert response["headers"]["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(base64.b64decode(response["body"])))
+    assert len(body["requests"]) == 20
+    assert log_line["app_content_encoding"] == "gzip"
+    assert log_line["app_response_bytes"] < log_line["app_body_bytes"]
+    assert "app_compression_cpu_ms" in log_line
+
+
+def test_compressed_get_has_encoding_specific_etag() -> None:
+    """Compressed pages get their own ETag, and both tags revalidate."""
+    for _ in range(20):
+        create_request(uuid.uuid4())
+
+    def list_page(headers: dict) -> dict:
+        event = {
+            "requestContext": {"http": {"method": "GET"}},
+            "rawPath": "/v0/requests",
+            "routeKey": "GET /v0/requests",
+            "headers": headers,
+            "queryStringParameters": {"limit": "20"},
+        }
+        return main.handler(event, SimpleNamespace(aws_request_id="test"))
+
+    identity_etag = list_page({})["headers"]["ETag"]
+    gzipped = list_page({"accept-encoding": "gzip"})
+    assert gzipped["headers"]["Content-Encoding"] == "gzip"
+    gzip_etag = gzipped["headers"]["ETag"]
+    assert gzip_etag == identity_etag[:-1] + '-gzip"'
+
+    # The client's copy (identity or gzip) is revalidated with the tag it holds
+    for etag in (identity_etag, gzip_etag):
+        response = list_page({"accept-encoding": "gzip", "if-none-match": etag})
+        assert response["statusCode"] == 304
+        assert response["headers"]["ETag"] == etag
@@ -0,0 +1,168 @@
+"""DSQL concurrency conflicts retry tests, against a fault injecting local engine."""
+
+import json
+import sqlite3
+import uuid
+from collections.abc import Generator
+from types import SimpleNamespace
+
+import pytest
+
+from src.db import retry
+from src.db.session import get_engine
+from src.handlers import main
+from src.handlers.favorites.create import create_favorite
+from src.handlers.requests.update import update_request
+from src.lib import metrics, transactions
+from src.repositories.favorite_repository import FavoriteRepository
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestCreate, RequestType
+
+pytestmark = pytest.mark.integration
+
+REQUEST_DATA = RequestCreate(
+    type=RequestType.ONLINE_SERVICE,
+    title="title",
+    description="description",
+    meetup_latitude=36.8,
+    meetup_longitude=10.1,
+)
+
+
+class ConflictError(sqlite3.OperationalError):
+    """Driver error raised by DSQL when a transaction loses an optimistic concurrency race."""
+
+    sqlstate = "40001"
+
+    def __init__(self) -> None:
+        """Use the message of DSQL's optimistic concurrency conflicts."""
+        super().__init__("change conflicts with another transaction, please retry: (OC000)")
+
+
+class ConflictInjector:
+    """Fail the next commits / statements of the application engine with conflicts."""
+
+    def __init__(self) -> None:
+        """Start without any failure to inject."""
+        self.commits = 0
+        self.statements: dict[str, int] = {}  # Statement prefix: failures left
+
+    def do_commit(self, do_commit):  # noqa: ANN001, ANN201
+        def faulty(dbapi_connection) -> None:  # noqa: ANN001
+            if self.commits > 0:
+                self.commits -= 1
+                raise ConflictError
+            do_commit(dbapi_connection)
+
+        return faulty
+
+    def do_execute(self, do_execute):  # noqa: ANN001, ANN201
+        def faulty(cursor, statement, parameters, context=None) -> None:  # noqa: ANN001
+            for prefix, left in self.statements.items():
+                if left > 0 and statement.lstrip().upper().startswith(prefix):
+                    self.statements[prefix] -= 1
+                    raise ConflictError
+            do_execute(cursor, statement, parameters, context)
+
+        return faulty
+
+
+@pytest.fixture
+def conflicts(monkeypatch: pytest.MonkeyPatch) -> Generator[ConflictInjector, None, None]:
+    """Inject DSQL conflicts in the application engine commits and statements."""
+    dialect = get_engine().dialect
+    injector = ConflictInjector()
+    monkeypatch.setattr(dialect, "do_commit", injector.do_commit(dialect.do_commit))
+    monkeypatch.setattr(dialect, "do_execute", injector.do_execute(dialect.do_execute))
+    monkeypatch.setattr(retry, "backoff_s", lambda _: 0)
+    metrics.reset()
+    yield injector
+    metrics.reset()
+
+
+def _event(user_id: uuid.UUID, body: dict, request_id: uuid.UUID | None = None) -> dict:
+    return {
+        "requestContext": {"authorizer": {"jwt": {"claims": {"sub": str(user_id)}}}},
+        "pathParameters": {"request_id": str(request_id)},
+        "body": json.dumps(body),
+    }
+
+
+def test_commit_conflicts_are_retried(conflicts: ConflictInjector) -> None:
+    """A handler whose commit conflicts is run again, then succeeds."""
+    user_id = uuid.uuid4()
+    request_id = RequestRepository().create(user_id, REQUEST_DATA).id
+    conflicts.commits = 2
+
+    response = update_request(_event(user_id, {"title": "new title"}, request_id), None)
+
+    assert response["statusCode"] == 200
+    assert metrics.snapshot() == {"db_retries": 2}
+    request = RequestRepository().get_by_id(request_id)
+    assert request.title == "new title"
+    assert request.version == 2  # Updated once
+
+
+def test_statement_conflict_turned_into_error_response_is_retried(
+    conflicts: ConflictInjector,
+) -> None:
+    """A conflict caught by the handler (error response) is still retried."""
+    user_id = uuid.uuid4()
+    request_id = RequestRepository().create(uuid.uuid4(), REQUEST_DATA).id
+    conflicts.statements["INSERT INTO FAVORITES"] = 1
+
+    response = create_favorite(_event(user_id, {"request_id": str(request_id)}), None)
+
+    assert response["statusCode"] == 201
+    assert metrics.snapshot() == {"db_retries": 1}
+    assert len(FavoriteRepository().list_user_favorites(user_id)) == 1
+
+
+def test_retries_are_limited(conflicts: ConflictInjector) -> None:
+    """Conflicts outlasting the retries give a 409, without partial writes."""
+    user_id = uuid.uuid4()
+    request_id = RequestRepository().create(uuid.uuid4(), REQUEST_DATA).id
+    conflicts.commits = retry.MAX_ATTEMPTS
+
+    response = create_favorite(_event(user_id, {"request_id": str(request_id)}), None)
+
+    assert response["statusCode"] == 409
+    assert json.loads(response["body"])["error"] == transactions.CONFLICT_MESSAGE
+    assert metrics.snapshot() == {
+        "db_retries": retry.MAX_ATTEMPTS - 1,
+        "db_retries_exhausted": 1,
+    }
+    assert FavoriteRepository().list_user_favorites(user_id) == []
+
+
+def test_no_retry_past_lambda_deadline(conflicts: ConflictInjector) -> None:
+    """No retry is attempted when the Lambda is about to time out."""
+    user_id = uuid.uuid4()
+    request_id = RequestRepository().create(user_id, REQUEST_DATA).id
+    conflicts.commits = 1
+    context = SimpleNamespace(get_remaining_time_in_millis=lambda: retry.DEADLINE_MARGIN_MS - 1)
+
+    response = update_request(_event(user_id, {"title": "new title"}, request_id), context)
+
+    assert response["statusCode"] == 409
+    assert metrics.snapshot() == {"db_retries_exhausted": 1}
+
+
+def test_retries_are_logged(conflicts: ConflictInjector, capsys: pytest.CaptureFixture) -> None:
+    """Retries are counted in the invocation log line."""
+    user_id = uuid.uuid4()
+    request_id = RequestRepository().create(user_id, REQUEST_DATA).id
+    conflicts.commits = 1
+    event = {
+        **_event(user_id, {"title": "new title"}, request_id),
+        "rawPath": f"/v0/requests/{request_id}",
+        "routeKey": "PATCH /v0/requests/{request_id}",
+    }
+    event["requestContext"]["http"] = {"method": "PATCH"}
+    capsys.readouterr()
+
+    response = main.handler(event, SimpleNamespace(aws_request_id="test"))
+
+    assert response["statusCode"] == 200
+    log_line = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert log_line["app_db_retries"] == 1
@@ -0,0 +1,129 @@
+"""Due date filter tests for GET /v0/requests."""
+
+import json
+import uuid
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from src.db.session import get_engine
+from src.handlers.requests.list import list_requests
+from src.models.request import Request
+from src.models.search import RequestTerm
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import DueDateFilter, RequestCreate, RequestFilter, RequestType
+
+pytestmark = pytest.mark.integration
+
+NOW = datetime.now(UTC)
+
+
+def _create(
+    due_in_days: float | None,
+    r_type: RequestType = RequestType.ONLINE_SERVICE,
+    title: str = "request",
+) -> uuid.UUID:
+    coords = (
+        {"meetup_latitude": 36.8, "meetup_longitude": 10.18}
+        if r_type == RequestType.ONLINE_SERVICE
+        else {"dropoff_latitude": 36.8, "dropoff_longitude": 10.18}
+    )
+    data = RequestCreate(type=r_type, title=title, description="d", **coords)
+    request_id = RequestRepository().create(user_id=uuid.uuid4(), input_request=data).id
+    if due_in_days is not None:
+        # Set directly: past due dates are refused on create
+        due_date = NOW + timedelta(days=due_in_days)
+        with get_engine().begin() as conn:
+            conn.execute(update(Request).where(Request.id == request_id).values(due_date=due_date))
+            conn.execute(
+                update(RequestTerm)
+                .where(RequestTerm.request_id == request_id)
+                .values(due_date=due_date),
+            )
+    return request_id
+
+
+def _walk(**filters: object) -> list[uuid.UUID]:
+    """Ids of every page of 1 request."""
+    repo = RequestRepository()
+    seen, cursor = [], None
+    while True:
+        page = repo.list_of_requests(RequestFilter(**filters), limit=1, cursor=cursor)
+        seen.extend(request.id for request in page["requests"])
+        cursor = page["pagination"]["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+def _list(**params: str) -> tuple[int, dict]:
+    response = list_requests({"queryStringParameters": params}, None)
+    return response["statusCode"], json.loads(response["body"])
+
+
+def test_expired_requests_are_excluded_by_default() -> None:
+    """Expired requests are left out, unless include_expired."""
+    expired = _create(-1)
+    soon, later = _create(1), _create(30)
+    undated = _create(None)
+
+    assert _walk() == [soon, later, undated]
+    assert _walk(due=DueDateFilter(include_expired=True)) == [expired, soon, later, undated]
+
+
+def test_due_date_window_with_type_filter_and_pages() -> None:
+    """The due date window combines with the type filter, page after page."""
+    expired = _create(-1)
+    first = _create(2)
+    _create(3, RequestType.BUY_AND_DELIVER)
+    second = _create(4)
+    _create(10)
+    _create(None)
+
+    due = DueDateFilter(due_after=NOW + timedelta(days=1), due_before=NOW + timedelta(days=5))
+    assert _walk(due=due, type=RequestType.ONLINE_SERVICE) == [first, second]
+
+    # An expired lower bound is raised to now, unless expired requests are asked for
+    due = DueDateFilter(due_after=NOW - timedelta(days=3), due_before=NOW + timedelta(days=3))
+    assert _walk(due=due, type=RequestType.ONLINE_SERVICE) == [first]
+    due = DueDateFilter(
+        due_after=NOW - timedelta(days=3),
+        due_before=NOW + timedelta(days=3),
+        include_expired=True,
+    )
+    assert _walk(due=due, type=RequestType.ONLINE_SERVICE) == [expired, first]
+
+
+def test_search_applies_due_dates() -> None:
+    """Search results are filtered by due date too."""
+    _create(-1, title="insulin")
+    soon = _create(1, title="insulin")
+    later = _create(10, title="insulin")
+    undated = _create(None, title="insulin")
+
+    assert sorted(_walk(search="insulin")) == sorted([soon, later, undated])
+    due = DueDateFilter(due_before=NOW + timedelta(days=5))
+    assert _walk(search="insulin", due=due) == [soon]
+
+
+def test_handler_due_date_params() -> None:
+    """GET /v0/requests should validate and apply the due date params."""
+    soon = _create(1)
+    _create(10)
+    _create(None)
+
+    status, body = _list(due_before=(NOW + timedelta(days=5)).isoformat())
+    assert status == 200
+    assert [r["id"] for r in body["requests"]] == [str(soon)]
+
+    # Bounds are compared in UTC whatever their offset
+    due_before = (NOW + timedelta(days=1, hours=1)).astimezone(timezone(timedelta(hours=-5)))
+    status, body = _list(due_before=due_before.isoformat())
+    assert [r["id"] for r in body["requests"]] == [str(soon)]
+
+    status, body = _list(due_before="2030-01-01T00:00:00")
+    assert status == 400
+    assert "timezone-aware" in body["error"]
+
+    status, _ = _list(due_after="2030-01-02T00:00:00Z", due_before="2030-01-01T00:00:00Z")
+    assert status == 400
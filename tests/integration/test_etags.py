@@ -0,0 +1,92 @@
+"""ETag / If-None-Match tests for GET /v0/requests and GET /v0/requests/{request_id}."""
+
+import json
+import uuid
+
+import pytest
+
+from src.handlers.requests.get import get_request
+from src.handlers.requests.list import list_requests
+from src.handlers.requests.update import update_request
+from tests.integration.conftest import StatementRecorder, create_request
+
+pytestmark = pytest.mark.integration
+
+
+def _get(request_id: uuid.UUID, etag: str | None = None) -> dict:
+    return get_request(
+        {
+            "pathParameters": {"request_id": str(request_id)},
+            "headers": {"if-none-match": etag} if etag else {},
+        },
+        None,
+    )
+
+
+def _list(etag: str | None = None) -> dict:
+    return list_requests(
+        {
+            "queryStringParameters": {"limit": "2"},
+            "headers": {"if-none-match": etag} if etag else {},
+        },
+        None,
+    )
+
+
+def _update(user_id: uuid.UUID, request_id: uuid.UUID, title: str) -> None:
+    response = update_request(
+        {
+            "requestContext": {"authorizer": {"jwt": {"claims": {"sub": str(user_id)}}}},
+            "pathParameters": {"request_id": str(request_id)},
+            "body": json.dumps({"title": title}),
+        },
+        None,
+    )
+    assert response["statusCode"] == 200
+
+
+def test_single_request_not_modified(recorder: StatementRecorder) -> None:
+    """GET /v0/requests/{id} should answer 304 to a matching If-None-Match."""
+    user_id = uuid.uuid4()
+    request_id = create_request(user_id)
+    response = _get(request_id)
+    etag = response["headers"]["ETag"]
+    assert response["statusCode"] == 200
+
+    recorder.statements.clear()
+    response = _get(request_id, etag=f'W/{etag}, "other"')
+
+    assert response["statusCode"] == 304
+    assert response["body"] == ""
+    assert response["headers"]["ETag"] == etag
+    assert recorder.count("SELECT") == 1
+    assert recorder.statements[-1].startswith("SELECT REQUESTS.VERSION \nFROM")  # version only
+
+    _update(user_id, request_id, "new title")
+    response = _get(request_id, etag=etag)
+    assert response["statusCode"] == 200
+    assert response["headers"]["ETag"] != etag
+    assert json.loads(response["body"])["request"]["title"] == "new title"
+
+
+def test_unknown_request_with_if_none_match_is_not_found() -> None:
+    """An unknown request is a 404, whatever the If-None-Match."""
+    assert _get(uuid.uuid4(), etag='"whatever"')["statusCode"] == 404
+
+
+def test_list_page_not_modified_until_one_of_its_requests_changes() -> None:
+    """A page is not modified until one of its own requests is updated."""
+    user_id = uuid.uuid4()
+    request_ids = [create_request(user_id) for _ in range(3)]
+    etag = _list()["headers"]["ETag"]
+
+    assert _list(etag=etag)["statusCode"] == 304
+
+    # Not on the first page: still not modified
+    _update(user_id, request_ids[2], "new title")
+    assert _list(etag=etag)["statusCode"] == 304
+
+    _update(user_id, request_ids[0], "new title")
+    response = _list(etag=etag)
+    assert response["statusCode"] == 200
+    assert response["headers"]["ETag"] != etag
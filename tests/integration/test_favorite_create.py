@@ -0,0 +1,60 @@
+"""POST /v0/favorites tests: single statement, idempotent creation."""
+
+import json
+import uuid
+
+import pytest
+
+from src.handlers.favorites.create import create_favorite
+from src.repositories.favorite_repository import FavoriteRepository
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestCreate, RequestType
+from tests.integration.conftest import StatementRecorder
+
+pytestmark = pytest.mark.integration
+
+REQUEST_DATA = RequestCreate(
+    type=RequestType.ONLINE_SERVICE,
+    title="Netflix",
+    description="subscription",
+    meetup_latitude=36.8,
+    meetup_longitude=10.1,
+)
+
+
+def _create_favorite(user_id: uuid.UUID, request_id: uuid.UUID) -> tuple[int, dict]:
+    event = {
+        "requestContext": {"authorizer": {"jwt": {"claims": {"sub": str(user_id)}}}},
+        "body": json.dumps({"request_id": str(request_id)}),
+    }
+    response = create_favorite(event, None)
+    return response["statusCode"], json.loads(response["body"])
+
+
+def test_create_then_create_again(recorder: StatementRecorder) -> None:
+    """Creating a favorite twice returns the existing one (200) the second time."""
+    user_id = uuid.uuid4()
+    request_id = RequestRepository().create(uuid.uuid4(), REQUEST_DATA).id
+    recorder.statements.clear()
+
+    status, body = _create_favorite(user_id, request_id)
+
+    assert status == 201
+    # Request existence checked by the INSERT itself, no SELECT before it
+    assert recorder.statements[0].startswith("INSERT INTO FAVORITES")
+    assert "ON CONFLICT" in recorder.statements[0]
+
+    status, again = _create_favorite(user_id, request_id)
+    assert status == 200
+    assert again["favorite_id"] == body["favorite_id"]
+    assert len(FavoriteRepository().list_user_favorites(user_id)) == 1
+
+
+def test_create_for_missing_request() -> None:
+    """Favoriting an unknown request is a 404."""
+    user_id = uuid.uuid4()
+
+    status, _ = _create_favorite(user_id, uuid.uuid4())
+
+    assert status == 404
+    assert FavoriteRepository().list_user_favorites(user_id) == []
@@ -0,0 +1,92 @@
+"""GET /v0/favorites?include=request tests."""
+
+import json
+import uuid
+
+import pytest
+from sqlalchemy import delete
+
+from src.db.session import get_db_session
+from src.handlers.favorites.list import list_user_favorites
+from src.models.request import Request
+from src.repositories.favorite_repository import FavoriteRepository
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestCreate, RequestType
+from tests.integration.conftest import StatementRecorder
+
+pytestmark = pytest.mark.integration
+
+
+def _create_request(r_type: RequestType, **coords: float) -> uuid.UUID:
+    data = RequestCreate(type=r_type, title=r_type.value, description="d", **coords)
+    return RequestRepository().create(uuid.uuid4(), data).id
+
+
+def _list(user_id: uuid.UUID, include: str | None) -> dict:
+    event = {
+        "requestContext": {"authorizer": {"jwt": {"claims": {"sub": str(user_id)}}}},
+        "queryStringParameters": {"include": include} if include else None,
+    }
+    response = list_user_favorites(event, None)
+    assert response["statusCode"] == 200
+    return json.loads(response["body"])
+
+
+def test_include_request_embeds_requests_in_one_batch(recorder: StatementRecorder) -> None:
+    """include=request embeds the requests, read in one batch."""
+    user_id = uuid.uuid4()
+    request_ids = [
+        _create_request(RequestType.BUY_AND_DELIVER, dropoff_latitude=1, dropoff_longitude=2),
+        _create_request(
+            RequestType.PICKUP_AND_DELIVER,
+            pickup_latitude=1,
+            pickup_longitude=2,
+            dropoff_latitude=3,
+            dropoff_longitude=4,
+        ),
+        _create_request(RequestType.ONLINE_SERVICE, meetup_latitude=1, meetup_longitude=2),
+    ]
+    for request_id in request_ids:
+        FavoriteRepository().create(user_id, request_id)
+
+    recorder.statements.clear()
+    favorites = FavoriteRepository().list_user_favorites(user_id, include_request=True)
+    assert recorder.count("SELECT") == 2  # favorites + one batch of requests
+    assert {favorite.request.id for favorite in favorites} == set(request_ids)
+
+    recorder.statements.clear()
+    data = _list(user_id, "request")
+
+    assert recorder.count("SELECT") == 1  # handler reads rows: requests are LEFT JOINed
+    embedded = {fav["request_id"]: fav["request"] for fav in data["favorites"]}
+    assert set(embedded) == {str(request_id) for request_id in request_ids}
+    assert embedded[str(request_ids[1])]["pickup_latitude"] == 1
+    assert embedded[str(request_ids[2])]["meetup_longitude"] == 2
+
+
+def test_include_request_with_deleted_request() -> None:
+    """A favorite of a deleted request has a null request."""
+    user_id = uuid.uuid4()
+    request_id = _create_request(
+        RequestType.BUY_AND_DELIVER,
+        dropoff_latitude=1,
+        dropoff_longitude=2,
+    )
+    FavoriteRepository().create(user_id, request_id)
+    # Row removed without ORM cascade, as DSQL would leave it (no FK enforcement)
+    with get_db_session() as db:
+        db.execute(delete(Request.__table__).where(Request.id == request_id))
+
+    (favorite,) = _list(user_id, "request")["favorites"]
+    assert favorite["request_id"] == str(request_id)
+    assert favorite["request"] is None
+
+
+def test_without_include_only_ids_are_returned() -> None:
+    """Without include, favorites only have the request id."""
+    user_id = uuid.uuid4()
+    request_id = _create_request(RequestType.ONLINE_SERVICE, meetup_latitude=1, meetup_longitude=2)
+    FavoriteRepository().create(user_id, request_id)
+
+    (favorite,) = _list(user_id, None)["favorites"]
+    assert "request" not in favorite
@@ -0,0 +1,125 @@
+"""Geo radius search tests for GET /v0/requests."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.lib.geo import covering_cells, encode_geohash, geohash_prefix_range, haversine_km
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import LocationFilter, RequestCreate, RequestFilter, RequestType
+
+pytestmark = pytest.mark.integration
+
+TUNIS = (36.8065, 10.1815)
+SOUSSE = (35.8256, 10.6084)  # ~140km from Tunis
+PARIS = (48.8566, 2.3522)
+
+
+def _create(repo: RequestRepository, r_type: RequestType, **coords: float) -> uuid.UUID:
+    data = RequestCreate(
+        type=r_type,
+        title=f"{r_type.value} request",
+        description="test",
+        due_date=datetime.now(UTC) + timedelta(days=10),
+        **coords,
+    )
+    return repo.create(user_id=uuid.uuid4(), input_request=data).id
+
+
+def test_encode_geohash_known_value() -> None:
+    """Geohash of a reference point."""
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_covering_cells_contain_every_point_in_radius() -> None:
+    """Every point within the radius is in one of the covering cells."""
+    lat, lng, radius = TUNIS[0], TUNIS[1], 25.0
+    cells = covering_cells(lat, lng, radius)
+    assert cells
+    for d_lat in (-0.2, -0.1, 0.0, 0.1, 0.2):
+        for d_lng in (-0.25, -0.1, 0.0, 0.1, 0.25):
+            p_lat, p_lng = lat + d_lat, lng + d_lng
+            if haversine_km(lat, lng, p_lat, p_lng) > radius:
+                continue
+            geohash = encode_geohash(p_lat, p_lng)
+            assert any(start <= geohash < end for start, end in map(geohash_prefix_range, cells))
+
+
+def test_covering_cells_across_antimeridian() -> None:
+    """Covering cells wrap around the antimeridian."""
+    cells = covering_cells(0.0, 179.99, 50)
+    assert encode_geohash(0.0, -179.9)[: len(cells[0])] in cells
+    assert encode_geohash(0.0, 179.9)[: len(cells[0])] in cells
+
+
+def test_list_requests_within_radius() -> None:
+    """Only requests with a point within the radius are listed."""
+    repo = RequestRepository()
+    near_buy = _create(
+        repo,
+        RequestType.BUY_AND_DELIVER,
+        dropoff_latitude=TUNIS[0] + 0.01,
+        dropoff_longitude=TUNIS[1],
+    )
+    near_pickup = _create(
+        repo,
+        RequestType.PICKUP_AND_DELIVER,
+        pickup_latitude=PARIS[0],
+        pickup_longitude=PARIS[1],
+        dropoff_latitude=TUNIS[0],
+        dropoff_longitude=TUNIS[1] + 0.02,
+    )
+    _create(
+        repo,
+        RequestType.ONLINE_SERVICE,
+        meetup_latitude=SOUSSE[0],
+        meetup_longitude=SOUSSE[1],
+    )
+
+    location = LocationFilter(lat=TUNIS[0], lng=TUNIS[1], radius_km=10)
+    result = repo.list_of_requests(RequestFilter(location=location))
+    assert {r.id for r in result["requests"]} == {near_buy, near_pickup}
+
+    result = repo.list_of_requests(
+        RequestFilter(type=RequestType.BUY_AND_DELIVER, location=location),
+    )
+    assert [r.id for r in result["requests"]] == [near_buy]
+
+    location = LocationFilter(lat=TUNIS[0], lng=TUNIS[1], radius_km=200)
+    assert len(repo.list_of_requests(RequestFilter(location=location))["requests"]) == 3
+
+
+def test_list_requests_within_radius_paginates_through_refined_rows() -> None:
+    """Pages skip prefiltered candidates that are out of the radius."""
+    repo = RequestRepository()
+    expected = set()
+    for i in range(7):
+        # Points alternate between just inside and just outside the radius, and are close
+        # enough to share the same prefilter cells
+        inside = i % 2 == 0
+        request_id = _create(
+            repo,
+            RequestType.BUY_AND_DELIVER,
+            dropoff_latitude=TUNIS[0] + (0.04 if inside else 0.06),
+            dropoff_longitude=TUNIS[1],
+        )
+        if inside:
+            expected.add(request_id)
+
+    location = LocationFilter(lat=TUNIS[0], lng=TUNIS[1], radius_km=5)
+    seen = []
+    cursor = None
+    while True:
+        result = repo.list_of_requests(
+            RequestFilter(location=location),
+            limit=1,
+            cursor=cursor,
+        )
+        seen.extend(r.id for r in result["requests"])
+        cursor = result["pagination"]["next_cursor"]
+        if not result["pagination"]["has_more"]:
+            break
+
+    assert len(seen) == len(expected)
+    assert set(seen) == expected
@@ -0,0 +1,93 @@
+"""Per invocation timings logged in Embedded Metric Format by the Lambda entry point."""
+
+import json
+import os
+import uuid
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+
+from src import config
+from src.db import session
+from src.handlers import main
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestCreate, RequestType
+
+pytestmark = pytest.mark.integration
+
+
+def _invoke(event: dict, capsys: pytest.CaptureFixture) -> dict:
+    capsys.readouterr()
+    main.handler(event, SimpleNamespace(aws_request_id="test"))
+    return json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+
+
+def test_log_line_is_an_emf_document(capsys: pytest.CaptureFixture, monkeypatch) -> None:  # noqa: ANN001
+    """The invocation log line is an EMF document with the phase timings."""
+    RequestRepository().create(
+        user_id=uuid.uuid4(),
+        input_request=RequestCreate(
+            type=RequestType.ONLINE_SERVICE,
+            title="request",
+            description="description",
+            meetup_latitude=36.8,
+            meetup_longitude=10.1,
+        ),
+    )
+    monkeypatch.setattr(main, "_init_ms", 123.456)  # First invocation of the container
+    event = {
+        "requestContext": {"http": {"method": "GET"}},
+        "rawPath": "/v0/requests",
+        "queryStringParameters": {"lat": "36.8", "lng": "10.1"},
+    }
+
+    log_line = _invoke(event, capsys)
+
+    for phase in ("db", "db_commit", "validation", "serialization"):
+        assert log_line[f"app_{phase}_ms"] >= 0
+    assert (log_line["route"], log_line["status"], log_line["cold_start"]) == (
+        "list_requests",
+        "200",
+        "true",
+    )
+    assert log_line["app_init_ms"] == 123.46
+    timings, init = log_line["_aws"]["CloudWatchMetrics"]
+    assert timings["Dimensions"] == [["route", "status", "cold_start"]]
+    names = {metric["Name"] for metric in timings["Metrics"]}
+    assert {"app_duration_ms", "app_db_ms", "app_validation_ms", "app_serialization_ms"} <= names
+    assert "app_init_ms" not in names
+    assert all(isinstance(log_line[name], float | int) for name in names)
+    assert init["Dimensions"] == [[]]
+    assert init["Metrics"] == [{"Name": "app_init_ms", "Unit": "Milliseconds"}]
+
+    # Next invocations of the container are warm
+    log_line = _invoke(event, capsys)
+    assert log_line["cold_start"] == "false"
+    assert "app_init_ms" not in log_line
+    assert len(log_line["_aws"]["CloudWatchMetrics"]) == 1
+
+
+def test_secret_fetch_is_timed_apart_from_db_init(
+    capsys: pytest.CaptureFixture,
+    monkeypatch,  # noqa: ANN001
+) -> None:
+    """The database secret fetch has its own metric, part of db_init."""
+    # Cold container in cloud: the database secret is still being fetched in background
+    secret: Future = Future()
+    secret.set_result({"DATABASE_URL": os.environ["DATABASE_URL"]})
+    monkeypatch.setattr(config, "_database_secret", secret)
+    monkeypatch.delattr(config, "DATABASE_URL", raising=False)
+    monkeypatch.setattr(session, "_engine", None)
+    event = {"requestContext": {"http": {"method": "GET"}}, "rawPath": "/v0/requests"}
+
+    log_line = _invoke(event, capsys)
+
+    assert "app_secret_fetch_ms" in log_line
+    assert log_line["app_db_init_ms"] >= log_line["app_secret_fetch_ms"]
+    metric_names = {
+        metric["Name"]
+        for directive in log_line["_aws"]["CloudWatchMetrics"]
+        for metric in directive["Metrics"]
+    }
+    assert {"app_secret_fetch_ms", "app_db_init_ms"} <= metric_names
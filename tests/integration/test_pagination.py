@@ -0,0 +1,118 @@
+"""Keyset pagination tests for GET /v0/requests."""
+
+import base64
+import json
+import os
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from src.db.session import get_engine
+from src.models.request import OnlineServiceRequest, Request
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import DueDateFilter, RequestFilter, RequestType
+
+pytestmark = pytest.mark.integration
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _seed(rows: int, distinct_dates: int, undated_every: int = 0) -> set[uuid.UUID]:
+    """Insert online service requests sharing few (due_date, created_at) values."""
+    ids = set()
+    engine = get_engine()
+    with engine.begin() as conn:
+        for start in range(0, rows, 10_000):
+            chunk = []
+            for i in range(start, min(start + 10_000, rows)):
+                undated = undated_every and i % undated_every == 0
+                chunk.append({
+                    "id": uuid.uuid4(),
+                    "user_id": uuid.uuid4(),
+                    "type": RequestType.ONLINE_SERVICE,
+                    "title": f"request {i}",
+                    "due_date": None if undated else NOW + timedelta(days=i % distinct_dates),
+                    "created_at": NOW - timedelta(seconds=i % distinct_dates),
+                })
+            conn.execute(insert(Request), chunk)
+            conn.execute(
+                insert(OnlineServiceRequest.__table__),
+                [
+                    {
+                        "request_id": row["id"],
+                        "meetup_latitude": 36.8,
+                        "meetup_longitude": 10.18,
+                        "meetup_geohash": "snk",
+                    }
+                    for row in chunk
+                ],
+            )
+            ids.update(row["id"] for row in chunk)
+    return ids
+
+
+def _walk(repo: RequestRepository, limit: int, **filters: str) -> tuple[list, list[float]]:
+    seen, page_ms, cursor = [], [], None
+    while True:
+        start = time.perf_counter()
+        # Seeded due dates are fixed, in the past by now
+        page = repo.list_of_requests(
+            limit=limit,
+            cursor=cursor,
+            filters=RequestFilter(due=DueDateFilter(include_expired=True), **filters),
+        )
+        page_ms.append((time.perf_counter() - start) * 1000)
+        seen.extend(page["requests"])
+        cursor = page["pagination"]["next_cursor"]
+        if not page["pagination"]["has_more"]:
+            return seen, page_ms
+
+
+@pytest.mark.parametrize("request_type", [None, RequestType.ONLINE_SERVICE.value])
+def test_pagination_with_tied_dates_has_no_gaps_or_duplicates(request_type: str | None) -> None:
+    """Pages return every request once, in feed order, despite equal dates."""
+    # 3 distinct dates for 100 rows: pages boundaries fall inside runs of equal dates
+    ids = _seed(100, distinct_dates=3, undated_every=7)
+
+    requests, _ = _walk(RequestRepository(), limit=6, type=request_type)
+
+    returned = [request.id for request in requests]
+    assert len(returned) == len(set(returned))
+    assert set(returned) == ids
+
+    # Feed order: due_date ASC with undated requests last, then created_at, then id
+    keys = [(r.due_date is None, r.due_date or NOW, r.created_at, r.id) for r in requests]
+    assert keys == sorted(keys)
+
+
+def test_cursor_without_id_is_still_accepted() -> None:
+    """Cursors made before the id was part of them are still accepted."""
+    repo = RequestRepository()
+    payload = {"due_date": NOW.isoformat(), "created_at": NOW.isoformat()}
+    legacy_cursor = base64.b64encode(json.dumps(payload).encode()).decode()
+    assert repo._decode_cursor(legacy_cursor)["id"] == uuid.UUID(int=0)  # noqa: SLF001
+
+
+@pytest.mark.skipif(
+    os.environ.get("RUN_SCALE_TESTS") != "1",
+    reason="Scale test: set RUN_SCALE_TESTS=1 (and optionally SCALE_TEST_ROWS)",
+)
+def test_walk_large_feed_with_flat_page_latency() -> None:
+    """Last pages of a large feed are as fast as the first ones."""
+    rows = int(os.environ.get("SCALE_TEST_ROWS", "1000000"))
+    ids = _seed(rows, distinct_dates=1000, undated_every=50)
+
+    requests, page_ms = _walk(RequestRepository(), limit=100)
+
+    returned = {request.id for request in requests}
+    assert len(returned) == len(requests) == rows
+    assert returned == ids
+
+    # Keyset pages cost the same at any depth (OFFSET pages grow linearly)
+    decile = max(1, len(page_ms) // 10)
+    first = sorted(page_ms[:decile])[decile // 2]
+    last = sorted(page_ms[-decile:])[decile // 2]
+    assert last < first * 3
@@ -0,0 +1,191 @@
+"""Every repository query must be served by an index (EXPLAIN QUERY PLAN on SQLite)."""
+
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from src.db.session import get_db_session, get_engine
+from src.models.base import Base
+from src.repositories.favorite_repository import FavoriteRepository
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import (
+    DueDateFilter,
+    LocationFilter,
+    RequestCreate,
+    RequestFilter,
+    RequestType,
+)
+
+pytestmark = pytest.mark.integration
+
+TUNIS = (36.8065, 10.1815)
+
+
+def _full_scans(recorded: list[tuple[str, Any]]) -> list[str]:
+    """Return plan lines reading a whole table (SCAN without index).
+
+    Scans of subquery results (e.g search ranks, bounded by construction) are not reported.
+    """
+    scans = []
+    with get_engine().connect() as conn:
+        for statement, parameters in recorded:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            scans.extend(
+                f"{detail}  <-  {statement.split()[:8]}"
+                for *_, detail in plan
+                if detail.startswith("SCAN ")
+                and " USING " not in detail
+                and detail.split()[1] in Base.metadata.tables
+            )
+    return scans
+
+
+def _plan(statement: str, parameters: Any) -> list[str]:
+    with get_engine().connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [detail for *_, detail in plan]
+
+
+def _seed() -> tuple[uuid.UUID, uuid.UUID, uuid.UUID]:
+    requests, favorites = RequestRepository(), FavoriteRepository()
+    user_id = uuid.uuid4()
+    request_ids = []
+    for day in range(3):
+        common = {
+            "title": "parcel",
+            "description": "d",
+            "due_date": datetime.now(UTC) + timedelta(days=day + 1),
+        }
+        request_ids += [
+            requests.create(
+                user_id,
+                RequestCreate(
+                    type=RequestType.BUY_AND_DELIVER,
+                    dropoff_latitude=TUNIS[0],
+                    dropoff_longitude=TUNIS[1],
+                    **common,
+                ),
+            ).id,
+            requests.create(
+                user_id,
+                RequestCreate(
+                    type=RequestType.ONLINE_SERVICE,
+                    meetup_latitude=TUNIS[0],
+                    meetup_longitude=TUNIS[1],
+                    **common,
+                ),
+            ).id,
+        ]
+    favorite, _ = favorites.create(user_id, request_ids[0])
+    return user_id, request_ids[1], favorite.id
+
+
+def _list_page_two(as_rows: bool = False, **filters: Any) -> None:  # noqa: FBT001, FBT002
+    repo = RequestRepository()
+    page = repo.list_of_requests(RequestFilter(**filters), limit=1, as_rows=as_rows)
+    repo.list_of_requests(
+        RequestFilter(**filters),
+        limit=1,
+        cursor=page["pagination"]["next_cursor"],
+        as_rows=as_rows,
+    )
+
+
+QUERIES: dict[str, Callable[[uuid.UUID, uuid.UUID, uuid.UUID], object]] = {
+    "create_request": lambda user_id, *_: RequestRepository().create(
+        user_id,
+        RequestCreate(
+            type=RequestType.ONLINE_SERVICE,
+            title="t",
+            description="d",
+            meetup_latitude=1,
+            meetup_longitude=2,
+        ),
+    ),
+    "get_by_id": lambda _, request_id, __: RequestRepository().get_by_id(request_id),
+    "get_version": lambda _, request_id, __: RequestRepository().get_version(request_id),
+    "get_user_requests": lambda user_id, *_: RequestRepository().get_user_requests(user_id),
+    "list_of_requests": lambda *_: _list_page_two(),
+    "list_of_requests_by_type": lambda *_: _list_page_two(type="online_service"),
+    "list_of_requests_by_location": lambda *_: _list_page_two(
+        type="online_service",
+        location=LocationFilter(lat=TUNIS[0], lng=TUNIS[1], radius_km=5),
+    ),
+    "list_of_requests_as_rows": lambda *_: _list_page_two(as_rows=True),
+    "list_of_requests_by_due_date": lambda *_: _list_page_two(
+        due=DueDateFilter(due_before=datetime.now(UTC) + timedelta(days=3)),
+    ),
+    "list_of_requests_by_type_and_due_date": lambda *_: _list_page_two(
+        type="online_service",
+        due=DueDateFilter(
+            due_after=datetime.now(UTC) + timedelta(days=1),
+            due_before=datetime.now(UTC) + timedelta(days=5),
+        ),
+    ),
+    "search_requests": lambda *_: _list_page_two(search="parcel delivery", as_rows=True),
+    "search_requests_by_type_and_location": lambda *_: _list_page_two(
+        search="parcel",
+        due=DueDateFilter(due_before=datetime.now(UTC) + timedelta(days=5)),
+        type="online_service",
+        location=LocationFilter(lat=TUNIS[0], lng=TUNIS[1], radius_km=5),
+    ),
+    "get_user_requests_as_rows": lambda user_id, *_: RequestRepository().get_user_requests(
+        user_id,
+        as_rows=True,
+    ),
+    "delete_request": lambda _, request_id, __: RequestRepository().delete(request_id),
+    "create_favorite": lambda user_id, request_id, _: FavoriteRepository().create(
+        user_id,
+        request_id,
+    ),
+    "get_favorite": lambda _, __, favorite_id: FavoriteRepository().get_by_id(favorite_id),
+    "list_user_favorites": lambda user_id, *_: FavoriteRepository().list_user_favorites(
+        user_id,
+        include_request=True,
+    ),
+    "list_user_favorites_as_rows": lambda user_id, *_: FavoriteRepository().list_user_favorites(
+        user_id,
+        include_request=True,
+        as_rows=True,
+    ),
+    "delete_favorite": lambda _, __, favorite_id: FavoriteRepository().delete(favorite_id),
+}
+
+
+@pytest.mark.parametrize("name", QUERIES)
+def test_repository_queries_use_indexes(name: str, statements: list[tuple[str, Any]]) -> None:
+    """Repository queries never scan a whole table."""
+    user_id, request_id, favorite_id = _seed()
+    statements.clear()
+
+    with get_db_session():
+        QUERIES[name](user_id, request_id, favorite_id)
+
+    assert statements
+    assert _full_scans(statements) == []
+
+
+@pytest.mark.parametrize("request_type", [None, "online_service"])
+def test_location_candidates_come_from_geohash_indexes(
+    request_type: str | None,
+    statements: list[tuple[str, Any]],
+) -> None:
+    """Radius search candidates are read from the geohash indexes."""
+    _seed()
+    statements.clear()
+
+    RequestRepository().list_of_requests(
+        RequestFilter(
+            type=request_type,
+            location=LocationFilter(lat=TUNIS[0], lng=TUNIS[1], radius_km=5),
+        ),
+    )
+
+    (statement, parameters), *_ = statements
+    plan = _plan(statement, parameters)
+    assert any("_geohash (" in detail for detail in plan)
+    # Requests are looked up by the candidates ids, the feed is not walked
+    assert not any(" ix_requests_" in detail and "_feed " in detail for detail in plan)
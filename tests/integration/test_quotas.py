@@ -0,0 +1,126 @@
+"""Per user quota tests for requests and favorites."""
+
+import uuid
+
+import pytest
+from sqlalchemy import delete
+
+from src.db.session import get_db_session
+from src.models.quota import QuotaKind, UserQuota
+from src.repositories.favorite_repository import FavoriteRepository
+from src.repositories.quota_repository import (
+    QUOTA_LIMITS,
+    QuotaExceededError,
+    QuotaRepository,
+)
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestCreate, RequestType
+
+pytestmark = pytest.mark.integration
+
+REQUEST_DATA = RequestCreate(
+    type=RequestType.ONLINE_SERVICE,
+    title="Netflix",
+    description="subscription",
+    meetup_latitude=36.8,
+    meetup_longitude=10.1,
+)
+
+
+def _used(user_id: uuid.UUID, kind: QuotaKind) -> int | None:
+    with get_db_session() as db:
+        quota = db.get(UserQuota, (user_id, kind.value))
+        return quota.used if quota else None
+
+
+def test_request_quota_enforced_and_released() -> None:
+    """Requests beyond the quota are refused, and deletes free quota."""
+    repo = RequestRepository()
+    user_id = uuid.uuid4()
+    limit = QUOTA_LIMITS[QuotaKind.REQUESTS]
+    requests = [repo.create(user_id, REQUEST_DATA) for _ in range(limit)]
+
+    with pytest.raises(QuotaExceededError, match="Too many requests created"):
+        repo.create(user_id, REQUEST_DATA)
+    assert len(repo.get_user_requests(user_id)) == limit
+
+    repo.delete(requests[0].id)
+    assert _used(user_id, QuotaKind.REQUESTS) == limit - 1
+    repo.create(user_id, REQUEST_DATA)
+
+
+def test_missing_counter_is_initialized_from_existing_items() -> None:
+    """A missing counter starts from the user's existing requests."""
+    repo = RequestRepository()
+    user_id = uuid.uuid4()
+    for _ in range(3):
+        repo.create(user_id, REQUEST_DATA)
+    with get_db_session() as db:
+        db.execute(delete(UserQuota))
+
+    repo.create(user_id, REQUEST_DATA)
+    assert _used(user_id, QuotaKind.REQUESTS) == 4
+
+
+def test_counter_created_concurrently_is_incremented(monkeypatch) -> None:  # noqa: ANN001
+    """A counter created by a concurrent request is incremented, not inserted again."""
+    user_id = uuid.uuid4()
+    count_items = QuotaRepository._count_items  # noqa: SLF001
+
+    def count_items_racing(self, db, user_id, kind):  # noqa: ANN001, ANN202
+        # Another request of the user creates the counter between the read and the insert
+        db.add(UserQuota(user_id=user_id, kind=kind.value, used=7))
+        db.flush()
+        return count_items(self, db, user_id, kind)
+
+    monkeypatch.setattr(QuotaRepository, "_count_items", count_items_racing)
+    RequestRepository().create(user_id, REQUEST_DATA)
+
+    assert _used(user_id, QuotaKind.REQUESTS) == 8
+
+
+def test_acquire_many_grants_what_fits_in_the_quota() -> None:
+    """acquire_many grants what is left of the quota, at most."""
+    quota_repo = QuotaRepository()
+    user_id = uuid.uuid4()
+    limit = QUOTA_LIMITS[QuotaKind.REQUESTS]
+    for _ in range(3):
+        RequestRepository().create(user_id, REQUEST_DATA)
+    with get_db_session() as db:
+        db.execute(delete(UserQuota))
+
+    # Missing counter initialized from the existing items
+    assert quota_repo.acquire_many(user_id, QuotaKind.REQUESTS, 2) == 2
+    assert _used(user_id, QuotaKind.REQUESTS) == 5
+
+    assert quota_repo.acquire_many(user_id, QuotaKind.REQUESTS, limit) == limit - 5
+    assert _used(user_id, QuotaKind.REQUESTS) == limit
+    assert quota_repo.acquire_many(user_id, QuotaKind.REQUESTS, 1) == 0
+    assert _used(user_id, QuotaKind.REQUESTS) == limit
+
+
+def test_favorite_quota_counts_only_new_favorites() -> None:
+    """Favoriting a request again does not count twice."""
+    owner, fan = uuid.uuid4(), uuid.uuid4()
+    request = RequestRepository().create(owner, REQUEST_DATA)
+    favorite_repo = FavoriteRepository()
+
+    favorite, created = favorite_repo.create(fan, request.id)
+    assert created
+    _, created = favorite_repo.create(fan, request.id)
+    assert not created
+    assert _used(fan, QuotaKind.FAVORITES) == 1
+
+    favorite_repo.delete(favorite.id)
+    assert _used(fan, QuotaKind.FAVORITES) == 0
+
+
+def test_request_delete_releases_favorites_of_other_users() -> None:
+    """Deleting a request frees the quota of the users who favorited it."""
+    owner, fan = uuid.uuid4(), uuid.uuid4()
+    request = RequestRepository().create(owner, REQUEST_DATA)
+    FavoriteRepository().create(fan, request.id)
+
+    RequestRepository().delete(request.id)
+    assert _used(fan, QuotaKind.FAVORITES) == 0
+    assert _used(owner, QuotaKind.REQUESTS) == 0
@@ -0,0 +1,90 @@
+"""Per client rate limiting tests, through the Lambda entry point."""
+
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from src.handlers import main
+from src.lib.rate_limit import InMemoryBucketBackend, RateLimit, RateLimiter
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(autouse=True)
+def limiter(monkeypatch: pytest.MonkeyPatch) -> RateLimiter:
+    """Use a small limiter in the main handler."""
+    limiter = RateLimiter(
+        InMemoryBucketBackend(),
+        {"reads": RateLimit(per_s=1, burst=3), "writes": RateLimit(per_s=0.5, burst=2)},
+    )
+    monkeypatch.setattr(main, "rate_limiter", limiter)
+    return limiter
+
+
+def _call(
+    method: str,
+    path: str,
+    route_key: str,
+    user_id: uuid.UUID | None = None,
+    source_ip: str = "198.51.100.7",
+) -> dict:
+    request_context = {"http": {"method": method, "sourceIp": source_ip}}
+    if user_id is not None:
+        request_context["authorizer"] = {"jwt": {"claims": {"sub": str(user_id)}}}
+    event = {
+        "requestContext": request_context,
+        "rawPath": path,
+        "routeKey": route_key,
+        "pathParameters": {"request_id": path.rsplit("/", 1)[-1]},
+        "body": json.dumps({"title": "new title"}),
+    }
+    return main.handler(event, SimpleNamespace(aws_request_id="test"))
+
+
+def _patch(user_id: uuid.UUID) -> dict:
+    return _call(
+        "PATCH",
+        f"/v0/requests/{uuid.uuid4()}",
+        "PATCH /v0/requests/{request_id}",
+        user_id,
+    )
+
+
+def test_writes_limited_per_user(capsys: pytest.CaptureFixture) -> None:
+    """Writes beyond the burst get a 429, per user and route class."""
+    user_id = uuid.uuid4()
+    assert [_patch(user_id)["statusCode"] for _ in range(2)] == [404, 404]
+
+    capsys.readouterr()
+    response = _patch(user_id)
+    assert response["statusCode"] == 429
+    assert response["headers"]["Retry-After"] == "2"
+    assert json.loads(response["body"]) == {"error": "Too many requests"}
+    log_line = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert log_line["app_status"] == 429
+    assert log_line["app_rate_limited"] == 1
+
+    # Other users, and reads of the same user, have their own buckets
+    assert _patch(uuid.uuid4())["statusCode"] == 404
+    response = _call("GET", "/v0/favorites", "GET /v0/favorites", user_id)
+    assert response["statusCode"] == 200
+
+
+def test_anonymous_reads_limited_per_source_ip() -> None:
+    """Anonymous reads are limited by source IP, health checks never."""
+    def list_requests(source_ip: str) -> int:
+        return _call("GET", "/v0/requests", "GET /v0/requests", source_ip=source_ip)["statusCode"]
+
+    assert [list_requests("198.51.100.7") for _ in range(4)] == [200, 200, 200, 429]
+    assert list_requests("203.0.113.9") == 200
+    # Health checks are never limited
+    assert _call("GET", "/health", "GET /health", source_ip="198.51.100.7")["statusCode"] == 200
+
+
+def test_route_classes() -> None:
+    """Routes are classed as reads or writes."""
+    assert main._rate_limit_class("GET", "list_requests") == "reads"  # noqa: SLF001
+    assert main._rate_limit_class("POST", "batch_get_requests") == "reads"  # noqa: SLF001
+    assert main._rate_limit_class("POST", "create_favorite") == "writes"  # noqa: SLF001
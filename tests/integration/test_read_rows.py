@@ -0,0 +1,105 @@
+"""Core read path (as_rows) tests: rows must serialize exactly like the models."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.models.rows import FavoriteRow, RequestRow
+from src.repositories.favorite_repository import FavoriteRepository
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import LocationFilter, RequestCreate, RequestFilter, RequestType
+
+pytestmark = pytest.mark.integration
+
+COORDINATES = {
+    RequestType.BUY_AND_DELIVER: {"dropoff_latitude": 36.81, "dropoff_longitude": 10.18},
+    RequestType.PICKUP_AND_DELIVER: {
+        "pickup_latitude": 36.8,
+        "pickup_longitude": 10.17,
+        "dropoff_latitude": 36.82,
+        "dropoff_longitude": 10.19,
+    },
+    RequestType.ONLINE_SERVICE: {"meetup_latitude": 36.79, "meetup_longitude": 10.16},
+}
+
+
+def _seed(user_id: uuid.UUID) -> None:
+    repo = RequestRepository()
+    for i, (r_type, coords) in enumerate(COORDINATES.items()):
+        data = RequestCreate(
+            type=r_type,
+            title=r_type.value,
+            description="d",
+            due_date=datetime.now(UTC) + timedelta(days=i + 1) if i else None,
+            **coords,
+        )
+        repo.create(user_id, data)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"type": RequestType.PICKUP_AND_DELIVER.value},
+        {"location": LocationFilter(lat=36.8, lng=10.17, radius_km=10)},
+    ],
+)
+def test_list_of_requests_rows_match_models(filters: dict) -> None:
+    """Listed rows serialize like the models."""
+    _seed(uuid.uuid4())
+    repo = RequestRepository()
+
+    models = repo.list_of_requests(RequestFilter(**filters), limit=2)
+    rows = repo.list_of_requests(RequestFilter(**filters), limit=2, as_rows=True)
+
+    assert all(isinstance(row, RequestRow) for row in rows["requests"])
+    assert [row.to_dict() for row in rows["requests"]] == [
+        model.to_dict() for model in models["requests"]
+    ]
+    assert rows["pagination"] == models["pagination"]
+
+
+def test_user_requests_rows_match_models() -> None:
+    """A user's request rows serialize like the models."""
+    user_id = uuid.uuid4()
+    _seed(user_id)
+    repo = RequestRepository()
+
+    rows = repo.get_user_requests(user_id, as_rows=True)
+
+    assert len(rows) == len(COORDINATES)
+    assert [row.to_dict() for row in rows] == [
+        model.to_dict() for model in repo.get_user_requests(user_id)
+    ]
+
+
+def test_user_requests_are_most_recent_first() -> None:
+    """A user's requests are listed most recent first."""
+    user_id = uuid.uuid4()
+    _seed(user_id)
+    repo = RequestRepository()
+
+    for as_rows in (False, True):
+        requests = repo.get_user_requests(user_id, as_rows=as_rows)
+        assert [request.title for request in requests] == [
+            r_type.value for r_type in reversed(COORDINATES)
+        ]
+
+
+def test_favorite_rows_match_models() -> None:
+    """Favorite rows serialize like the models, with or without request."""
+    user_id = uuid.uuid4()
+    _seed(user_id)
+    for request in RequestRepository().get_user_requests(user_id):
+        FavoriteRepository().create(user_id, request.id)
+    repo = FavoriteRepository()
+
+    rows = repo.list_user_favorites(user_id, include_request=True, as_rows=True)
+
+    assert all(isinstance(row, FavoriteRow) for row in rows)
+    for include_request in (False, True):
+        assert [row.to_dict(include_request=include_request) for row in rows] == [
+            favorite.to_dict(include_request=include_request)
+            for favorite in repo.list_user_favorites(user_id, include_request=True)
+        ]
@@ -0,0 +1,85 @@
+"""GET /v0/requests/{request_id} container cache tests."""
+
+import json
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.handlers import main
+from tests.integration.conftest import StatementRecorder, create_request
+
+pytestmark = pytest.mark.integration
+
+
+def _call(
+    capsys: pytest.CaptureFixture,
+    method: str,
+    request_id: uuid.UUID,
+    user_id: uuid.UUID | None = None,
+    body: dict | None = None,
+) -> tuple[dict, dict[str, Any]]:
+    """Invoke the Lambda entry point, return the response and its log line."""
+    path = f"/v0/requests/{request_id}"
+    event = {
+        "requestContext": {
+            "http": {"method": method},
+            "authorizer": {"jwt": {"claims": {"sub": str(user_id or uuid.uuid4())}}},
+        },
+        "rawPath": path,
+        "routeKey": f"{method} /v0/requests/{{request_id}}",
+        "pathParameters": {"request_id": str(request_id)},
+        "body": json.dumps(body or {}),
+    }
+    capsys.readouterr()
+    response = main.handler(event, SimpleNamespace(aws_request_id="test"))
+    log_line = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    return response, log_line
+
+
+def test_repeated_gets_are_served_from_cache(
+    capsys: pytest.CaptureFixture,
+    recorder: StatementRecorder,
+) -> None:
+    """A request read again is served from cache, hits and misses logged."""
+    request_id = create_request(uuid.uuid4())
+    recorder.statements.clear()
+
+    first, first_log = _call(capsys, "GET", request_id)
+    second, second_log = _call(capsys, "GET", request_id)
+
+    assert first["statusCode"] == second["statusCode"] == 200
+    assert first["body"] == second["body"]
+    assert recorder.count("SELECT") == 1
+    assert first_log["app_request_cache_misses"] == 1
+    assert "app_request_cache_hits" not in first_log
+    assert second_log["app_request_cache_hits"] == 1
+
+
+def test_not_found_is_cached(capsys: pytest.CaptureFixture, recorder: StatementRecorder) -> None:
+    """Unknown requests are cached too."""
+    request_id = uuid.uuid4()
+
+    for _ in range(2):
+        response, _ = _call(capsys, "GET", request_id)
+        assert response["statusCode"] == 404
+    assert recorder.count("SELECT") == 1
+
+
+def test_update_and_delete_invalidate_cache(capsys: pytest.CaptureFixture) -> None:
+    """Updates and deletes are visible to the next get."""
+    user_id = uuid.uuid4()
+    request_id = create_request(user_id)
+    _call(capsys, "GET", request_id)
+
+    response, _ = _call(capsys, "PATCH", request_id, user_id, {"title": "new title"})
+    assert response["statusCode"] == 200
+    response, log_line = _call(capsys, "GET", request_id)
+    assert json.loads(response["body"])["request"]["title"] == "new title"
+    assert log_line["app_request_cache_misses"] == 1
+
+    response, _ = _call(capsys, "DELETE", request_id, user_id)
+    assert response["statusCode"] == 204
+    response, _ = _call(capsys, "GET", request_id)
+    assert response["statusCode"] == 404
@@ -0,0 +1,109 @@
+"""Request deletion tests: set-based deletes of the request rows and its favorites."""
+
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from src.db.session import get_db_session
+from src.handlers.requests.delete import delete_request
+from src.models.favorite import Favorite
+from src.models.quota import QuotaKind, UserQuota
+from src.models.request import OnlineServiceRequest
+from src.repositories import request_repository
+from src.repositories.favorite_repository import FavoriteRepository
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestCreate, RequestType
+from tests.integration.conftest import StatementRecorder
+
+pytestmark = pytest.mark.integration
+
+REQUEST_DATA = RequestCreate(
+    type=RequestType.ONLINE_SERVICE,
+    title="Netflix",
+    description="subscription",
+    meetup_latitude=36.8,
+    meetup_longitude=10.1,
+)
+
+
+def _count(model, criteria) -> int:  # noqa: ANN001
+    with get_db_session() as db:
+        return db.scalar(select(func.count()).select_from(model).where(criteria))
+
+
+def _used(user_id: uuid.UUID, kind: QuotaKind) -> int:
+    with get_db_session() as db:
+        return db.get(UserQuota, (user_id, kind.value)).used
+
+
+def _favorited_request(fans: list[uuid.UUID]) -> uuid.UUID:
+    request_id = RequestRepository().create(uuid.uuid4(), REQUEST_DATA).id
+    for fan in fans:
+        FavoriteRepository().create(fan, request_id)
+    return request_id
+
+
+def test_delete_is_set_based(recorder: StatementRecorder) -> None:
+    """Deleting a request takes one DELETE per table, whatever its favorites."""
+    fans = [uuid.uuid4() for _ in range(5)]
+    request_id = _favorited_request(fans)
+    recorder.statements.clear()
+
+    RequestRepository().delete(request_id)
+
+    # One DELETE per table and one quota UPDATE for all fans: no row by row cascade
+    assert recorder.count("DELETE FROM FAVORITES") == 1
+    assert recorder.count("UPDATE USER_QUOTAS") == 2  # Fans, owner
+    assert recorder.count("DELETE FROM ONLINE_SERVICE_REQUESTS") == 1
+    assert recorder.count("DELETE FROM REQUESTS") == 1
+    assert recorder.count("SELECT FAVORITES.ID") == 0
+    assert _count(Favorite, Favorite.request_id == request_id) == 0
+    assert _count(OnlineServiceRequest, OnlineServiceRequest.request_id == request_id) == 0
+    assert all(_used(fan, QuotaKind.FAVORITES) == 0 for fan in fans)
+
+
+def test_delete_chunks_favorites_beyond_transaction_limit(
+    recorder: StatementRecorder,
+    monkeypatch,  # noqa: ANN001
+) -> None:
+    """Favorites beyond a transaction's limit are deleted by chunks."""
+    monkeypatch.setattr(request_repository, "DELETE_CHUNK_SIZE", 3)
+    fans = [uuid.uuid4() for _ in range(10)]
+    request_id = _favorited_request(fans)
+    other_request_id = _favorited_request(fans[:4])
+    recorder.statements.clear()
+
+    RequestRepository().delete(request_id)
+
+    # 10 favorites: chunks of 3, 3 and 1 committed first, the last 3 with the request
+    assert recorder.count("DELETE FROM FAVORITES") == 4
+    assert _count(Favorite, Favorite.request_id == request_id) == 0
+    assert RequestRepository().get_by_id(request_id) is None
+    # Other favorites of the same users are kept, and still counted
+    assert _count(Favorite, Favorite.request_id == other_request_id) == 4
+    assert [_used(fan, QuotaKind.FAVORITES) for fan in fans] == [1] * 4 + [0] * 6
+
+
+def test_delete_handler_purges_favorites_before_its_unit_of_work(monkeypatch) -> None:  # noqa: ANN001
+    """DELETE /v0/requests/{id} should purge favorites of the owner's request only."""
+    monkeypatch.setattr(request_repository, "DELETE_CHUNK_SIZE", 3)
+    owner = uuid.uuid4()
+    request_id = RequestRepository().create(owner, REQUEST_DATA).id
+    for fan in [uuid.uuid4() for _ in range(10)]:
+        FavoriteRepository().create(fan, request_id)
+
+    def _delete(user_id: uuid.UUID) -> dict:
+        event = {
+            "requestContext": {"authorizer": {"jwt": {"claims": {"sub": str(user_id)}}}},
+            "pathParameters": {"request_id": str(request_id)},
+        }
+        return delete_request(event, None)
+
+    # Only the owner's request gets its favorites purged
+    assert _delete(uuid.uuid4())["statusCode"] == 403
+    assert _count(Favorite, Favorite.request_id == request_id) == 10
+
+    assert _delete(owner)["statusCode"] == 204
+    assert _count(Favorite, Favorite.request_id == request_id) == 0
+    assert RequestRepository().get_by_id(request_id) is None
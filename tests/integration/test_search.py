@@ -0,0 +1,204 @@
+"""Full-text search tests for GET /v0/requests?q=."""
+
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from src.db.session import get_db_session, get_engine
+from src.handlers.requests.list import list_requests
+from src.models.request import Request
+from src.models.search import RequestTerm
+from src.repositories import request_repository
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import (
+    LocationFilter,
+    RequestCreate,
+    RequestFilter,
+    RequestType,
+    RequestUpdate,
+)
+from tests.integration.conftest import StatementRecorder
+
+pytestmark = pytest.mark.integration
+
+TUNIS = (36.8065, 10.1815)
+PARIS = (48.8566, 2.3522)
+
+
+def _word() -> str:
+    """Return a term found in no other test's requests (the database is shared)."""
+    return f"w{uuid.uuid4().hex[:12]}"
+
+
+def _create(
+    title: str,
+    description: str = "",
+    r_type: RequestType = RequestType.ONLINE_SERVICE,
+    **coords: float,
+) -> uuid.UUID:
+    if r_type == RequestType.ONLINE_SERVICE:
+        coords = {"meetup_latitude": PARIS[0], "meetup_longitude": PARIS[1]}
+    data = RequestCreate(
+        type=r_type,
+        title=title,
+        description=description,
+        due_date=datetime.now(UTC) + timedelta(days=10),
+        **coords,
+    )
+    return RequestRepository().create(user_id=uuid.uuid4(), input_request=data).id
+
+
+def _search_ids(q: str, limit: int = 20, **filters: object) -> list[uuid.UUID]:
+    result = RequestRepository().list_of_requests(RequestFilter(search=q, **filters), limit)
+    return [request.id for request in result["requests"]]
+
+
+def _terms(request_id: uuid.UUID) -> dict[str, int]:
+    with get_db_session() as db:
+        query = select(RequestTerm.term, RequestTerm.weight).where(
+            RequestTerm.request_id == request_id,
+        )
+        return dict(db.execute(query).all())
+
+
+def test_requests_are_ranked_by_matched_terms_then_weight() -> None:
+    """Requests matching more terms come first, then those where they weigh more."""
+    insulin, pharmacy = _word(), _word()
+    in_description = _create("Medicine", f"need {insulin}")
+    in_title = _create(f"{insulin} please", "urgent")
+    both_terms = _create("Medicine", f"{insulin} from the {pharmacy}")
+    _create("Unrelated", "nothing to see")
+
+    # Same rank for both description matches: then by id
+    assert _search_ids(insulin) == [in_title, *sorted([in_description, both_terms])]
+    assert _search_ids(f"{insulin} {pharmacy}") == [both_terms, in_title, in_description]
+
+
+def test_search_folds_case_and_accents() -> None:
+    """Search ignores case and accents."""
+    word = _word()
+    request_id = _create(f"Médicaments {word}")
+
+    assert _search_ids(f"MEDICAMENTS {word.upper()}") == [request_id]
+
+
+def test_search_combines_with_type_and_location_filters() -> None:
+    """Search applies the type and location filters."""
+    word = _word()
+    online = _create(word)
+    near = _create(
+        word,
+        r_type=RequestType.BUY_AND_DELIVER,
+        dropoff_latitude=TUNIS[0] + 0.01,
+        dropoff_longitude=TUNIS[1],
+    )
+    _create(
+        word,
+        r_type=RequestType.BUY_AND_DELIVER,
+        dropoff_latitude=PARIS[0],
+        dropoff_longitude=PARIS[1],
+    )
+
+    assert _search_ids(word, type=RequestType.ONLINE_SERVICE) == [online]
+    location = LocationFilter(lat=TUNIS[0], lng=TUNIS[1], radius_km=10)
+    assert _search_ids(word, location=location) == [near]
+    assert _search_ids(word, location=location, limit=1) == [near]
+
+
+def test_search_pages_follow_rank_order() -> None:
+    """Search pages follow the rank order."""
+    word, other = _word(), _word()
+    ids = [_create(word) for _ in range(3)] + [_create(f"{word} {other}")]
+    ids += [_create("title", f"{word} {word}") for _ in range(2)]
+    expected = _search_ids(f"{word} {other}", limit=20)
+    assert sorted(expected) == sorted(ids)
+    assert expected[0] == ids[3]
+
+    repo = RequestRepository()
+    seen, cursor = [], None
+    while True:
+        page = repo.list_of_requests(
+            RequestFilter(search=f"{word} {other}"),
+            limit=1,
+            cursor=cursor,
+        )
+        seen.extend(request.id for request in page["requests"])
+        cursor = page["pagination"]["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+
+def test_expired_postings_do_not_count_towards_the_cap(monkeypatch) -> None:  # noqa: ANN001
+    """Postings of expired requests don't take active matches' place under the cap."""
+    monkeypatch.setattr(request_repository, "SEARCH_MAX_POSTINGS_PER_TERM", 3)
+    word = _word()
+    # Expired requests weigh more: they come first in the term's postings
+    expired = [_create(f"{word} {word}") for _ in range(6)]
+    active = [_create(word) for _ in range(4)]
+    with get_engine().begin() as conn:
+        past = datetime.now(UTC) - timedelta(days=1)
+        conn.execute(update(Request).where(Request.id.in_(expired)).values(due_date=past))
+        conn.execute(
+            update(RequestTerm).where(RequestTerm.request_id.in_(expired)).values(due_date=past),
+        )
+
+    # Capped to the best 3 active matches
+    assert len(_search_ids(word)) == 3
+    assert set(_search_ids(word)) <= set(active)
+
+
+def test_index_follows_updates_and_deletes() -> None:
+    """The index follows title updates and request deletes."""
+    before, after = _word(), _word()
+    request_id = _create(before, "description")
+    repo = RequestRepository()
+
+    repo.update(request_id, RequestUpdate(title=after))
+    assert _search_ids(before) == []
+    assert _search_ids(after) == [request_id]
+    assert _terms(request_id) == {after: 3, "description": 1}
+
+    repo.delete(request_id)
+    assert _terms(request_id) == {}
+
+
+def test_bulk_create_indexes_requests_within_row_budget(
+    recorder: StatementRecorder,
+    monkeypatch,  # noqa: ANN001
+) -> None:
+    """Bulk created requests are indexed, chunks within the row budget."""
+    monkeypatch.setattr(request_repository, "BULK_CREATE_MAX_ROWS", 10)
+    word = _word()
+    records = [
+        RequestCreate(
+            type=RequestType.ONLINE_SERVICE,
+            title=f"{word} item{i}",
+            description="",
+            meetup_latitude=PARIS[0],
+            meetup_longitude=PARIS[1],
+        )
+        for i in range(4)
+    ]
+
+    created = RequestRepository().bulk_create(uuid.uuid4(), records)
+
+    # 4 rows per request (base, subtype, 2 terms): 2 requests per chunk
+    assert recorder.count("INSERT INTO REQUEST_TERMS") == 2
+    assert sorted(_search_ids(word)) == sorted(created)
+
+
+def test_handler_search_and_nothing_searchable() -> None:
+    """GET /v0/requests?q= should search, and find nothing for stop words only."""
+    word = _word()
+    request_id = _create(word)
+
+    response = list_requests({"queryStringParameters": {"q": word}}, None)
+    assert response["statusCode"] == 200
+    assert [r["id"] for r in json.loads(response["body"])["requests"]] == [str(request_id)]
+
+    response = list_requests({"queryStringParameters": {"q": "the a"}}, None)
+    assert json.loads(response["body"])["requests"] == []
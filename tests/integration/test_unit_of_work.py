@@ -0,0 +1,64 @@
+"""Unit of work tests: one session and transaction per write handler."""
+
+import json
+import uuid
+
+import pytest
+
+from src.handlers.requests.delete import delete_request
+from src.handlers.requests.update import update_request
+from src.repositories.request_repository import RequestRepository
+from src.schemas.request import RequestType
+from tests.integration.conftest import StatementRecorder, create_request
+
+pytestmark = pytest.mark.integration
+
+
+def _event(user_id: uuid.UUID, request_id: uuid.UUID, body: dict | None = None) -> dict:
+    return {
+        "requestContext": {"authorizer": {"jwt": {"claims": {"sub": str(user_id)}}}},
+        "pathParameters": {"request_id": str(request_id)},
+        "body": json.dumps(body or {}),
+    }
+
+
+def test_update_is_one_checkout_and_one_fetch(recorder: StatementRecorder) -> None:
+    """An update takes one connection checkout and one SELECT."""
+    user_id = uuid.uuid4()
+    request_id = create_request(user_id, RequestType.BUY_AND_DELIVER)
+    recorder.statements.clear()
+    recorder.checkouts = 0
+
+    response = update_request(_event(user_id, request_id, {"title": "new title"}), None)
+
+    assert response["statusCode"] == 200
+    assert recorder.checkouts == 1
+    assert recorder.count("SELECT") == 1
+    assert recorder.count("UPDATE") == 1
+    assert RequestRepository().get_by_id(request_id).title == "new title"
+
+
+def test_delete_is_one_unit_of_work(recorder: StatementRecorder) -> None:
+    """A delete is the favorites purge check, then one unit of work."""
+    user_id = uuid.uuid4()
+    request_id = create_request(user_id, RequestType.BUY_AND_DELIVER)
+    recorder.checkouts = 0
+
+    response = delete_request(_event(user_id, request_id), None)
+
+    assert response["statusCode"] == 204
+    # Favorites purge check (one COUNT), then the unit of work deleting the request
+    assert recorder.checkouts == 2
+    assert RequestRepository().get_by_id(request_id) is None
+
+
+def test_error_response_rolls_back() -> None:
+    """Changes of a handler answering an error are rolled back."""
+    user_id = uuid.uuid4()
+    request_id = create_request(user_id, RequestType.BUY_AND_DELIVER)
+
+    # Invalid body: the handler fails after having loaded (and could have modified) the row
+    response = update_request(_event(user_id, request_id, {"title": "x" * 200}), None)
+
+    assert response["statusCode"] == 400
+    assert RequestRepository().get_by_id(request_id).title == "title"
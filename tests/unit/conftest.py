@@ -0,0 +1,17 @@
+"""Unit test helpers."""
+
+import json
+from typing import Any
+
+
+class FakeSecretsBackend:
+    """In-memory secrets backend, counting its calls."""
+
+    def __init__(self, secrets: dict[str, dict[str, Any]]) -> None:
+        """Serve the given secrets (by secret id)."""
+        self._secrets = secrets
+        self.calls = 0
+
+    def get_secret_string(self, secret_id: str) -> str:
+        self.calls += 1
+        return json.dumps(self._secrets[secret_id])
@@ -0,0 +1,69 @@
+"""In-process TTL/LRU cache tests."""
+
+import pytest
+
+from src.lib.cache import MISSING, TTLCache
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    """Clock moved forward by hand."""
+
+    def __init__(self) -> None:
+        """Start at an arbitrary time."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    """Entries expire ttl_s after being stored."""
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl_s=30, clock=clock)
+    cache.put("a", 1)
+
+    clock.now += 29
+    assert cache.get("a") == 1
+    clock.now += 1
+    assert cache.get("a") is MISSING
+    assert cache.stats() == {"size": 0, "hits": 1, "misses": 1}
+
+
+def test_negative_results_use_their_own_ttl() -> None:
+    """None values expire after negative_ttl_s."""
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl_s=30, negative_ttl_s=5, clock=clock)
+    cache.put("found", 1)
+    cache.put("not_found", None)
+
+    clock.now += 5
+    assert cache.get("not_found") is MISSING
+    assert cache.get("found") == 1
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """The least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl_s=30)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_invalidate_and_disabled_cache() -> None:
+    """Invalidated entries are gone, and a cache of size 0 keeps nothing."""
+    cache = TTLCache(maxsize=2, ttl_s=30)
+    cache.put("a", 1)
+    cache.invalidate("a")
+    cache.invalidate("unknown")
+    assert cache.get("a") is MISSING
+
+    disabled = TTLCache(maxsize=0, ttl_s=30)
+    disabled.put("a", 1)
+    assert disabled.get("a") is MISSING
@@ -0,0 +1,88 @@
+"""Response compression tests."""
+
+import base64
+import gzip
+import json
+
+import pytest
+
+from src.lib import compression
+from src.lib.compression import compress_response, negotiate
+
+pytestmark = pytest.mark.unit
+
+BIG_BODY = json.dumps({"requests": [{"title": f"request {i}"} for i in range(200)]})
+
+
+def _response(body: str = BIG_BODY) -> dict:
+    return {"statusCode": 200, "headers": {"Content-Type": "application/json"}, "body": body}
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("*", compression.SUPPORTED_ENCODINGS[0]),
+        ("gzip, deflate, br", compression.SUPPORTED_ENCODINGS[0]),
+        ("br;q=0, gzip", "gzip"),
+    ],
+)
+def test_negotiate(accept_encoding: str | None, expected: str | None) -> None:
+    """The preferred supported encoding is picked from Accept-Encoding."""
+    assert negotiate(accept_encoding) == expected
+
+
+def test_gzip_response() -> None:
+    """Big bodies are gzipped and base64 encoded, with stats."""
+    response, stats = compress_response(_response(), "gzip", min_bytes=1024)
+
+    assert response["isBase64Encoded"] is True
+    assert response["headers"]["Content-Encoding"] == "gzip"
+    assert response["headers"]["Vary"] == "Accept-Encoding"
+    assert response["headers"]["Content-Type"] == "application/json"
+    assert gzip.decompress(base64.b64decode(response["body"])).decode() == BIG_BODY
+    assert stats["body_bytes"] == len(BIG_BODY)
+    assert stats["response_bytes"] < stats["body_bytes"] / 5
+    assert stats["content_encoding"] == "gzip"
+    assert stats["compression_cpu_ms"] >= 0
+
+
+@pytest.mark.skipif(compression.brotli is None, reason="brotli not installed")
+def test_brotli_response() -> None:
+    """Brotli is preferred when accepted."""
+    response, stats = compress_response(_response(), "gzip, br", min_bytes=1024)
+
+    assert response["headers"]["Content-Encoding"] == "br"
+    body = compression.brotli.decompress(base64.b64decode(response["body"])).decode()
+    assert body == BIG_BODY
+    assert stats["content_encoding"] == "br"
+
+
+def test_small_or_not_accepted_bodies_are_sent_as_is() -> None:
+    """Small bodies, and bodies of clients not accepting compression, are sent as is."""
+    small = _response('{"request": {}}')
+    response, stats = compress_response(small, "gzip", min_bytes=1024)
+    assert response is small
+    assert stats == {"body_bytes": 15, "response_bytes": 15, "content_encoding": None}
+
+    response, stats = compress_response(_response(), None, min_bytes=1024)
+    assert response["body"] == BIG_BODY
+    assert "isBase64Encoded" not in response
+    assert response["headers"]["Vary"] == "Accept-Encoding"
+
+    not_modified = {"statusCode": 304, "headers": {"ETag": '"x"'}, "body": ""}
+    assert compress_response(not_modified, "gzip", min_bytes=0)[0]["body"] == ""
+
+
+def test_compressed_body_gets_its_own_etag() -> None:
+    """Compressed bodies get an ETag of their own."""
+    tagged = _response()
+    tagged["headers"]["ETag"] = '"abc"'
+
+    assert compress_response(tagged, "gzip", min_bytes=1024)[0]["headers"]["ETag"] == '"abc-gzip"'
+    assert compress_response(tagged, None, min_bytes=1024)[0]["headers"]["ETag"] == '"abc"'
@@ -0,0 +1,85 @@
+"""DSQL IAM token cache tests."""
+
+import time
+
+import pytest
+
+from src.db.tokens import DsqlTokenCache
+
+pytestmark = pytest.mark.unit
+
+KEY = ("cluster.dsql.eu-west-3.on.aws", "eu-west-3", "app_user")
+
+
+class FakeClock:
+    """Clock moved forward by hand."""
+
+    def __init__(self) -> None:
+        """Start at an arbitrary time."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSigner:
+    """Token generator returning a new token at each call."""
+
+    def __init__(self) -> None:
+        """Start without any call."""
+        self.calls = 0
+
+    def __call__(self, hostname: str, region: str, db_role: str, expires_in: int) -> str:
+        self.calls += 1
+        return f"{hostname}:{region}:{db_role}:{expires_in}:{self.calls}"
+
+
+def _wait_for(predicate: object, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():  # type: ignore[operator]
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_token_reused_until_refresh_window() -> None:
+    """A token is reused until its refresh window."""
+    clock, signer = FakeClock(), FakeSigner()
+    cache = DsqlTokenCache(signer, ttl_s=900, refresh_ahead_s=180, clock=clock)
+
+    token = cache.get(*KEY)
+    clock.now += 600
+    assert cache.get(*KEY) == token
+    assert signer.calls == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "refreshes": 0, "refresh_failures": 0}
+
+
+def test_token_refreshed_in_background_ahead_of_expiry() -> None:
+    """A token in its refresh window is served while refreshed in background."""
+    clock, signer = FakeClock(), FakeSigner()
+    cache = DsqlTokenCache(signer, ttl_s=900, refresh_ahead_s=180, clock=clock)
+
+    token = cache.get(*KEY)
+    clock.now += 800  # Inside refresh window: old token still served
+    assert cache.get(*KEY) == token
+    _wait_for(lambda: cache.refreshes == 1)
+    assert cache.get(*KEY) != token
+    assert signer.calls == 2
+
+
+def test_expired_token_regenerated_synchronously() -> None:
+    """A token about to expire is regenerated before being served."""
+    clock, signer = FakeClock(), FakeSigner()
+    cache = DsqlTokenCache(signer, ttl_s=900, min_validity_s=30, clock=clock)
+
+    token = cache.get(*KEY)
+    clock.now += 880
+    assert cache.get(*KEY) != token
+    assert cache.misses == 2
+
+
+def test_tokens_are_keyed_by_role() -> None:
+    """Each role has its own token."""
+    signer = FakeSigner()
+    cache = DsqlTokenCache(signer, clock=FakeClock())
+    assert cache.get(*KEY) != cache.get(KEY[0], KEY[1], "admin")
+    assert signer.calls == 2
@@ -0,0 +1,65 @@
+"""Cold start import graph tests for the central handler."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+ROOT = Path(__file__).parent.parent.parent
+
+SCRIPT = """
+import json, sys
+from types import SimpleNamespace
+from src.handlers import main
+
+before = set(sys.modules)
+event = {"requestContext": {"http": {"method": "GET"}}, "rawPath": "/health"}
+response = main.handler(event, SimpleNamespace(aws_request_id="test"))
+print(json.dumps({
+    "status": response["statusCode"],
+    "modules": sorted(set(sys.modules)),
+    "loaded": [h.__name__ for _, _, h in main.router.routes if getattr(h, "loaded", True)],
+}))
+"""
+
+
+def _run(env: dict[str, str] | None = None) -> dict:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", SCRIPT],
+        cwd=ROOT,
+        env={"PATH": "", **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_health_route_does_not_import_database_stack() -> None:
+    """GET /health should not import the database stack."""
+    output = _run()
+    assert output["status"] == 200
+    assert output["loaded"] == ["health_check"]
+    for heavy in ("sqlalchemy", "pydantic", "boto3", "src.config", "src.db.session"):
+        assert heavy not in output["modules"]
+
+
+def test_warm_routes_are_imported_at_init() -> None:
+    """WARM_ROUTES handlers are imported at init."""
+    output = _run(
+        {
+            "WARM_ROUTES": "list_requests",
+            "RUN_ENV": "local",
+            "STAGE": "test",
+            "BASE_DOMAIN": "http://localhost",
+            "DATABASE_URL": "sqlite://",
+            "MAX_USER_CREATED_REQUESTS": "20",
+            "MAX_USER_CREATED_FAVORITES": "100",
+        },
+    )
+    assert output["loaded"] == ["health_check", "list_requests"]
+    assert "src.db.session" in output["modules"]
@@ -0,0 +1,67 @@
+"""Per invocation metrics tests."""
+
+import pytest
+
+from src.lib import metrics
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics() -> None:
+    """Start each test with empty metrics."""
+    metrics.reset()
+
+
+def test_timers_sum_per_phase_and_nested_blocks_count_once(monkeypatch) -> None:  # noqa: ANN001
+    """Timings sum per phase, nested blocks of a phase counted once."""
+    ticks = iter(range(100))
+    monkeypatch.setattr(metrics.time, "perf_counter", lambda: next(ticks))  # 1s per call
+
+    @metrics.timed("db")
+    def query(depth: int) -> int:
+        return query(depth - 1) if depth else 0
+
+    with metrics.timer("validation"):
+        pass
+    query(3)
+    query(0)
+
+    # Recursive calls are timed by the outermost one only
+    assert metrics.timings() == {"validation": 1000, "db": 2000}
+
+    metrics.reset()
+    assert metrics.timings() == {}
+
+
+def test_timer_still_counts_failing_blocks() -> None:
+    """A failing block is timed, and its timer stopped."""
+    with pytest.raises(ZeroDivisionError), metrics.timer("db"):
+        1 / 0  # noqa: B018
+    with metrics.timer("db"):  # Not left running by the failure
+        pass
+    assert set(metrics.timings()) == {"db"}
+
+
+def test_emf_metadata() -> None:
+    """EMF metadata lists the metrics of each dimension set, empty ones left out."""
+    metadata = metrics.emf_metadata(
+        "nwassik",
+        {("route", "status"): ["app_duration_ms"], (): ["app_init_ms"], ("route",): []},
+        timestamp_s=1700000000.5,
+    )
+    assert metadata == {
+        "Timestamp": 1700000000500,
+        "CloudWatchMetrics": [
+            {
+                "Namespace": "nwassik",
+                "Dimensions": [["route", "status"]],
+                "Metrics": [{"Name": "app_duration_ms", "Unit": "Milliseconds"}],
+            },
+            {
+                "Namespace": "nwassik",
+                "Dimensions": [[]],
+                "Metrics": [{"Name": "app_init_ms", "Unit": "Milliseconds"}],
+            },
+        ],
+    }
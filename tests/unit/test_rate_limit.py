@@ -0,0 +1,180 @@
+"""Token bucket rate limiting tests."""
+
+import pytest
+
+from src.lib import metrics
+from src.lib.rate_limit import (
+    DynamoDBBucketBackend,
+    InMemoryBucketBackend,
+    RateLimit,
+    RateLimiter,
+)
+
+pytestmark = pytest.mark.unit
+
+LIMIT = RateLimit(per_s=2, burst=10)
+
+
+class FakeClock:
+    """Clock moved forward by hand."""
+
+    def __init__(self) -> None:
+        """Start at a realistic epoch time."""
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ConditionalCheckFailedError(Exception):
+    """Error of a DynamoDB write whose condition failed."""
+
+
+class FakeDynamoDBClient:
+    """Local stand-in of the DynamoDB client calls made by DynamoDBBucketBackend.
+
+    Conditions are evaluated as DynamoDB would for the two used by the backend. `before_update`
+    runs before each update is applied, to simulate writes from other containers.
+    """
+
+    class exceptions:  # noqa: N801 - Same attribute as boto3 clients
+        """Exceptions raised by the client."""
+
+        ConditionalCheckFailedException = ConditionalCheckFailedError
+
+    def __init__(self) -> None:
+        """Start with an empty table."""
+        self.items: dict[str, dict] = {}
+        self.calls = 0
+        self.before_update = None
+
+    def get_item(self, TableName: str, Key: dict, ConsistentRead: bool) -> dict:  # noqa: N803, ARG002, FBT001
+        self.calls += 1
+        item = self.items.get(Key["pk"]["S"])
+        return {"Item": dict(item)} if item else {}
+
+    def update_item(self, TableName: str, Key: dict, UpdateExpression: str, ConditionExpression: str, ExpressionAttributeValues: dict) -> None:  # noqa: N803, ARG002, E501
+        self.calls += 1
+        if self.before_update is not None:
+            self.before_update(self)
+        key = Key["pk"]["S"]
+        item = self.items.get(key)
+        if ConditionExpression == "attribute_not_exists(pk)":
+            ok = item is None
+        else:
+            assert ConditionExpression == "version = :read_version"
+            expected = ExpressionAttributeValues[":read_version"]
+            ok = item is not None and item["version"] == expected
+        if not ok:
+            raise ConditionalCheckFailedError
+        values = ExpressionAttributeValues
+        self.items[key] = {
+            "pk": {"S": key},
+            "tokens": values[":tokens"],
+            "updated_at": values[":now"],
+            "version": values[":version"],
+            "expires_at": values[":expires_at"],
+        }
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics() -> None:
+    """Start each test with empty metrics."""
+    metrics.reset()
+
+
+@pytest.fixture(params=["memory", "dynamodb"])
+def backend(request: pytest.FixtureRequest) -> InMemoryBucketBackend | DynamoDBBucketBackend:
+    """Run the test with each bucket backend."""
+    if request.param == "memory":
+        return InMemoryBucketBackend()
+    return DynamoDBBucketBackend("rate-limits", client=FakeDynamoDBClient())
+
+
+def test_bucket_take_and_refill(backend) -> None:  # noqa: ANN001
+    """Buckets give what they have, and refill over time up to the burst."""
+    now = 1000.0
+    assert backend.take("k", 4, LIMIT, now) == (4, 0.0)
+    assert backend.take("k", 10, LIMIT, now) == (6, 0.0)
+    taken, retry_after = backend.take("k", 1, LIMIT, now)
+    assert taken == 0
+    assert retry_after == pytest.approx(0.5)
+
+    # 1.5s later: 3 tokens refilled
+    assert backend.take("k", 10, LIMIT, now + 1.5) == (3, 0.0)
+    # Never more than the burst
+    assert backend.take("k", 100, LIMIT, now + 1000) == (10, 0.0)
+    # Buckets are independent
+    assert backend.take("other", 1, LIMIT, now) == (1, 0.0)
+
+
+def test_dynamodb_conditional_update_retried_on_concurrent_take() -> None:
+    """A take conflicting with another container's is retried."""
+    client = FakeDynamoDBClient()
+    backend = DynamoDBBucketBackend("rate-limits", client=client)
+    backend.take("k", 1, LIMIT, 1000.0)
+
+    def concurrent_take(client: FakeDynamoDBClient) -> None:
+        client.before_update = None
+        backend.take("k", 5, LIMIT, 1000.0)  # Another container, between our read and write
+
+    client.before_update = concurrent_take
+    assert backend.take("k", 10, LIMIT, 1000.0) == (4, 0.0)  # 10 - 1 - 5
+    assert client.items["k"]["tokens"]["N"] == "0.0"
+
+
+def test_dynamodb_item_expires_when_bucket_is_full_again() -> None:
+    """Bucket items expire when the bucket would be full again."""
+    client = FakeDynamoDBClient()
+    DynamoDBBucketBackend("rate-limits", client=client).take("k", 1, LIMIT, 1000.0)
+    assert client.items["k"]["expires_at"] == {"N": "1005"}
+
+
+def test_limiter_leases_tokens_locally() -> None:
+    """Tokens are leased by batches, and denials answered locally."""
+    backend, clock = InMemoryBucketBackend(), FakeClock()
+    limiter = RateLimiter(backend, {"writes": LIMIT}, lease_fraction=0.5, clock=clock)
+
+    assert [limiter.check("user", "writes") for _ in range(10)] == [None] * 10
+    # 2 leases of 5 tokens: 2 backend calls for 10 requests
+    assert backend.calls == 2
+
+    retry_after = limiter.check("user", "writes")
+    assert retry_after == pytest.approx(0.5)
+    assert backend.calls == 3
+    # Denied until the next token is due, without asking the backend again
+    clock.now += 0.25
+    assert limiter.check("user", "writes") == pytest.approx(0.25)
+    assert backend.calls == 3
+    assert metrics.snapshot()["rate_limited"] == 2
+
+    clock.now += 0.25
+    assert limiter.check("user", "writes") is None
+
+
+def test_limiter_buckets_by_client_and_route_class() -> None:
+    """Each client has a bucket per route class."""
+    limiter = RateLimiter(
+        InMemoryBucketBackend(),
+        {"reads": RateLimit(per_s=1, burst=1), "writes": RateLimit(per_s=1, burst=1)},
+        clock=FakeClock(),
+    )
+    assert limiter.check("a", "writes") is None
+    assert limiter.check("a", "writes") is not None
+    assert limiter.check("a", "reads") is None
+    assert limiter.check("b", "writes") is None
+
+
+def test_limiter_disabled_class_and_backend_failures() -> None:
+    """Unlimited classes and backend failures let requests through."""
+    class BrokenBackend:
+        def take(self, *_: object) -> tuple[int, float]:
+            raise ConnectionError
+
+    limiter = RateLimiter(BrokenBackend(), {"reads": None, "writes": LIMIT})
+    assert limiter.check("a", "reads") is None
+    assert limiter.check("a", "writes") is None  # Let through
+    assert metrics.snapshot() == {
+        "rate_limit_backend_calls": 1,
+        "rate_limit_backend_errors": 1,
+    }
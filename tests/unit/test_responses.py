@@ -0,0 +1,87 @@
+"""Response serializers tests."""
+
+import json
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, literal, select
+
+from src.lib import responses
+from src.models.favorite import Favorite  # noqa: F401 - mapped by Request.favorites
+from src.models.request import OnlineServiceRequest
+from src.schemas.request import RequestType
+
+SERIALIZERS = [responses.stdlib_dumps]
+if responses.orjson is not None:
+    SERIALIZERS.append(responses.orjson_dumps)
+
+
+def _request() -> OnlineServiceRequest:
+    return OnlineServiceRequest(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        type=RequestType.ONLINE_SERVICE,
+        title="title",
+        description=None,
+        due_date=datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=UTC),
+        created_at=datetime(2026, 4, 1, 8, 0, tzinfo=UTC),
+        meetup_latitude=36.8,
+        meetup_longitude=10.18,
+    )
+
+
+@pytest.mark.parametrize("dumps", SERIALIZERS)
+def test_models_are_encoded_like_strings(dumps) -> None:  # noqa: ANN001
+    """Models are encoded with their to_dict() values as strings."""
+    request = _request()
+
+    body = json.loads(dumps({"requests": [request]}))
+
+    assert body["requests"] == [
+        {
+            "id": str(request.id),
+            "user_id": str(request.user_id),
+            "type": "online_service",
+            "title": "title",
+            "description": None,
+            "due_date": request.due_date.isoformat(),
+            "created_at": request.created_at.isoformat(),
+            "meetup_latitude": 36.8,
+            "meetup_longitude": 10.18,
+        },
+    ]
+
+
+@pytest.mark.parametrize("dumps", SERIALIZERS)
+def test_rows_are_encoded_as_objects(dumps) -> None:  # noqa: ANN001
+    """SQLAlchemy rows are encoded as objects."""
+    row_id = uuid.uuid4()
+    with create_engine("sqlite://").connect() as conn:
+        row = conn.execute(
+            select(
+                literal(str(row_id)).label("id"),
+                literal(datetime(2026, 1, 1)).label("created_at"),  # noqa: DTZ001
+            ),
+        ).one()
+
+    assert json.loads(dumps({"row": row})) == {
+        "row": {"id": str(row_id), "created_at": "2026-01-01T00:00:00"},
+    }
+
+
+@pytest.mark.parametrize("dumps", SERIALIZERS)
+def test_unknown_types_are_rejected(dumps) -> None:  # noqa: ANN001
+    """Values of unknown types raise a TypeError."""
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_set_serializer() -> None:
+    """The serializer of response bodies can be replaced."""
+    previous = responses.dumps
+    try:
+        responses.set_serializer(lambda _: "serialized")
+        assert responses.success({"a": 1})["body"] == "serialized"
+    finally:
+        responses.set_serializer(previous)
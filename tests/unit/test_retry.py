@@ -0,0 +1,89 @@
+"""DSQL conflict classification and backoff tests."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from src.db import retry
+
+pytestmark = pytest.mark.unit
+
+
+class DriverError(Exception):
+    """DBAPI error, with the SQLSTATE of psycopg errors."""
+
+    def __init__(self, message: str, sqlstate: str | None = None) -> None:
+        """Create the error, `sqlstate` as psycopg sets it."""
+        super().__init__(message)
+        self.sqlstate = sqlstate
+
+
+def _wrapped(message: str, sqlstate: str | None = None) -> OperationalError:
+    return OperationalError("COMMIT", {}, DriverError(message, sqlstate))
+
+
+@pytest.mark.parametrize(
+    ("error", "retryable"),
+    [
+        (_wrapped("could not serialize access", "40001"), True),
+        (_wrapped("change conflicts with another transaction, please retry: (OC000)"), True),
+        (_wrapped("schema has been updated by another transaction, please retry: (OC001)"), True),
+        (_wrapped("connection refused", "08001"), False),
+        (IntegrityError("INSERT", {}, DriverError("duplicate key", "23505")), False),
+        (ValueError("OC000"), False),
+    ],
+)
+def test_is_retryable(error: Exception, retryable: bool) -> None:  # noqa: FBT001
+    """Serialization and DSQL conflicts are retryable, other errors are not."""
+    assert retry.is_retryable(error) is retryable
+
+
+def test_is_retryable_follows_cause() -> None:
+    """A conflict wrapped in another exception is retryable."""
+    error = Exception("Error listing requests")
+    error.__cause__ = _wrapped("conflict: (OC000)")
+    assert retry.is_retryable(error)
+
+
+def test_backoff_is_jittered_exponential_and_capped() -> None:
+    """Backoff delays are jittered, exponential and capped."""
+    for attempt in range(1, 10):
+        cap_ms = min(retry.MAX_DELAY_MS, retry.BASE_DELAY_MS * 2 ** (attempt - 1))
+        delays = [retry.backoff_s(attempt) for _ in range(100)]
+        assert all(0 <= delay <= cap_ms / 1000 for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_retry_deadline() -> None:
+    """The retry deadline keeps a margin before the Lambda timeout."""
+    assert retry.retry_deadline(None) is None
+    context = SimpleNamespace(get_remaining_time_in_millis=lambda: 3000)
+    deadline = retry.retry_deadline(context)
+    assert deadline is not None
+    assert retry.time.monotonic() < deadline <= retry.time.monotonic() + 2
+
+
+def test_retry_conflicts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Conflicts are retried, other errors raised at once."""
+    monkeypatch.setattr(retry.time, "sleep", lambda _: None)
+    calls = []
+    conflict, refused = _wrapped("(OC000)"), _wrapped("connection refused", "08001")
+
+    def attempt() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise conflict
+        return "done"
+
+    assert retry.retry_conflicts(attempt) == "done"
+    assert len(calls) == 3
+
+    def failing() -> None:
+        calls.append(1)
+        raise refused
+
+    calls.clear()
+    with pytest.raises(OperationalError):
+        retry.retry_conflicts(failing)
+    assert len(calls) == 1
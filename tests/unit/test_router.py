@@ -0,0 +1,114 @@
+"""Router dispatch tests."""
+
+from typing import Any
+
+import pytest
+
+from src.handlers.router import LazyHandler, Router
+
+pytestmark = pytest.mark.unit
+
+
+def _event(method: str, path: str, route_key: str | None = None) -> dict[str, Any]:
+    event = {"requestContext": {"http": {"method": method}}, "rawPath": path}
+    if route_key:
+        event["routeKey"] = route_key
+    return event
+
+
+def _handler(name: str) -> Any:
+    def fn(event: dict, context: Any) -> dict:  # noqa: ARG001
+        return {"statusCode": 200, "body": name}
+
+    return fn
+
+
+@pytest.fixture
+def router() -> Router:
+    """Router of a few routes, static and with parameters."""
+    router = Router()
+    router.add("GET", "/v0/requests", _handler("list"))
+    router.add("GET", "/v0/requests/{request_id}", _handler("get"))
+    router.add("PATCH", "/v0/requests/{request_id}", _handler("update"))
+    router.add("GET", "/v0/requests/mine", _handler("mine"))
+    router.add("GET", "/v0/users/{user_id}/requests", _handler("user_requests"))
+    return router
+
+
+def test_route_key_dispatch_does_not_parse_path(router: Router) -> None:
+    """Handlers are found by routeKey when API Gateway gives it."""
+    handler, params = router.resolve(
+        _event("GET", "/ignored", route_key="GET /v0/requests/{request_id}"),
+    )
+    assert handler(None, None)["body"] == "get"
+    assert params is None
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "expected", "expected_params"),
+    [
+        ("GET", "/v0/requests", "list", {}),
+        ("GET", "/v0/requests/", "list", {}),
+        ("GET", "/v0/requests/abc", "get", {"request_id": "abc"}),
+        ("PATCH", "/v0/requests/abc", "update", {"request_id": "abc"}),
+        ("GET", "/v0/requests/mine", "mine", {}),
+        ("GET", "/v0/users/u1/requests", "user_requests", {"user_id": "u1"}),
+    ],
+)
+def test_trie_dispatch(
+    router: Router,
+    method: str,
+    path: str,
+    expected: str,
+    expected_params: dict[str, str],
+) -> None:
+    """Paths are matched with their parameters."""
+    handler, params = router.resolve(_event(method, path, route_key="$default"))
+    assert handler(None, None)["body"] == expected
+    assert params == expected_params
+
+
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("DELETE", "/v0/requests/abc"),
+        ("GET", "/v0/requests/abc/extra"),
+        ("GET", "/v0/users//requests"),
+        ("GET", "/unknown"),
+    ],
+)
+def test_no_match(router: Router, method: str, path: str) -> None:
+    """Unknown paths and methods have no handler."""
+    assert router.resolve(_event(method, path)) is None
+
+
+def test_static_path_without_the_method_falls_back_to_parameter(router: Router) -> None:
+    """A static segment without the method falls back to the parameter route."""
+    # /v0/requests/mine only has GET: PATCH is the {request_id} route
+    handler, params = router.resolve(_event("PATCH", "/v0/requests/mine"))
+    assert handler(None, None)["body"] == "update"
+    assert params == {"request_id": "mine"}
+
+    router.add("DELETE", "/v0/users/{user_id}", _handler("delete_user"))
+    router.add("GET", "/v0/users/me", _handler("me"))
+    handler, params = router.resolve(_event("DELETE", "/v0/users/me"))
+    assert handler(None, None)["body"] == "delete_user"
+    assert params == {"user_id": "me"}
+
+
+def test_decorator_and_lazy_registration() -> None:
+    """Handlers are registered by decorator or by import path, once."""
+    router = Router()
+
+    @router.route("GET", "/health")
+    def health(event: dict, context: Any) -> dict:  # noqa: ARG001
+        return {"statusCode": 200}
+
+    router.add("GET", "/lazy", "json:dumps")
+    assert router.resolve(_event("GET", "/health"))[0] is health
+    lazy, _ = router.resolve(_event("GET", "/lazy"))
+    assert isinstance(lazy, LazyHandler)
+    assert not lazy.loaded
+
+    with pytest.raises(ValueError, match="already registered"):
+        router.add("GET", "/health", health)
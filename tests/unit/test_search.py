@@ -0,0 +1,53 @@
+"""Search index tokenization tests."""
+
+import pytest
+
+from src.lib.search import (
+    MAX_QUERY_TERMS,
+    MAX_TERM_WEIGHT,
+    TERM_MAX_LENGTH,
+    query_terms,
+    term_weights,
+    tokenize,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_tokenize_folds_case_and_accents() -> None:
+    """Terms are casefolded and stripped of accents."""
+    assert tokenize("Médicaments URGENTS: Insuline & Doliprane!") == [
+        "medicaments",
+        "urgents",
+        "insuline",
+        "doliprane",
+    ]
+
+
+def test_tokenize_drops_stop_words_and_single_characters() -> None:
+    """Stop words and single characters are not terms."""
+    terms = tokenize("Buy the insulin for a friend, à Tunis")
+    assert terms == ["buy", "insulin", "friend", "tunis"]
+    assert tokenize("") == []
+    assert tokenize(None) == []
+
+
+def test_long_words_are_truncated() -> None:
+    """Long words are truncated to the indexed length."""
+    assert tokenize("x" * 50) == ["x" * TERM_MAX_LENGTH]
+
+
+def test_title_terms_weigh_more_and_weights_are_capped() -> None:
+    """Title terms weigh more, and weights are capped."""
+    weights = term_weights("Netflix account", "Share my netflix " + "account " * 20)
+    assert weights["netflix"] == 4  # Title 3 + description 1
+    assert weights["share"] == 1
+    assert weights["account"] == MAX_TERM_WEIGHT
+
+
+def test_query_terms_are_distinct_and_limited() -> None:
+    """Query terms are distinct, and limited in number."""
+    assert query_terms("insulin Insuline insulin") == ["insulin", "insuline"]
+    words = [f"word{i}" for i in range(MAX_QUERY_TERMS + 2)]
+    assert query_terms(" ".join(words)) == words[:MAX_QUERY_TERMS]
+    assert query_terms("the of a") == []
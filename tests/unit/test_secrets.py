@@ -0,0 +1,73 @@
+"""Secret loading and caching tests, against a fake secrets backend."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.lib.secrets import SecretCache, SecretLoader
+from tests.unit.conftest import FakeSecretsBackend
+
+pytestmark = pytest.mark.unit
+
+SECRET_ID = "nwassik/test/app-db-secret"  # noqa: S105
+SECRET = {"DATABASE_URL": "sqlite:///nwassiktest.db"}
+
+
+@pytest.fixture
+def backend() -> FakeSecretsBackend:
+    """Backend serving the test secret."""
+    return FakeSecretsBackend({SECRET_ID: SECRET})
+
+
+def test_cache_avoids_backend_calls_across_loaders(
+    backend: FakeSecretsBackend,
+    tmp_path: Path,
+) -> None:
+    """Cached secrets are not fetched again after a runtime restart."""
+    # A new loader simulates a re-initialized runtime reusing the same /tmp
+    assert SecretLoader(backend, SecretCache(tmp_path)).get(SECRET_ID) == SECRET
+    assert SecretLoader(backend, SecretCache(tmp_path)).get(SECRET_ID) == SECRET
+    assert backend.calls == 1
+
+
+def test_expired_cache_is_refreshed(backend: FakeSecretsBackend, tmp_path: Path) -> None:
+    """Expired secrets are fetched again."""
+    loader = SecretLoader(backend, SecretCache(tmp_path, ttl_s=0))
+    loader.get(SECRET_ID)
+    loader.get(SECRET_ID)
+    assert backend.calls == 2
+
+
+def test_corrupted_cache_falls_back_to_backend(
+    backend: FakeSecretsBackend,
+    tmp_path: Path,
+) -> None:
+    """A corrupted cache file is ignored."""
+    cache = SecretCache(tmp_path)
+    cache.put(SECRET_ID, json.dumps(SECRET))
+    for path in tmp_path.iterdir():
+        path.write_text("not json")
+    assert SecretLoader(backend, cache).get(SECRET_ID) == SECRET
+    assert backend.calls == 1
+
+
+def test_encrypted_cache_does_not_store_plaintext(
+    backend: FakeSecretsBackend,
+    tmp_path: Path,
+) -> None:
+    """The encrypted cache keeps no secret in clear."""
+    fernet = pytest.importorskip("cryptography.fernet")
+    cache = SecretCache(tmp_path, key=fernet.Fernet.generate_key().decode())
+    SecretLoader(backend, cache).get(SECRET_ID)
+
+    (cache_file,) = tmp_path.iterdir()
+    assert "DATABASE_URL" not in cache_file.read_text()
+    assert SecretLoader(backend, cache).get(SECRET_ID) == SECRET
+    assert backend.calls == 1
+
+
+def test_prefetch_runs_in_background(backend: FakeSecretsBackend, tmp_path: Path) -> None:
+    """Secrets can be fetched in background."""
+    future = SecretLoader(backend, SecretCache(tmp_path)).prefetch(SECRET_ID)
+    assert future.result(timeout=5) == SECRET